@@ -0,0 +1,132 @@
+"""
+Benchmarks of pyvcard parsing on generated vCard 2.1, 3.0 and 4.0 corpora
+
+Usage: python benchmark.py [cards count]
+"""
+import sys
+import timeit
+import tracemalloc
+
+import pyvcard
+from pyvcard.vobject.parsing import _parse_line, _parse_line_regex
+from pyvcard.utils import _unfold_lines
+
+
+# retained bytes per parsed vCard, test_memory_budget fails when parsing takes more
+MEMORY_BUDGET = {"2.1": 3000, "3.0": 3500, "4.0": 3500}
+
+
+def generate_vcard(version: str, i: int) -> str:
+    """
+    Generates a typical vCard of specified version
+    """
+    lines = ["BEGIN:VCARD", f"VERSION:{version}"]
+    if version == "2.1":
+        lines += [
+            f"N;CHARSET=UTF-8;ENCODING=QUOTED-PRINTABLE:=D0=98=D0=B2=D0=B0=D0=BD{i};Ivan;;;",
+            f"FN:Ivan Ivanov {i}",
+            f"TEL;CELL;PREF:+7-937-123-{i:04d}",
+            f"TEL;HOME;VOICE:8 800 555 {i:04d}",
+            f"item1.EMAIL;INTERNET:ivan{i}@example.com",
+            "item1.X-ABLABEL:Personal",
+            "ORG:Example Ltd;Sales",
+            f"NOTE:Note number {i}\\, created by generator",
+        ]
+    else:
+        tel_type = "TYPE=cell,voice" if version == "3.0" else "TYPE=cell;PREF=1"
+        lines += [
+            f"N:Ivanov{i};Ivan;Petrovich;;",
+            f"FN:Ivan Ivanov {i}",
+            f"TEL;{tel_type}:+7-937-123-{i:04d}",
+            f"TEL;TYPE=home:8 800 555 {i:04d}",
+            f"item1.EMAIL;TYPE=internet,home:ivan{i}@example.com",
+            "item1.X-ABLABEL:Personal",
+            f"ADR;TYPE=work:;;Street {i}\\, office 2;City;;123456;Country",
+            "ORG:Example Ltd;Sales",
+            "BDAY:1990-01-02",
+            f"NOTE:Note number {i}\\, created by generator",
+        ]
+    lines.append("END:VCARD")
+    return "\n".join(lines)
+
+
+def generate_corpus(version: str, count: int) -> str:
+    return "\n".join(generate_vcard(version, i) for i in range(count))
+
+
+def bench_lines(version: str, corpus: str, number: int = 3):
+    lines = _unfold_lines(corpus.splitlines())
+    line_version = "4.0" if version == "4.0" else "2.1"
+
+    def run(func):
+        def inner():
+            for line in lines:
+                func(line, line_version)
+        return min(timeit.repeat(inner, number=1, repeat=number))
+
+    regex = run(_parse_line_regex)
+    tokenizer = run(_parse_line)
+    print(f"vCard {version}: {len(lines)} lines, regex {regex:.4f}s, "
+          f"tokenizer {tokenizer:.4f}s, speedup {regex / tokenizer:.2f}x")
+
+
+def bench_parse(version: str, corpus: str, number: int = 3):
+    result = min(timeit.repeat(lambda: pyvcard.parse(corpus).vcard_list(), number=1, repeat=number))
+    print(f"vCard {version}: full parsing {result:.4f}s")
+
+
+def bench_records(version: str, corpus: str, number: int = 3):
+    result = min(timeit.repeat(lambda: list(pyvcard.iter_records(corpus)), number=1, repeat=number))
+    print(f"vCard {version}: raw records {result:.4f}s")
+
+
+def bench_memory(version: str, corpus: str):
+    """
+    Measures memory retained by parsed vCards, corpus itself isn't counted
+    """
+    tracemalloc.start()
+    vcards = pyvcard.parse(corpus).vcard_list()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"vCard {version}: {size / len(vcards):.0f} bytes per card (budget {MEMORY_BUDGET[version]})")
+    return size / len(vcards)
+
+
+def bench_table(version: str, corpus: str):
+    """
+    Measures memory retained by columnar table of the same vCards
+    """
+    tracemalloc.start()
+    table = pyvcard.vCardTable.from_source(corpus)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"vCard {version}: {size / len(table):.0f} bytes per card in vCardTable")
+    return size / len(table)
+
+
+def bench_convert(version: str, corpus: str, number: int = 3):
+    """
+    Compares jCard converting without output cache and with warm cache
+    """
+    vcards = pyvcard.parse(corpus).vcards()
+    cache = pyvcard.vCardOutputCache()
+    pyvcard.convert(vcards, cache).json().result()
+    for title, value in [("uncached", None), ("cached", cache)]:
+        result = min(timeit.repeat(lambda: pyvcard.convert(vcards, value).json().result(), number=1, repeat=number))
+        print(f"vCard {version}: jCard converting ({title}) {result:.4f}s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for version in ["2.1", "3.0", "4.0"]:
+        corpus = generate_corpus(version, count)
+        bench_lines(version, corpus)
+        bench_parse(version, corpus)
+        bench_records(version, corpus)
+        bench_memory(version, corpus)
+        bench_table(version, corpus)
+        bench_convert(version, corpus)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from .vobject import vCardSet, is_vcard, is_vcard_property, parse_name_property, \
-    parse_from, builder, parse, convert, validate_vcards
+    parse_from, builder, parse, convert, validate_vcards, parse_parallel, vcf_splits, \
+    vCardLazyList, vCardTable, iter_records, vCardRecord, aparse, vCardErrorRecord
 from .vcard import migrate_vcard, openfile
 from .utils import (
     escape, unescape, str_to_quoted,
@@ -10,6 +11,7 @@ from .enums import (
     VERSION, SOURCES
 )
 from .indexer import vCardIndexer
+from .cache import vCardOutputCache
 from .exceptions import (
     LibraryNotFoundError, vCardFormatError, vCardValidationError,
 )
@@ -21,9 +23,11 @@ __all__ = [
     "vCardSet", "is_vcard",
     "is_vcard_property", "parse_name_property",
     "parse_from", "builder", "parse", "convert", "validate_vcards",
+    "parse_parallel", "vcf_splits", "vCardLazyList", "vCardTable",
+    "iter_records", "vCardRecord", "aparse", "vCardErrorRecord",
     "migrate_vcard", "openfile", "escape", "unescape", "strinteger",
     "str_to_quoted", "split_noescape", "base64_encode", "base64_decode",
     "quopri_warning", "quoted_to_str", "VERSION",
-    "SOURCES", "vCardIndexer", "LibraryNotFoundError", "vCardFormatError",
+    "SOURCES", "vCardIndexer", "vCardOutputCache", "LibraryNotFoundError", "vCardFormatError",
     "vCardValidationError"
 ]
\ No newline at end of file
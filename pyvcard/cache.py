@@ -0,0 +1,106 @@
+import sys
+from collections import OrderedDict
+from typing import Callable, Dict
+
+
+class vCardOutputCache:
+    """
+    Bounded LRU cache of serialized vCards. Every card is stored as separate fragment
+    per output format and is found by content fingerprint, so converters that received
+    this cache render only new or changed vCards and concatenate other fragments.
+    Cache size is limited in bytes, least recently used fragments are evicted first.
+    Changed vCards get new fingerprint, so their old fragments aren't used
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Constructs a new instance.
+
+        :param      max_bytes:  The maximum size of stored fragments in bytes
+        :type       max_bytes:  int
+        """
+        if max_bytes < 0:
+            raise ValueError("Cache size can't be negative")
+        self._max_bytes = max_bytes
+        self._fragments = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._fragments)
+
+    def __bool__(self):
+        return True
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the size of stored fragments in bytes
+        """
+        return self._size
+
+    def get(self, vcard: "vCard", format: str, render: Callable[["vCard"], str]) -> str:
+        """
+        Returns the fragment of vCard in format, fragment is rendered and stored on cache miss
+
+        :param      vcard:   The vCard
+        :type       vcard:   vCard
+        :param      format:  The name of output format
+        :type       format:  str
+        :param      render:  The function, that renders fragment of vCard
+        :type       render:  callable
+
+        :returns:   fragment of output
+        :rtype:     str
+        """
+        # vCards with kept original text have the same fingerprint, but other vcf output
+        raw = any(entry._raw is not None for entry in vcard)
+        key = (format, raw, vcard.fingerprint)
+        fragment = self._fragments.get(key)
+        if fragment is not None:
+            self._fragments.move_to_end(key)
+            self.hits += 1
+            return fragment
+        self.misses += 1
+        fragment = render(vcard)
+        size = sys.getsizeof(fragment)
+        if size <= self._max_bytes:
+            self._fragments[key] = fragment
+            self._size += size
+            while self._size > self._max_bytes:
+                _, evicted = self._fragments.popitem(last=False)
+                self._size -= sys.getsizeof(evicted)
+                self.evictions += 1
+        return fragment
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the statistics of cache
+
+        :returns:   hits, misses, evictions, count of fragments, size and maximum size in bytes
+        :rtype:     dict
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "fragments": len(self._fragments),
+            "size": self._size,
+            "max_bytes": self._max_bytes
+        }
+
+    def clear(self) -> None:
+        """
+        Removes all fragments and resets statistics
+        """
+        self._fragments.clear()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
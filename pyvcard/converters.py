@@ -1,5 +1,6 @@
 from .utils import str_to_quoted
 from .validator import validate_uri
+from .datatypes import determine_type
 
 import base64
 
@@ -31,40 +32,6 @@ def encoding_convert(source, params: str) -> str:
             return source
 
 
-def determine_type(prop) -> str:
-    """
-    Determines the type by property.
-
-    :param      prop:  The property
-    :type       prop:  _vCard property
-    """
-    if "VALUE" in prop.params:
-        return prop.params["VALUE"]
-    else:
-        if prop.name in [
-            "N", "FN", "XML", "KIND", "GENDER",
-            "TZ", "TITLE", "ROLE", "TEL", "EMAIL",
-            "ORG", "CATEGORIES", "NOTES", "PRODID",
-            "EXPERTISE", "HOBBY", "UID", "INTEREST", "ORG-DIRECTORY",
-            "BIRTHPLACE", "DEATHPLACE", "VERSION", "ADR", "NICKNAME", "NOTE"
-        ]:
-            return "text"
-        elif prop.name in [
-            "SOURCE", "IMPP", "GEO", "LOGO",
-            "MEMBER", "RELATED", "SOUND",
-            "URI", "FBURL", "CALADRURI", "CALURI", "URL"
-        ]:
-            return "uri"
-        elif prop.name in ["BDAY", "ANNIVERSARY", "DEATHDATE"]:
-            return "date-and-or-time"
-        elif prop.name in ["LANG"]:
-            return "language-tag"
-        elif prop.name in ["REV"]:
-            return "timestamp"
-        else:
-            return "unknown"
-
-
 def recognize_param_type(param: str, value: str) -> str:
     """
     Recognize parameter type by name (uses RFC6350)
@@ -1,12 +1,48 @@
 import pyvcard
 from .regex import *
 from .exceptions import vCardValidationError
+from typing import Optional
 from urllib.parse import urlparse
 import datetime
-import pyvcard.converters
+
+_PROPERTY_TYPES = {}
+for _name in [
+    "N", "FN", "XML", "KIND", "GENDER",
+    "TZ", "TITLE", "ROLE", "TEL", "EMAIL",
+    "ORG", "CATEGORIES", "NOTES", "PRODID",
+    "EXPERTISE", "HOBBY", "UID", "INTEREST", "ORG-DIRECTORY",
+    "BIRTHPLACE", "DEATHPLACE", "VERSION", "ADR", "NICKNAME", "NOTE"
+]:
+    _PROPERTY_TYPES[_name] = "text"
+for _name in [
+    "SOURCE", "IMPP", "GEO", "LOGO",
+    "MEMBER", "RELATED", "SOUND",
+    "URI", "FBURL", "CALADRURI", "CALURI", "URL"
+]:
+    _PROPERTY_TYPES[_name] = "uri"
+for _name in ["BDAY", "ANNIVERSARY", "DEATHDATE"]:
+    _PROPERTY_TYPES[_name] = "date-and-or-time"
+_PROPERTY_TYPES["LANG"] = "language-tag"
+_PROPERTY_TYPES["REV"] = "timestamp"
+
+
+def determine_type(prop) -> str:
+    """
+    Determines the type by property.
+
+    :param      prop:  The property
+    :type       prop:  _vCard property
+    """
+    params = prop.params
+    if "VALUE" in params:
+        return params["VALUE"]
+    return _PROPERTY_TYPES.get(prop.name, "unknown")
 
 
 class vCardType:
+    # patterns which matches are accepted by constructor instead of value parsing
+    _PATTERNS = ()
+
     @property
     def rawvalue(self):
         return self._value
@@ -24,24 +60,21 @@ def define_type(property) -> vCardType:
     """
     if property.name == "N":
         return NameType(property.values)
-    else:
-        type_val = pyvcard.converters.determine_type(property)
-        if type_val == "uri":
-            return URI(property.values)
-        elif type_val == "text":
-            return Text(property.values)
-        elif type_val == "language-tag":
-            return LanguageTag(property.values)
-        elif type_val == "timestamp" or type_val == "date-and-or-time":
-            return DateTime(property.values)
-        elif type_val == "date":
-            return Date(property.values)
-        elif type_val == "time":
-            return Time(property.values)
-        elif type_val == "utc-offset":
-            return UTCOffset(property.values)
-        else:
-            return UnknownType(property.values)
+    return _TYPES.get(determine_type(property), UnknownType)(property.values)
+
+
+def _parsed_type(property, parsed) -> Optional[vCardType]:
+    """
+    Utility method. Don't recommend for use in outer code
+    Makes typed value of property from match of validator,
+    returns None if match doesn't fit the type of value
+    """
+    if parsed is None or property._name == "N" or "ENCODING" in property._params:
+        return None
+    cls = _TYPES.get(determine_type(property), UnknownType)
+    if parsed.re not in cls._PATTERNS:
+        return None
+    return cls(property._values, parsed)
 
 
 class UnknownType(vCardType):
@@ -108,9 +141,12 @@ class vCardTimeType(vCardType):
 
 
 class Date(vCardTimeType):
-    def __init__(self, value):
+    _PATTERNS = (VALID_DATE,)
+
+    def __init__(self, value, parsed=None):
         self._value = value
-        parsed = re.match(VALID_DATE, value[0])
+        if parsed is None:
+            parsed = VALID_DATE.match(value[0])
         if not parsed:
             raise vCardValidationError("This value isn't date")
         if parsed.group(1) != "-" or parsed.group(1) is not None:
@@ -151,9 +187,12 @@ class Date(vCardTimeType):
 
 
 class Time(vCardTimeType):
-    def __init__(self, value):
+    _PATTERNS = (VALID_TIME,)
+
+    def __init__(self, value, parsed=None):
         self._value = value
-        parsed = re.match(VALID_TIME, value[0])
+        if parsed is None:
+            parsed = VALID_TIME.match(value[0])
         if not parsed:
             raise vCardValidationError("This value isn't time")
         if parsed.group(1) != "-" or parsed.group(1) is not None:
@@ -191,18 +230,26 @@ class Time(vCardTimeType):
 
 
 class DateTime(vCardTimeType):
-    def __init__(self, value):
+    _PATTERNS = (VALID_DATETIME, VALID_TIMESTAMP)
+
+    def __init__(self, value, parsed=None):
         self._value = value
-        parsed = re.match(VALID_DATETIME, value[0])
+        if parsed is None:
+            parsed = VALID_DATETIME.match(value[0])
         if not parsed:
             raise vCardValidationError("This value isn't datetime")
-        self._year = None if parsed.group(2) == "-" or parsed.group(3) is None else int(parsed.group(2))
-        self._month = None if parsed.group(3) == "-" or parsed.group(3) is None else int(parsed.group(3))
-        self._day = None if parsed.group(4) == "-" or parsed.group(4) is None else int(parsed.group(4))
-        self._h = 0 if parsed.group(6) == "-" or parsed.group(6) is None else int(parsed.group(6))
-        self._m = 0 if parsed.group(7) == "-" or parsed.group(7) is None else int(parsed.group(7))
-        self._s = 0 if parsed.group(8) == "-" or parsed.group(8) is None else int(parsed.group(8))
-        self._offset = None if parsed.group(10) == "-" or parsed.group(10) is None else parsed.group(10)
+        if parsed.re is VALID_TIMESTAMP:
+            # timestamp hasn't optional groups of whole date and time
+            groups = (None, None) + parsed.groups()[:3] + (None,) + parsed.groups()[3:]
+        else:
+            groups = (None,) + parsed.groups()
+        self._year = None if groups[2] == "-" or groups[3] is None else int(groups[2])
+        self._month = None if groups[3] == "-" or groups[3] is None else int(groups[3])
+        self._day = None if groups[4] == "-" or groups[4] is None else int(groups[4])
+        self._h = 0 if groups[6] == "-" or groups[6] is None else int(groups[6])
+        self._m = 0 if groups[7] == "-" or groups[7] is None else int(groups[7])
+        self._s = 0 if groups[8] == "-" or groups[8] is None else int(groups[8])
+        self._offset = None if groups[10] == "-" or groups[10] is None else groups[10]
 
     @property
     def seconds(self):
@@ -245,9 +292,12 @@ class DateTime(vCardTimeType):
 
 
 class UTCOffset(vCardType):
-    def __init__(self, value):
+    _PATTERNS = (VALID_TZ,)
+
+    def __init__(self, value, parsed=None):
         self._value = value
-        parsed = re.match(VALID_TZ, value[0])
+        if parsed is None:
+            parsed = VALID_TZ.match(value[0])
         if not parsed:
             self._hour = 0
             self._sign = 1
@@ -276,3 +326,15 @@ class UTCOffset(vCardType):
 class LanguageTag(vCardType):
     def __init__(self, value):
         self._value = value
+
+
+_TYPES = {
+    "uri": URI,
+    "text": Text,
+    "language-tag": LanguageTag,
+    "timestamp": DateTime,
+    "date-and-or-time": DateTime,
+    "date": Date,
+    "time": Time,
+    "utc-offset": UTCOffset
+}
@@ -22,8 +22,17 @@ class vCardIndexer:
         self._indexparams = index_params
         self._phones = {}
         self._params = {}
-        self._vcards = []
+        # vCards are stored by id, because their hash is changed by mutation
+        self._vcards = {}
         self._groups = {}
+        # reverse map: id of vCard -> (vCard, list of (index, key) pairs)
+        self._keys = {}
+
+    def __setstate__(self, state):
+        # ids of vCards are changed after unpickling
+        self.__dict__.update(state)
+        self._vcards = {id(vcard): vcard for vcard in self._vcards.values()}
+        self._keys = {id(vcard): (vcard, pairs) for vcard, pairs in self._keys.values()}
 
     def __bool__(self):
         return True
@@ -49,7 +58,51 @@ class vCardIndexer:
         """
         if pyvcard.vobject.is_vcard(vcard):
             vcard._indexer = self
-            self._vcards.append(vcard)
+            self._vcards[id(vcard)] = vcard
+
+    def _card_keys(self, vcard: "vCard") -> list:
+        """
+        Utility method. Don't recommend for use in outer code
+        Returns list of (index, key) pairs of vCard in reverse map
+        """
+        item = self._keys.get(id(vcard))
+        if item is None:
+            item = self._keys[id(vcard)] = (vcard, [])
+        return item[1]
+
+    def _postings(self, entry: "vCard_entry", create: bool = True):
+        """
+        Utility method. Don't recommend for use in outer code
+        Returns list of (index, key) pairs of property, index is dict of posting lists
+        """
+        result = []
+        if entry.group is not None:
+            result.append((self._groups, entry.group))
+        if entry.name == "FN":
+            result.append((self._names, entry.values[0]))
+        elif entry.name == "N":
+            result.append((self._names, ";".join(entry.values)))
+        elif entry.name == "TEL":
+            result.append((self._phones, entry.values[0]))
+            result.append((self._phones, strinteger(entry.values[0])))
+        elif self._indexparams:
+            if entry.name not in self._params:
+                if not create:
+                    return result
+                self._params[entry.name] = {}
+
+            def type_convert(x):
+                if isinstance(x, bytes):
+                    return base64_encode(x)
+                else:
+                    return str(x)
+            if entry._pending_decode and entry._params["ENCODING"].upper() in ["B", "BASE64"]:
+                # never decoded base64 values are indexed as read, so they aren't decoded at parsing
+                ivalues = entry._values
+            else:
+                ivalues = list(map(type_convert, entry.values))
+            result.append((self._params[entry.name], ";".join(ivalues)))
+        return result
 
     def index(self, entry: "vCard_entry", vcard: "vCard"):
         """
@@ -62,46 +115,146 @@ class vCardIndexer:
         :type       vcard:  vCard
         """
         if isinstance(entry, pyvcard.vobject.vCard_entry):
-            if entry.group is not None:
-                if entry.group not in self._groups:
-                    self._groups[entry.group] = []
-                self._groups[entry.group].append(vcard)
-            if entry.name == "FN":
-                if entry.values[0] not in self._names:
-                    self._names[entry.values[0]] = []
-                self._names[entry.values[0]].append(vcard)
-            elif entry.name == "N":
-                name = ";".join(entry.values)
-                if name not in self._names:
-                    self._names[name] = []
-                self._names[name].append(vcard)
-            elif entry.name == "TEL":
-                if entry.values[0] not in self._phones:
-                    self._phones[entry.values[0]] = []
-                self._phones[entry.values[0]].append(vcard)
-                if strinteger(entry.values[0]) not in self._phones:
-                    self._phones[strinteger(entry.values[0])] = []
-                self._phones[strinteger(entry.values[0])].append(vcard)
-            elif self._indexparams:
-                if entry.name not in self._params:
-                    self._params[entry.name] = {}
-
-                def type_convert(x):
-                    if isinstance(x, bytes):
-                        return base64_encode(x)
-                    else:
-                        return str(x)
-                ivalues = list(map(type_convert, entry.values))
-                if ";".join(ivalues) not in self._params[entry.name]:
-                    self._params[entry.name][";".join(ivalues)] = []
-                self._params[entry.name][";".join(ivalues)].append(vcard)
+            pairs = self._postings(entry)
+            if not pairs:
+                return
+            keys = self._card_keys(vcard)
+            for index, key in pairs:
+                if key not in index:
+                    index[key] = []
+                index[key].append(vcard)
+                keys.append((index, key))
+
+    def _discard(self, index: dict, key, vcard: "vCard"):
+        """
+        Utility method. Don't recommend for use in outer code
+        Removes the last occurrence of vCard from posting list, vCards are compared by identity
+        """
+        postings = index.get(key)
+        if postings is None:
+            return
+        for i in range(len(postings) - 1, -1, -1):
+            if postings[i] is vcard:
+                del postings[i]
+                break
+
+    def _unindex_entry(self, entry: "vCard_entry", vcard: "vCard"):
+        """
+        Utility method. Don't recommend for use in outer code
+        Removes vCard from posting lists of property and its keys from reverse map
+        """
+        item = self._keys.get(id(vcard))
+        if item is None:
+            return
+        keys = item[1]
+        for index, key in self._postings(entry, False):
+            for i in range(len(keys) - 1, -1, -1):
+                if keys[i][0] is index and keys[i][1] == key:
+                    del keys[i]
+                    self._discard(index, key, vcard)
+                    break
+        if not keys:
+            del self._keys[id(vcard)]
+
+    def unindex(self, vcard: "vCard"):
+        """
+        Removes vCard from indexer, only posting lists of this vCard are touched.
+        Empty keys are kept until compact() is called
+
+        :param      vcard:  The target vCard
+        :type       vcard:  vCard
+        """
+        item = self._keys.pop(id(vcard), None)
+        if item is not None:
+            for index, key in item[1]:
+                self._discard(index, key, vcard)
+        self._vcards.pop(id(vcard), None)
+        if vcard._indexer is self:
+            vcard._indexer = None
+
+    def reindex(self, vcard: "vCard"):
+        """
+        Indexes all properties of vCard again (for example, after changes by vCard_entry methods)
+        and sets indexer as main for vCard
+
+        :param      vcard:  The target vCard
+        :type       vcard:  vCard
+        """
+        self.unindex(vcard)
+        for entry in vcard:
+            self.index(entry, vcard)
+        self.setindex(vcard)
+
+    def compact(self) -> int:
+        """
+        Removes keys without vCards (they remain after unindex and changes of vCards)
+
+        :returns:   count of removed keys
+        :rtype:     int
+        """
+        removed = 0
+        indexes = [self._names, self._phones, self._groups] + list(self._params.values())
+        for index in indexes:
+            empty = [key for key, postings in index.items() if not postings]
+            for key in empty:
+                del index[key]
+            removed += len(empty)
+        for name in [name for name, index in self._params.items() if not index]:
+            del self._params[name]
+        return removed
+
+    def apply_change(self, vcard: "vCard", change: "vCardChange"):
+        """
+        Updates indexes after change of vCard, only posting lists of changed property are touched.
+        vCard calls it for its indexer
+
+        :param      vcard:   The changed vCard
+        :type       vcard:   vCard
+        :param      change:  The change from vCard journal
+        :type       change:  vCardChange
+        """
+        if change.old is not None:
+            self._unindex_entry(change.old, vcard)
+        if change.new is not None:
+            self.index(change.new, vcard)
+
+    def merge(self, other: "vCardIndexer"):
+        """
+        Merges indexes of other indexer to this indexer (for example, created in other process).
+        All vCards indexed by other indexer will use this indexer
+
+        :param      other:  The other indexer
+        :type       other:  vCardIndexer
+        """
+        translate = {id(other._names): self._names, id(other._phones): self._phones,
+                     id(other._groups): self._groups}
+        for index, other_index in [(self._names, other._names),
+                                   (self._phones, other._phones),
+                                   (self._groups, other._groups)]:
+            for key in other_index:
+                if key not in index:
+                    index[key] = []
+                index[key] += other_index[key]
+        for name in other._params:
+            if name not in self._params:
+                self._params[name] = {}
+            translate[id(other._params[name])] = self._params[name]
+            for key in other._params[name]:
+                if key not in self._params[name]:
+                    self._params[name][key] = []
+                self._params[name][key] += other._params[name][key]
+        for vcard, pairs in other._keys.values():
+            self._card_keys(vcard).extend((translate[id(index)], key) for index, key in pairs)
+        for vcard in other._vcards.values():
+            vcard._indexer = self
+            self._vcards[id(vcard)] = vcard
 
     def __len__(self):
         return len(self._names) + len(self._phones)
 
     @property
     def vcards(self):
-        return tuple(self._vcards)
+        return tuple(self._vcards.values())
 
     def difference_search(self, type: str, value: str,
                           diff_func, k: int = 85,
@@ -87,7 +87,7 @@ class _VersionMigrator:
             if prop.name in ["VERSION", "AGENT", "LABEL", "NAME", "MAILER", "CLASS"]:
                 continue
             values = prop.values
-            params = prop.params
+            params = dict(prop.params)
             for param in prop.params:
                 if param == "ENCODING":
                     if prop.name in ["LOGO", "PHOTO"]:
@@ -170,7 +170,7 @@ class _VersionMigrator:
             ]:
                 continue
             values = []
-            params = prop.params
+            params = dict(prop.params)
             regex = r"data:{}\/(\w+);base64,"
             for value in prop.values:
                 if prop.name in ["LOGO", "PHOTO"]:
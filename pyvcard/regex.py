@@ -17,6 +17,7 @@ SAFE_CHAR = re.compile(r"[{}!\x23-\x39\x3C-\x7E\w]".format(WSP.pattern))
 VALUE_CHAR = re.compile(r"[{}{}\w]".format(WSP.pattern, VCHAR.pattern))
 PARAM_VALUE = re.compile(r"({}+|\"{}+\")".format(SAFE_CHAR.pattern, QSAFE_CHAR.pattern))
 PARAM_NAME = NAME
+PARAM_VALUE_CHARS = re.compile(r"{}*".format(SAFE_CHAR.pattern))
 VALUE = re.compile(r"({}*)".format(VALUE_CHAR.pattern))
 PARAM = re.compile(r"{}\={}*\,*{}*".format(PARAM_NAME.pattern, PARAM_VALUE.pattern, PARAM_VALUE.pattern))
 PARAM_21 = re.compile(r"{}\=?({}*\,?{}?)*".format(PARAM_NAME.pattern, PARAM_VALUE.pattern, PARAM_VALUE.pattern))
@@ -12,11 +12,14 @@ class csv_Converter(AbstractConverter):
     This class describes a vCard object to CSV converter.
     """
 
-    def __init__(self, obj):
-        if pyvcard.vobject.is_vcard(obj) or isinstance(obj, pyvcard.vobject.vCardSet):
+    FIELDS = ["Formatted name", "Name", "Tel. Number", "vCard"]
+
+    def __init__(self, obj, cache=None):
+        if pyvcard.vobject.is_vcard(obj) or isinstance(obj, pyvcard.vobject.containers._vCardContainerMixin):
             self._object = obj
         else:
-            raise ValueError("Required vCardSet or vCard type")
+            raise ValueError("Required vCard or container of vCards")
+        self._cache = cache
 
     def write_vcard(self, vcard, writer, permanent=False):
         """
@@ -44,15 +47,49 @@ class csv_Converter(AbstractConverter):
                 row["Tel. Number"] = ""
         writer.writerow(row)
 
-    def result(self):
+    def _fragment(self, vcard, permanent=False):
         """
-        Returns string machine-readable result of converting
+        Utility method. Don't recommend for use in outer code
+        Renders CSV row of single vCard
         """
         strio = io.StringIO()
-        names = ["Formatted name", "Name", "Tel. Number", "vCard"]
+        names = self.FIELDS if not permanent else self.FIELDS[:-1]
         writer = DictWriter(strio, delimiter=',', lineterminator='\n', fieldnames=names)
+        self.write_vcard(vcard, writer, permanent)
+        return strio.getvalue()
+
+    def _cached_result(self, permanent):
+        """
+        Utility method. Don't recommend for use in outer code
+        Concatenates header and CSV rows taken from output cache
+        """
+        if permanent:
+            format = "csv-permanent"
+            header = ",".join(self.FIELDS[:-1]) + "\n"
+        else:
+            format = "csv"
+            header = ",".join(self.FIELDS) + "\n"
+
+        def render(vcard):
+            return self._fragment(vcard, permanent)
+
+        if not pyvcard.vobject.is_vcard(self._object):
+            rows = [self._cache.get(vcard, format, render) for vcard in self._object]
+        else:
+            rows = [self._cache.get(self._object, format, render)]
+        return header + "".join(rows)
+
+    def result(self):
+        """
+        Returns string machine-readable result of converting.
+        Rows of vCards are taken from output cache, if it was set
+        """
+        if self._cache is not None:
+            return self._cached_result(False)
+        strio = io.StringIO()
+        writer = DictWriter(strio, delimiter=',', lineterminator='\n', fieldnames=self.FIELDS)
         writer.writeheader()
-        if isinstance(self._object, pyvcard.vobject.vCardSet):
+        if not pyvcard.vobject.is_vcard(self._object):
             for vcard in self._object:
                 self.write_vcard(vcard, writer)
         else:
@@ -66,11 +103,12 @@ class csv_Converter(AbstractConverter):
         Returns string result of converting.
         This operation is irreversible. Parsing this csv will be impossible
         """
+        if self._cache is not None:
+            return self._cached_result(True)
         strio = io.StringIO()
-        names = ["Formatted name", "Name", "Tel. Number"]
-        writer = DictWriter(strio, delimiter=',', lineterminator='\n', fieldnames=names)
+        writer = DictWriter(strio, delimiter=',', lineterminator='\n', fieldnames=self.FIELDS[:-1])
         writer.writeheader()
-        if isinstance(self._object, pyvcard.vobject.vCardSet):
+        if not pyvcard.vobject.is_vcard(self._object):
             for vcard in self._object:
                 self.write_vcard(vcard, writer, True)
         else:
@@ -85,9 +123,11 @@ class csv_Parser(AbstractParser):
     This class describes a CSV to vCard object parser
     """
 
-    def __init__(self, csv, indexer=None):
+    def __init__(self, csv, indexer=None, properties=None, exclude=None):
         self.csv = csv
         self.indexer = indexer
+        self.properties = properties
+        self.exclude = exclude
 
     def vcards(self):
         """
@@ -102,4 +142,4 @@ class csv_Parser(AbstractParser):
         s = ''
         for data in raw:
             s += data["vCard"] + "\n"
-        return pyvcard.parse(s, self.indexer).vcards()
\ No newline at end of file
+        return pyvcard.parse(s, self.indexer, properties=self.properties, exclude=self.exclude).vcards()
\ No newline at end of file
@@ -60,10 +60,12 @@ class hCard_Parser(AbstractParser):
     This class describes an HTML to vCard object parser (hCard)
     """
 
-    def __init__(self, html, indexer):
+    def __init__(self, html, indexer, properties=None, exclude=None):
         _check_lib()
         self._parser = bs(html, "html.parser")
         self.indexer = indexer
+        self.properties = properties
+        self.exclude = exclude
 
     def _is_type_and_value(self, tag):
         value = []
@@ -215,13 +217,15 @@ class hCard_Parser(AbstractParser):
         :rtype:     vCardSet
         """
         self.vcards = []
-        self.builder = pyvcard.builder(indexer=self.indexer, version="3.0")
+        self.builder = pyvcard.builder(indexer=self.indexer, version="3.0",
+                                       properties=self.properties, exclude=self.exclude)
         self._hcards = self._parser.select(".vcard")
         for hcard in self._hcards:
             for tag in SUPPORTED_TAGS:
                 self._preprocess_tag(tag, hcard)
             self.vcards.append(self.builder.build())
-            self.builder = pyvcard.builder(indexer=self.indexer, version="3.0")
+            self.builder = pyvcard.builder(indexer=self.indexer, version="3.0",
+                                           properties=self.properties, exclude=self.exclude)
         return pyvcard.vobject.vCardSet(self.vcards)
 
 
@@ -13,8 +13,10 @@ class jCard_Parser(AbstractParser):
     class jCard_ValidationError(Exception):
         pass
 
-    def __init__(self, source, indexer=None):
+    def __init__(self, source, indexer=None, properties=None, exclude=None):
         self.indexer = indexer
+        self.properties = properties
+        self.exclude = exclude
         if isinstance(source, str):
             self.source = json.loads(source)
         else:
@@ -24,7 +26,7 @@ class jCard_Parser(AbstractParser):
         """
         Utility method
         """
-        factory = pyvcard.vobject.builder(self.indexer)
+        factory = pyvcard.vobject.builder(self.indexer, properties=self.properties, exclude=self.exclude)
         if vcard[0] != "vcard":
             raise self.jCard_ValidationError("jCard isn't match to standard")
         for data in vcard[1:][0]:
@@ -75,8 +77,9 @@ class jCard_Converter(AbstractConverter):
     jCard (RFC 7095)
     """
 
-    def __init__(self, obj):
+    def __init__(self, obj, cache=None):
         self._object = obj
+        self._cache = cache
 
     def write_vcard(self, vcard, array):
         """
@@ -119,12 +122,29 @@ class jCard_Converter(AbstractConverter):
             properties.append(current)
         array.append(jcard)
 
+    def _fragment(self, vcard):
+        """
+        Utility method. Don't recommend for use in outer code
+        Renders JSON of single vCard
+        """
+        vcards = []
+        self.write_vcard(vcard, vcards)
+        return json.dumps(vcards[0], ensure_ascii=False)
+
     def result(self, return_obj=False, *args, **kwargs):
         """
-        Returns string result of converting
+        Returns string result of converting.
+        JSON of vCards is taken from output cache, if it was set and
+        json.dumps arguments weren't passed
         """
+        if self._cache is not None and not return_obj and not args and not kwargs:
+            if not pyvcard.vobject.is_vcard(self._object):
+                fragments = [self._cache.get(vcard, "jcard", self._fragment) for vcard in self._object]
+            else:
+                fragments = [self._cache.get(self._object, "jcard", self._fragment)]
+            return "[" + ", ".join(fragments) + "]"
         vcards = []
-        if isinstance(self._object, pyvcard.vobject.vCardSet):
+        if not pyvcard.vobject.is_vcard(self._object):
             for vcard in self._object:
                 self.write_vcard(vcard, vcards)
         else:
@@ -16,8 +16,9 @@ class xCard_Converter(AbstractConverter):
     """
     HEADER = "urn:ietf:params:xml:ns:vcard-4.0"
 
-    def __init__(self, obj):
+    def __init__(self, obj, cache=None):
         self._object = obj
+        self._cache = cache
 
     def parse_vcard(self, vcardobj, root):
         """
@@ -104,17 +105,33 @@ class xCard_Converter(AbstractConverter):
                 value = et.SubElement(attr, value_param)
                 value.text = encoding_convert(unescape(vcard_attr.values[0]), vcard_attr.params)
 
+    def _fragment(self, vcardobj):
+        """
+        Utility method. Don't recommend for use in outer code
+        Renders XML element of single vCard
+        """
+        vcard = self.parse_vcard(vcardobj, et.Element("vcards"))
+        return et.tostring(vcard, "unicode")
+
     def result(self):
         """
-        Returns string result of converting
+        Returns string result of converting.
+        XML elements of vCards are taken from output cache, if it was set
         """
-        root = et.Element("vcards", xmlns=self.HEADER)
-        if hasattr(self.object, "__iter__"):
-            for vcardobj in self.object:
-                self.parse_vcard(vcardobj, root)
+        if self._cache is not None:
+            if not pyvcard.vobject.is_vcard(self.object):
+                fragments = [self._cache.get(vcardobj, "xcard", self._fragment) for vcardobj in self.object]
+            else:
+                fragments = [self._cache.get(self.object, "xcard", self._fragment)]
+            rough_string = f'<vcards xmlns="{self.HEADER}">' + "".join(fragments) + "</vcards>"
         else:
-            self.parse_vcard(self.object, root)
-        rough_string = et.tostring(root, 'utf-8')
+            root = et.Element("vcards", xmlns=self.HEADER)
+            if not pyvcard.vobject.is_vcard(self.object):
+                for vcardobj in self.object:
+                    self.parse_vcard(vcardobj, root)
+            else:
+                self.parse_vcard(self.object, root)
+            rough_string = et.tostring(root, 'utf-8')
         reparsed = minidom.parseString(rough_string)
         return reparsed.toprettyxml()
 
@@ -125,9 +142,11 @@ class xCard_Parser(AbstractParser):
     xCard (RFC 6351)
     """
 
-    def __init__(self, xcard, indexer=None):
+    def __init__(self, xcard, indexer=None, properties=None, exclude=None):
         self.xcard = xcard
         self.indexer = indexer
+        self.properties = properties
+        self.exclude = exclude
 
     def _is_supported_tag(self, name):
         return name.lower() in [
@@ -151,7 +170,8 @@ class xCard_Parser(AbstractParser):
         root = et.fromstring(get_string(self.xcard))
         for node in root:
             if self._tag_name(node) == "vcard":
-                factory = pyvcard.vobject.builder(self.indexer)
+                factory = pyvcard.vobject.builder(self.indexer, properties=self.properties,
+                                                  exclude=self.exclude)
                 if self._tag_name(node[0]) == "group":
                     group = node[0].attrib["name"]
                     node = node[0]
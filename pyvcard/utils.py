@@ -1,13 +1,18 @@
 import base64
+import io
 import quopri
 import re
 import warnings
-from typing import Union, List, Optional
+from typing import Iterable, Union, List, Optional
 
 from .exceptions import vCardFormatError
 
 quopri_warning = True
 
+_BYTE_LINE = re.compile(rb"[^\n]*\n|[^\n]+")
+_JUNK_SYMBOLS = re.compile("[\u202a-\u202e\x80-\xa0\u2000-\u200f\u2011]")
+_NOESCAPE_SEPARATORS = {}
+
 
 def escape(string: str, characters: List[str] = (";", ",", "\n", "\r", ":")) -> str:
     """
@@ -44,6 +49,8 @@ def unescape(string: Optional[Union[str, bytes]], only_double: bool = False) ->
     """
     if string is None or isinstance(string, bytes):
         return string
+    if "\\" not in string:
+        return string
     if only_double:
         r = re.sub(r'\\\\n', r'\\n', string)
         r = re.sub(r'\\\\r', r'\\r', r)
@@ -149,31 +156,142 @@ def _unfold_lines(strings):
     Utility method. Don't recommend for use in outer code
     Unfolds the lines in list
     """
-    lines = []
+    return list(_iter_unfold_lines(strings))
+
+
+class _LinePosition:
+    """
+    Utility class. Don't recommend for use in outer code
+    Position of the last unfolded line: number of the first physical line,
+    its byte offset and the byte offset after it (offsets are None for text sources).
+    If keep_raw is True, original folded text of line is kept in raw
+    (physical lines joined by "\n")
+    """
+
+    def __init__(self, keep_raw: bool = False):
+        self.line = 0
+        self.offset = None
+        self.end = None
+        self.keep_raw = keep_raw
+        self.raw = None
+
+
+def _iter_unfold_lines(strings, position: _LinePosition = None):
+    """
+    Utility method. Don't recommend for use in outer code
+    Unfolds the lines lazily, only the current unfolded line is kept in memory
+    """
+    line = None
+    number = 0
+    start = 0
+    keep_raw = position is not None and position.keep_raw
+    raw = []
     for string in strings:
-        string.replace("\n", "")
+        number += 1
+        if string.endswith("\n"):
+            string = string[:-1]
         if string == "":
             continue
+        if keep_raw:
+            raw.append(string.rstrip("\r"))
         if string.startswith(" ") or string.startswith("\t"):
-            if len(lines) == 0:
+            if line is None:
                 raise vCardFormatError("Illegal whitespace at string 1")
-            lines[-1] += string[1:].lstrip()
+            line += string[1:].lstrip()
         elif string.startswith("="):
-            if len(lines) == 0:
+            if line is None:
                 raise vCardFormatError("Illegal whitespace at string 1")
-            lines[-1] += string[1:]
+            line += string[1:]
         elif string.startswith(";"):
-            if len(lines) == 0:
+            if line is None:
                 raise vCardFormatError("Illegal whitespace at string 1")
-            lines[-1] += string
-        elif len(lines) > 0:
-            if lines[-1].endswith("=0D=0A="):
-                lines[-1] += string
-            else:
-                lines.append(string)
+            line += string
+        elif line is not None and line.endswith("=0D=0A="):
+            line += string
         else:
-            lines.append(string)
-    return lines
+            if line is not None:
+                if position is not None:
+                    position.line = start
+                    if keep_raw:
+                        position.raw = "\n".join(raw[:-1])
+                        del raw[:-1]
+                yield line
+            line = string
+            start = number
+    if line is not None:
+        if position is not None:
+            position.line = start
+            if keep_raw:
+                position.raw = "\n".join(raw)
+        yield line
+
+
+def _iter_byte_lines(buffer):
+    """
+    Utility method. Don't recommend for use in outer code
+    Splits bytes-like object to lines lazily
+    """
+    for match in _BYTE_LINE.finditer(buffer):
+        yield match.group()
+
+
+def _iter_unfold_byte_lines(strings, position: _LinePosition = None):
+    """
+    Utility method. Don't recommend for use in outer code
+    Unfolds the raw lines (bytes) lazily, only the current unfolded line is kept in memory
+    """
+    line = None
+    number = 0
+    offset = 0
+    start = 0
+    start_offset = 0
+    keep_raw = position is not None and position.keep_raw
+    raw = []
+    for string in strings:
+        number += 1
+        length = len(string)
+        string = string.rstrip(b"\r\n")
+        if string == b"":
+            offset += length
+            continue
+        if keep_raw:
+            raw.append(string)
+        if string.startswith(b" ") or string.startswith(b"\t"):
+            if line is None:
+                raise vCardFormatError("Illegal whitespace at string 1")
+            line += string[1:].lstrip()
+        elif string.startswith(b"="):
+            if line is None:
+                raise vCardFormatError("Illegal whitespace at string 1")
+            line += string[1:]
+        elif string.startswith(b";"):
+            if line is None:
+                raise vCardFormatError("Illegal whitespace at string 1")
+            line += string
+        elif line is not None and line.endswith(b"=0D=0A="):
+            line += string
+        else:
+            if line is not None:
+                if position is not None:
+                    position.line = start
+                    position.offset = start_offset
+                    position.end = offset
+                    if keep_raw:
+                        position.raw = b"\n".join(raw[:-1])
+                        del raw[:-1]
+                yield line
+            line = string
+            start = number
+            start_offset = offset
+        offset += length
+    if line is not None:
+        if position is not None:
+            position.line = start
+            position.offset = start_offset
+            position.end = offset
+            if keep_raw:
+                position.raw = b"\n".join(raw)
+        yield line
 
 
 def split_noescape(str: str, sep: str) -> List[str]:
@@ -189,7 +307,10 @@ def split_noescape(str: str, sep: str) -> List[str]:
     :returns:   splitted string
     :rtype:     list
     """
-    return re.split(r'(?<!\\)' + sep, str)
+    pattern = _NOESCAPE_SEPARATORS.get(sep)
+    if pattern is None:
+        pattern = _NOESCAPE_SEPARATORS[sep] = re.compile(r'(?<!\\)' + sep)
+    return pattern.split(str)
 
 
 def _fold_line(string: str, expect_quopri=False) -> str:
@@ -227,5 +348,29 @@ def _fold_line(string: str, expect_quopri=False) -> str:
         return string
 
 
+def _write_lines(fp, lines: Iterable[str], encoding: str = "utf-8",
+                 newline: str = "\r\n", batch: int = 1024) -> None:
+    """
+    Utility method. Don't recommend for use in outer code
+    Writes lines with line endings to text or binary file, lines are written by batches
+    """
+    binary = not isinstance(fp, io.TextIOBase)
+    buf = []
+    for line in lines:
+        buf.append(line)
+        if len(buf) >= batch:
+            buf.append("")
+            chunk = newline.join(buf)
+            fp.write(chunk.encode(encoding) if binary else chunk)
+            buf = []
+    if buf:
+        buf.append("")
+        chunk = newline.join(buf)
+        fp.write(chunk.encode(encoding) if binary else chunk)
+
+
 def remove_junk_symbols(string: str) -> str:
-    return re.sub("[\u202a-\u202e\x80-\xa0\u2000-\u200f\u2011]", " ", string.rstrip())
\ No newline at end of file
+    string = string.rstrip()
+    if string.isascii():
+        return string
+    return _JUNK_SYMBOLS.sub(" ", string)
\ No newline at end of file
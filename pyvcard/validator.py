@@ -1,12 +1,13 @@
-from typing import List, Optional
+from typing import Callable, Collection, List, Optional
 
 from .exceptions import *
 from .regex import *
+from .datatypes import _parsed_type
 from urllib.parse import urlparse
 import re
 import warnings
 
-TYPE_TEL = [
+TYPE_TEL = frozenset([
     'home',
     'msg',
     'work',
@@ -25,8 +26,8 @@ TYPE_TEL = [
     'textphone',
     'main',
     'other'
-]
-LABEL_TEL = [
+])
+LABEL_TEL = frozenset([
     'dom',
     'intl',
     'postal',
@@ -36,8 +37,8 @@ LABEL_TEL = [
     'pref',
     'other',
     'customtype'
-]
-TYPE_EMAIL = [
+])
+TYPE_EMAIL = frozenset([
     'internet',
     'x400',
     'pref',
@@ -51,13 +52,28 @@ TYPE_EMAIL = [
     'school',
     'other',
     'customtype'
-]
+])
 VALUE_TYPE = [
     "text", "uri", "date",
     "time", "date-and-or-time", "datetime",
     "timestamp", "boolean", "integer", "float",
     "utc-offset", "language-tag"
 ]
+TYPE_RELATED = frozenset([
+    "contact", "acquaintance", "friend", "met",
+    "co-worker", "colleague", "co-resident",
+    "neighbor", "child", "parent",
+    "sibling", "spouse", "kin", "muse",
+    "crush", "date", "sweetheart", "me",
+    "agent", "emergency"
+])
+LEVEL_PARAM = frozenset([
+    "beginner", "average", "expert",
+    "high", "medium", "low"
+])
+VERSIONS = ("2.1", "3.0", "4.0")
+PID_PARAM = re.compile(r"(\d+)(.(\d+))*(,(\d+)(.(\d+)))*")
+SORT_AS_PARAM = re.compile(r"\"(\w+)(,(\w+))*\"")
 
 
 def validate_bool_wrapper(validator_func, *args, **kwargs):
@@ -148,14 +164,15 @@ def validate_group(group: str,
     :param      property:  The property
     :type       property:  vCard_entry or None
     """
-    if not re.match(GROUP, group):
+    if not GROUP.match(group):
         raise vCardValidationError("Group isn't match", property)
 
 
 def validate_datetime(value: str, subtype: str,
-                      property: Optional["vCard_entry"] = None) -> None:
+                      property: Optional["vCard_entry"] = None) -> Optional[re.Match]:
     """
-    Validates date and time values. Property if not None will be saved in exception
+    Validates date and time values. Property if not None will be saved in exception.
+    Returns the match of value
 
     :param      value:     The value
     :type       value:     str
@@ -181,15 +198,17 @@ def validate_datetime(value: str, subtype: str,
         if value.startswith("T"):
             pattern = VALID_TIME
         else:
-            if not any([
-                re.match(VALID_TIMESTAMP, value), re.match(VALID_DATE, value),
-                re.match(VALID_TIME, value), re.match(VALID_DATETIME, value)
-            ]):
+            parsed = VALID_TIMESTAMP.match(value) or VALID_DATE.match(value) or \
+                VALID_TIME.match(value) or VALID_DATETIME.match(value)
+            if not parsed:
                 raise vCardValidationError("Date or time isn't match", property)
+            return parsed
     else:
         raise ValueError("Incorrect subtype", property)
-    if not re.match(pattern, value):
+    parsed = pattern.match(value)
+    if not parsed:
         raise vCardValidationError(f"{subtype} isn't match", property)
+    return parsed
 
 
 def validate_float(value: str, property: Optional["vCard_entry"] = None) -> None:
@@ -201,7 +220,7 @@ def validate_float(value: str, property: Optional["vCard_entry"] = None) -> None
     :param      property:  The property
     :type       property:  vCard_entry or None
     """
-    if re.match(VALID_FLOAT, value) is None:
+    if VALID_FLOAT.match(value) is None:
         raise vCardValidationError("Float isn't match", property)
 
 
@@ -214,21 +233,24 @@ def validate_integer(value, property=None):
     :param      property:  The property
     :type       property:  vCard_entry or None
     """
-    if re.match(VALID_INTEGER, value) is None:
+    if VALID_INTEGER.match(value) is None:
         raise vCardValidationError("Integer isn't match", property)
 
 
-def validate_utc_offset(value: str, property: Optional["vCard_entry"] = None):
+def validate_utc_offset(value: str, property: Optional["vCard_entry"] = None) -> re.Match:
     """
-    Validates text type value. Property if not None will be saved in exception
+    Validates UTC offset type value. Property if not None will be saved in exception.
+    Returns the match of value
 
     :param      value:     The value
     :type       value:     str
     :param      property:  The property
     :type       property:  _vCard_entry or None
     """
-    if re.match(VALID_TZ, value) is None:
+    parsed = VALID_TZ.match(value)
+    if parsed is None:
         raise vCardValidationError("UTC offset isn't match", property)
+    return parsed
 
 
 def validate_language_tag(value: str, property: Optional["vCard_entry"] = None):
@@ -240,7 +262,7 @@ def validate_language_tag(value: str, property: Optional["vCard_entry"] = None):
     :param      property:  The property
     :type       property:  _vCard_entry or None
     """
-    if re.match(LANG_TAG, value) is None:
+    if LANG_TAG.match(value) is None:
         raise vCardValidationError("Language Tag isn't match", property)
 
 
@@ -271,6 +293,43 @@ def validate_uri(value, property: Optional["vCard_entry"] = None) -> None:
         raise vCardValidationError("URI is incorrect", property)
 
 
+def _validate_pref(value: Optional[str], property: "vCard_entry") -> None:
+    if value is not None:
+        i = int(value)
+        if i > 100 or i < 1:
+            raise vCardValidationError("PREF param has invalid parameter", property)
+
+
+def _validate_pid(value: str, property: "vCard_entry") -> None:
+    if not PID_PARAM.match(value):
+        raise vCardValidationError("PID param has invalid parameter", property)
+
+
+def _validate_sort_as(value: str, property: "vCard_entry") -> None:
+    if not SORT_AS_PARAM.match(value):
+        raise vCardValidationError("SORT-AS param has invalid parameter", property)
+
+
+def _validate_level(value: str, property: "vCard_entry") -> None:
+    if value not in LEVEL_PARAM:
+        raise vCardValidationError("Incorrect LEVEL parameter value", property)
+
+
+def _validate_index(value: str, property: "vCard_entry") -> None:
+    if not VALID_INTEGER.match(value):
+        raise vCardValidationError("INDEX param has invalid parameter", property)
+
+
+PARAM_RULES = {
+    "LANGUAGE": validate_language_tag,
+    "PREF": _validate_pref,
+    "PID": _validate_pid,
+    "SORT-AS": _validate_sort_as,
+    "LEVEL": _validate_level,
+    "INDEX": _validate_index,
+}
+
+
 def validate_parameter(property: "vCard_entry"):
     """
     Validates parameters in property
@@ -278,29 +337,273 @@ def validate_parameter(property: "vCard_entry"):
     :param      property:  The property
     :type       property:  vCard_entry
     """
-    for param in property.params:
-        if param == "LANGUAGE":
-            validate_language_tag(property.params[param], property)
-        elif param == "PREF" and property.params[param] is not None:
-            i = int(property.params[param])
-            if i > 100 or i < 1:
-                raise vCardValidationError("PREF param has invalid parameter", property)
-        elif param == "PID":
-            if not re.match(r"(\d+)(.(\d+))*(,(\d+)(.(\d+)))*", property.params[param]):
-                raise vCardValidationError("PID param has invalid parameter", property)
-        elif param == "SORT-AS":
-            if not re.match(r"\"(\w+)(,(\w+))*\"", property.params[param]):
-                raise vCardValidationError("SORT-AS param has invalid parameter", property)
-        elif param == "LEVEL":
-            values = [
-                "beginner", "average", "expert",
-                "high", "medium", "low"
-            ]
-            if property.params[param] not in values:
-                raise vCardValidationError("Incorrect LEVEL parameter value", property)
-        elif param == "INDEX":
-            if not re.match(VALID_INTEGER, property.params[param]):
-                raise vCardValidationError("SORT-AS param has invalid parameter", property)
+    params = property._params
+    for param in params:
+        rule = PARAM_RULES.get(param)
+        if rule is not None:
+            rule(params[param], property)
+
+
+class ValidationRule:
+    """
+    Precompiled validation rule of property. Checks are applied in order:
+    VALUE parameter, count of values, additional checks, TYPE parameter
+    """
+
+    def __init__(self, count: Optional[tuple] = None,
+                 value_types: Optional[Collection[str]] = None,
+                 text_allowed: bool = True,
+                 types: Optional[Collection[str]] = None,
+                 checks: Collection[Callable[["vCard_entry", str], None]] = ()):
+        """
+        Constructs a new instance.
+
+        :param      count:         Bounds of values count (min, max) or None
+        :type       count:         tuple or None
+        :param      value_types:   Allowed values of VALUE parameter, None disables the check
+        :type       value_types:   collection of str or None
+        :param      text_allowed:  If 'text' in VALUE parameter will be allowed
+        :type       text_allowed:  boolean
+        :param      types:         Allowed values of TYPE parameter (in lower case), None disables the check.
+                                   Values with 'x-' prefix are always allowed
+        :type       types:         collection of str or None
+        :param      checks:        Functions (property, version) raising vCardValidationError
+        :type       checks:        collection of callables
+        """
+        self.count = count
+        self.value_types = frozenset(value_types) if value_types is not None else None
+        self.text_allowed = text_allowed
+        self.types = frozenset(types) if types is not None else None
+        self.checks = tuple(checks)
+
+    def validate(self, property: "vCard_entry", version: str) -> None:
+        """
+        Validates the property
+
+        :param      property:  The property
+        :type       property:  vCard_entry
+        :param      version:   The version
+        :type       version:   str
+        """
+        params = property._params
+        if self.value_types is not None and "VALUE" in params:
+            val = params["VALUE"].lower()
+            if val not in self.value_types and val != "text" and self.text_allowed:
+                raise vCardValidationError(f"VALUE param {val} is not found", property)
+        if self.count is not None:
+            count = len(property._values)
+            if count < self.count[0] or count > self.count[1]:
+                raise vCardValidationError(f"Values of property {property.name} count must be in "
+                                           f"[{self.count[0]}, {self.count[1]}]", property)
+        for check in self.checks:
+            check(property, version)
+        if self.types is not None and "TYPE" in params:
+            for subvalue in params["TYPE"].split(","):
+                lower = subvalue.lower()
+                if lower not in self.types and not lower.startswith("x-"):
+                    raise vCardValidationError(f"{property.name} type {subvalue} is unknown", property)
+
+
+RULES = {}
+
+
+def register_rule(name: str, rule: ValidationRule, versions: Optional[Collection[str]] = None) -> None:
+    """
+    Registers validation rule of property, replaces the previous rule.
+    Can be used for X- properties
+
+    :param      name:      The property name
+    :type       name:      str
+    :param      rule:      The rule
+    :type       rule:      ValidationRule
+    :param      versions:  Versions of vCard where rule is used, None - all versions
+    :type       versions:  collection of str or None
+    """
+    name = name.upper()
+    if versions is None:
+        RULES[(name, None)] = rule
+        versions = VERSIONS
+    for version in versions:
+        RULES[(name, version)] = rule
+
+
+def unregister_rule(name: str, versions: Optional[Collection[str]] = None) -> None:
+    """
+    Removes validation rule of property
+
+    :param      name:      The property name
+    :type       name:      str
+    :param      versions:  Versions of vCard, None - all versions
+    :type       versions:  collection of str or None
+    """
+    name = name.upper()
+    if versions is None:
+        RULES.pop((name, None), None)
+        versions = VERSIONS
+    for version in versions:
+        RULES.pop((name, version), None)
+
+
+def get_rule(name: str, version: str) -> Optional[ValidationRule]:
+    """
+    Returns validation rule of property
+
+    :param      name:     The property name
+    :type       name:     str
+    :param      version:  The version
+    :type       version:  str
+    """
+    rule = RULES.get((name, version))
+    if rule is None:
+        rule = RULES.get((name, None))
+    return rule
+
+
+def _first_value(validator) -> Callable[["vCard_entry", str], None]:
+    def check(property, version):
+        validator(property._values[0], property)
+    return check
+
+
+def _typed_first_value(validator) -> Callable[["vCard_entry", str], None]:
+    # match of validator is reused as typed value, so value isn't parsed again
+    def check(property, version):
+        property._typedvalue = _parsed_type(property, validator(property._values[0], property))
+    return check
+
+
+def _validate_timestamp(value, property):
+    return validate_datetime(value, "timestamp", property)
+
+
+def _value_param(value_type: str, validator) -> Callable[["vCard_entry", str], None]:
+    def check(property, version):
+        if property._params.get("VALUE", "").lower() == value_type:
+            validator(property._values[0], property)
+    return check
+
+
+def _warning(message: str) -> Callable[["vCard_entry", str], None]:
+    def check(property, version):
+        warnings.warn(message)
+    return check
+
+
+def _validate_profile(property, version):
+    if property._values[0].lower() != "vcard":
+        raise vCardValidationError("Profile must be with VALUE=VCARD", property)
+
+
+def _validate_encoding(property, version):
+    if "ENCODING" in property._params:
+        if property._params["ENCODING"].lower() not in ["b", "base64"]:
+            raise vCardValidationError("Encoding must be 'b' or 'base64' ", property)
+
+
+def _validate_date(property, version):
+    if "VALUE" in property._params:
+        if property._params["VALUE"] != "text":
+            parsed = validate_datetime(property._values[0], "datetime", property)
+            property._typedvalue = _parsed_type(property, parsed)
+
+
+def _validate_gender(property, version):
+    if len(property._values[0]) != 1:
+        raise vCardValidationError("Incorrect gender tag", property)
+
+
+def _validate_tz(property, version):
+    if "VALUE" in property._params:
+        if property._params["VALUE"].lower() == "utc-offset":
+            parsed = validate_utc_offset(property._values[0], property)
+            property._typedvalue = _parsed_type(property, parsed)
+        elif property._params["VALUE"].lower() == "uri":
+            validate_uri(property._values[0], property)
+    else:
+        parsed = validate_utc_offset(property._values[0], property)
+        property._typedvalue = _parsed_type(property, parsed)
+
+
+def _validate_floats(property, version):
+    for i in property._values:
+        validate_float(i, property)
+
+
+def _validate_related_type(property, version):
+    if "TYPE" in property._params:
+        if property._params["TYPE"].lower() not in TYPE_RELATED:
+            raise vCardValidationError("TYPE is incorrect", property)
+
+
+def _validate_text(property, version):
+    if len(property._values) > 1 and version == "2.1":
+        # semicolons aren't escaped in vCard 2.1 text
+        property._values = (";".join(property._values),)
+    else:
+        values_count_required(property, 0, 1)
+
+
+def _validate_clientpidmap(property, version):
+    validate_integer(property._values[0], property)
+    validate_uri(property._values[1], property)
+
+
+_TEXT = ValidationRule(count=(1, 1), value_types=[])
+_URI_ONLY = ValidationRule(count=(1, 1), value_types=["uri"], text_allowed=False,
+                           checks=[_first_value(validate_uri)])
+_URI_VALUE = ValidationRule(count=(1, 1), checks=[_value_param("uri", validate_uri)])
+
+register_rule("PROFILE", ValidationRule(checks=[_validate_profile]))
+register_rule("SOURCE", ValidationRule(count=(1, 1)))
+register_rule("SOURCE", _URI_ONLY, ["4.0"])
+for name in ["KIND", "XML", "FN", "NICKNAME", "MAILER", "TITLE", "ROLE", "CATEGORIES"]:
+    register_rule(name, _TEXT)
+for name in ["HOBBY", "EXPERTISE", "INTEREST", "ORG-DIRECTORY"]:
+    register_rule(name, _TEXT)
+register_rule("N", ValidationRule(count=(5, 5), value_types=[]))
+for name in ["PHOTO", "LOGO"]:
+    register_rule(name, ValidationRule(count=(1, 1), value_types=["uri"], text_allowed=False,
+                                       checks=[_validate_encoding]))
+for name in ["BDAY", "ANNIVERSARY", "DEATHDATE"]:
+    register_rule(name, ValidationRule(count=(1, 1), value_types=["date-and-or-time", "date", "date-time"],
+                                       checks=[_validate_date]))
+register_rule("GENDER", ValidationRule(count=(1, 2), checks=[_validate_gender]))
+register_rule("ADR", ValidationRule(count=(7, 7), value_types=[]))
+register_rule("ADR", ValidationRule(count=(7, 7), value_types=[], types=LABEL_TEL), ["3.0"])
+register_rule("LABEL", ValidationRule(count=(1, 1), types=LABEL_TEL))
+register_rule("LABEL", ValidationRule(count=(1, 1), types=LABEL_TEL,
+                                      checks=[_warning("LABEL property is not defined in VCard 4.0")]), ["4.0"])
+register_rule("TEL", ValidationRule(value_types=["uri"], types=TYPE_TEL))
+register_rule("EMAIL", ValidationRule(count=(1, 1), value_types=[], types=TYPE_EMAIL))
+register_rule("IMPP", ValidationRule(count=(1, 1), value_types=["uri"], checks=[_first_value(validate_uri)]))
+register_rule("LANG", ValidationRule(count=(1, 1), value_types=["language-tag"], text_allowed=False,
+                                     checks=[_first_value(validate_language_tag)]))
+register_rule("TZ", ValidationRule(count=(1, 1), checks=[_typed_first_value(validate_utc_offset)]))
+register_rule("TZ", ValidationRule(count=(1, 1), value_types=["utc-offset", "uri"], checks=[_validate_tz]), ["4.0"])
+register_rule("GEO", ValidationRule(count=(2, 2), checks=[_validate_floats]))
+register_rule("GEO", _URI_ONLY, ["4.0"])
+register_rule("ORG", ValidationRule(value_types=[]))
+register_rule("MEMBER", _URI_ONLY)
+register_rule("RELATED", ValidationRule(count=(1, 1), value_types=["uri"], checks=[
+    _warning("Related property allowed only in version 4.0"),
+    _value_param("uri", validate_uri), _validate_related_type
+]))
+register_rule("RELATED", ValidationRule(count=(1, 1), value_types=["uri"], checks=[
+    _value_param("uri", validate_uri), _validate_related_type
+]), ["4.0"])
+for name in ["NOTE", "PRODID"]:
+    register_rule(name, ValidationRule(value_types=[], checks=[_validate_text]))
+register_rule("REV", ValidationRule(count=(1, 1), checks=[_typed_first_value(_validate_timestamp)]))
+register_rule("REV", ValidationRule(count=(1, 1), value_types=["timestamp"], text_allowed=False,
+                                    checks=[_typed_first_value(_validate_timestamp)]), ["4.0"])
+register_rule("SOUND", ValidationRule(count=(1, 1), value_types=["uri"], text_allowed=False,
+                                      checks=[_value_param("uri", validate_uri)]))
+for name in ["UID", "KEY", "AGENT"]:
+    register_rule(name, _URI_VALUE)
+register_rule("CLIENTPIDMAP", ValidationRule(count=(2, 2), checks=[_validate_clientpidmap]))
+for name in ["BIRTHDATE", "DEATHPLACE"]:
+    register_rule(name, ValidationRule(count=(1, 1), value_types=["uri"],
+                                       checks=[_value_param("uri", validate_uri)]))
 
 
 def validate_property(property: "vCard_entry", version: str):
@@ -313,193 +616,9 @@ def validate_property(property: "vCard_entry", version: str):
     :type       version:   str
     """
     validate_parameter(property)
-    if property.name == "PROFILE":
-        if property.values[0].lower() != "vcard":
-            raise vCardValidationError(property, "Profile must be with VALUE=VCARD")
-    elif property.name == "SOURCE":
-        if version == "4.0":
-            validate_value_parameter(property, ["uri"], text_allowed=False)
-            validate_uri(property.values[0], property)
-        values_count_required(property, 1, 1)
-    elif property.name == "KIND":
-        validate_value_parameter(property, [])
-        values_count_required(property, 1, 1)
-    elif property.name == "XML":
-        validate_value_parameter(property, [])
-        values_count_required(property, 1, 1)
-    elif property.name == "FN":
-        validate_value_parameter(property, [])
-        values_count_required(property, 1, 1)
-    elif property.name == "N":
-        validate_value_parameter(property, [])
-        values_count_required(property, 5, 5)
-    elif property.name == "NICKNAME":
-        validate_value_parameter(property, [])
-        values_count_required(property, 1, 1)
-    elif property.name in ["PHOTO", "LOGO"]:
-        validate_value_parameter(property, ["uri"], text_allowed=False)
-        values_count_required(property, 1, 1)
-        if "ENCODING" in property.params:
-            if property.params["ENCODING"].lower() not in ["b", "base64"]:
-                raise vCardValidationError("Encoding must be 'b' or 'base64' ", property)
-    elif property.name in ["BDAY", "ANNIVERSARY", "DEATHDATE"]:
-        validate_value_parameter(property, ["date-and-or-time", "date", "date-time"])
-        values_count_required(property, 1, 1)
-        if "VALUE" in property.params:
-            if property.params["VALUE"] != "text":
-                validate_datetime(property.values[0], "datetime", property)
-    elif property.name == "GENDER":
-        values_count_required(property, 1, 2)
-        if len(property.values[0]) != 1:
-            raise vCardValidationError("Incorrect gender tag")
-    elif property.name == "ADR":
-        validate_value_parameter(property, [])
-        values_count_required(property, 7, 7)
-        if version == "3.0":
-            if "TYPE" in property.params:
-                subvalues = property.params["TYPE"].split(",")
-                for subvalue in subvalues:
-                    subvalue = subvalue.lower()
-                    if subvalue.lower() not in LABEL_TEL and not subvalue.lower().startswith("x-"):
-                        raise vCardValidationError(f"ADR type {subvalue} is unknown")
-    elif property.name == "LABEL":
-        values_count_required(property, 1, 1)
-        if version == "4.0":
-            warnings.warn("LABEL property is not defined in VCard 4.0")
-        if "TYPE" in property.params:
-            subvalues = property.params["TYPE"].split(",")
-            for subvalue in subvalues:
-                if subvalue.lower() not in LABEL_TEL and not subvalue.lower().startswith("x-"):
-                    raise vCardValidationError(f"LABEL type {subvalue} is unknown")
-    elif property.name == "TEL":
-        validate_value_parameter(property, ["uri"])
-        if "TYPE" in property.params:
-            subvalues = property.params["TYPE"].split(",")
-            for subvalue in subvalues:
-                if subvalue.lower() not in TYPE_TEL and not subvalue.lower().startswith("x-"):
-                    raise vCardValidationError(f"TEL type {subvalue} is unknown")
-    elif property.name == "EMAIL":
-        validate_value_parameter(property, [])
-        values_count_required(property, 1, 1)
-        if "TYPE" in property.params:
-            subvalues = property.params["TYPE"].split(",")
-            for subvalue in subvalues:
-                if subvalue.lower() not in TYPE_EMAIL and not subvalue.lower().startswith("x-"):
-                    raise vCardValidationError(f"EMAIL type {subvalue} is unknown")
-    elif property.name == "IMPP":
-        validate_value_parameter(property, ["uri"])
-        values_count_required(property, 1, 1)
-        validate_uri(property.values[0], property)
-    elif property.name == "MAILER":
-        validate_value_parameter(property, [])
-        values_count_required(property, 1, 1)
-    elif property.name == "LANG":
-        values_count_required(property, 1, 1)
-        validate_value_parameter(property, ["language-tag"], text_allowed=False)
-        validate_language_tag(property.values[0], property)
-    elif property.name == "TZ":
-        if version == "4.0":
-            validate_value_parameter(property, ["utc-offset", "uri"])
-            values_count_required(property, 1, 1)
-            if "VALUE" in property.params:
-                if property.params["VALUE"].lower() == "utc-offset":
-                    validate_utc_offset(property.values[0], property)
-                elif property.params["VALUE"].lower() == "uri":
-                    validate_uri(property.values[0], property)
-            else:
-                validate_utc_offset(property.values[0], property)
-        else:
-            values_count_required(property, 1, 1)
-            validate_utc_offset(property.values[0], property)
-    elif property.name == "GEO":
-        if version == "4.0":
-            validate_value_parameter(property, ["uri"], text_allowed=False)
-            values_count_required(property, 1, 1)
-            validate_uri(property.values[0], property)
-        else:
-            values_count_required(property, 2, 2)
-            for i in property.values:
-                validate_float(i, property)
-    elif property.name == "TITLE":
-        validate_value_parameter(property, [])
-        values_count_required(property, 1, 1)
-    elif property.name == "ROLE":
-        validate_value_parameter(property, [])
-        values_count_required(property, 1, 1)
-    elif property.name == "ORG":
-        validate_value_parameter(property, [])
-    elif property.name == "MEMBER":
-        validate_value_parameter(property, ["uri"], text_allowed=False)
-        values_count_required(property, 1, 1)
-        validate_uri(property.values[0], property)
-    elif property.name == "RELATED":
-        if version != "4.0":
-            warnings.warn("Related property allowed only in version 4.0")
-        validate_value_parameter(property, ["uri"], text_allowed=True)
-        values_count_required(property, 1, 1)
-        if property.params["VALUE"].lower() == "uri":
-            validate_uri(property.values[0], property)
-        if "TYPE" in property.params:
-            if property.params["TYPE"].lower() not in [
-                "contact", "acquaintance", "friend", "met",
-                "co-worker", "colleague", "co-resident",
-                "neighbor", "child", "parent",
-                "sibling", "spouse", "kin", "muse",
-                "crush", "date", "sweetheart", "me",
-                "agent", "emergency"
-            ]:
-                raise vCardValidationError("TYPE is incorrect", property)
-            else:
-                raise vCardValidationError("TYPE not found", property)
-    elif property.name == "CATEGORIES":
-        validate_value_parameter(property, [])
-        values_count_required(property, 1, 1)
-    elif property.name in ["NOTE", "PRODID"]:
-        validate_value_parameter(property, [])
-        if len(property.values) > 1 and version == "2.1":
-            value = ";".join(property.values)
-            property._values = [value]
-        else:
-            values_count_required(property, 0, 1)
-    elif property.name == "REV":
-        if version == "4.0":
-            validate_value_parameter(property, ["timestamp"], text_allowed=False)
-        values_count_required(property, 1, 1)
-        validate_datetime(property.values[0], "timestamp", property)
-    elif property.name == ["SORT-STRING", "CLASS"]:
-        values_count_required(property, 1, 1)
-    elif property.name == "SOUND":
-        validate_value_parameter(property, ["uri"], text_allowed=False)
-        values_count_required(property, 1, 1)
-        if "VALUE" in property.params:
-            if property.params["VALUE"].lower() == "uri":
-                validate_uri(property.values[0])
-    elif property.name in ["UID", "KEY"]:
-        values_count_required(property, 1, 1)
-        if "VALUE" in property.params:
-            if property.params["VALUE"].lower() == "uri":
-                validate_uri(property.values[0])
-    elif property.name == ["FBURL", "CALADRURI", "CALURI", "URL"]:
-        validate_value_parameter(property, ["uri"], text_allowed=False)
-        values_count_required(property, 1, 1)
-        validate_uri(property.values[0])
-    elif property.name == "CLIENTPIDMAP":
-        values_count_required(property, 2, 2)
-        validate_integer(property.values[0])
-        validate_uri(property.values[1])
-    elif property.name == "AGENT":
-        values_count_required(property, 1, 1)
-        if "VALUE" in property.params:
-            if property.params["VALUE"].lower() == "uri":
-                validate_uri(property.values[0])
-            else:
-                property.values[0] = property.values[0].decode('string_escape')
-    elif property.name in ["BIRTHDATE", "DEATHPLACE"]:
-        values_count_required(property, 1, 1)
-        validate_value_parameter(property, ["uri"])
-        if "VALUE" in property.params:
-            if property.params["VALUE"].lower() == "uri":
-                validate_uri(property.values[0])
-    elif property.name in ["HOBBY", "EXPERTISE", "INTEREST", "ORG-DIRECTORY"]:
-        values_count_required(property, 1, 1)
-        validate_value_parameter(property, [])
+    rule = RULES.get((property._name, version))
+    if rule is None:
+        rule = RULES.get((property._name, None))
+        if rule is None:
+            return
+    rule.validate(property, version)
@@ -1,7 +1,7 @@
 import os
 
 from pyvcard.migrator import _VersionMigrator
-from pyvcard.vobject import parse
+from pyvcard.vobject import parse, vCardLazyList
 
 """
 Used official vCard standards
@@ -14,17 +14,50 @@ http://microformats.org/wiki/hcard -  hCard
 
 
 def openfile(file: os.PathLike, mode="r", encoding=None, buffering=-1,
-             errors=None, newline=None, opener=None, indexer=None):
+             errors=None, newline=None, opener=None, indexer=None,
+             stream=False, lazy=False, properties=None, exclude=None, on_error="raise",
+             progress=None, start_offset=0, keep_raw=False):
     """
     Opens a file for parsing vCard files (vcf). Returns a parser
+    (or vCardLazyList in lazy mode)
 
     The arguments are similar to the standard function 'open'.
+    In binary mode ("rb") values are decoded by its CHARSET parameter,
+    encoding argument is used for properties without CHARSET
     :param      indexer:    The indexer
     :type       indexer:    instance of vCardIndexer or None
+    :param      stream:     Read file by chunks, use iter_vcards() of parser to get vCard objects one by one
+    :type       stream:     boolean
+    :param      lazy:       Map file to memory and parse vCards only when they are accessed.
+                            File is read as bytes (like in binary mode), returns vCardLazyList
+                            With indexer every accessed vCard is kept in memory by indexer
+    :type       lazy:       boolean
+    :param      properties: Names of properties to parse, other properties are skipped
+    :type       properties: collection of str or None
+    :param      exclude:    Names of properties to skip
+    :type       exclude:    collection of str or None
+    :param      on_error:   "raise", "skip" or "collect" damaged vCards (see parse)
+    :type       on_error:   str
+    :param      progress:   Function called after every vCard with byte offset and count of parsed vCards
+    :type       progress:   callable or None
+    :param      start_offset:  Byte offset to start parsing from (only in binary mode),
+                               use checkpoint() of parser to get it
+    :type       start_offset:  int
+    :param      keep_raw:   Keep original text of properties and write it while property isn't changed
+    :type       keep_raw:   boolean
     """
+    if lazy:
+        return vCardLazyList(file, indexer=indexer, encoding=encoding or "utf-8",
+                             properties=properties, exclude=exclude)
+    if "b" in mode:
+        f = open(file, mode, buffering=buffering, opener=opener)
+        return parse(f, indexer=indexer, stream=stream, encoding=encoding or "utf-8",
+                     properties=properties, exclude=exclude, on_error=on_error,
+                     progress=progress, start_offset=start_offset, keep_raw=keep_raw)
     f = open(file, mode, encoding=encoding, buffering=buffering,
              errors=errors, newline=newline, opener=opener)
-    return parse(f, indexer=indexer)
+    return parse(f, indexer=indexer, stream=stream, properties=properties, exclude=exclude,
+                 on_error=on_error, progress=progress, start_offset=start_offset, keep_raw=keep_raw)
 
 
 def migrate_vcard(vcard: "vCard"):
@@ -1,11 +1,16 @@
-from typing import Union
+from typing import Union, Callable, Collection, Optional
 
 from pyvcard.parsers import AbstractParser
 from pyvcard.vobject.tools import vCard_Converter, _vCard_Builder
-from pyvcard.vobject.parsing import vCard_Parser
-from pyvcard.vobject.structures import vCard, vCard_entry, is_vcard, is_vcard_property, \
+from pyvcard.vobject.parsing import vCard_Parser, vCardErrorRecord
+from pyvcard.vobject.structures import vCard, vCard_entry, vCardChange, FrozenvCard, is_vcard, is_vcard_property, \
     parse_name_property, validate_vcards
 from pyvcard.vobject.containers import vCardSet, vCardList
+from pyvcard.vobject.parallel import parse_parallel, vcf_splits
+from pyvcard.vobject.lazy import vCardLazyList
+from pyvcard.vobject.table import vCardTable
+from pyvcard.vobject.records import iter_records, vCardRecord
+from pyvcard.vobject.aio import aparse
 from pyvcard.enums import SOURCES
 
 import pyvcard.sources.jcard
@@ -14,29 +19,59 @@ import pyvcard.sources.csv_source
 import pyvcard.sources.hcard
 
 
-def parse(source, indexer: "vCardIndexer" = None) -> vCard_Parser:
+def parse(source, indexer: "vCardIndexer" = None, stream: bool = False,
+          encoding: str = "utf-8", properties: Collection[str] = None,
+          exclude: Collection[str] = None, on_error: str = "raise",
+          progress: Callable[[Optional[int], int], None] = None, start_offset: int = 0,
+          keep_raw: bool = False) -> vCard_Parser:
     """
     Returns a vCard parser
 
-    :param      source:   Source to find .vcf file
-    :type       source:   File descriptor or str
-    :param      indexer:  The indexer that will be set
-    :type       indexer:  vCardIndexer or None
+    :param      source:    Source to find .vcf file
+    :type       source:    File descriptor, str or bytes-like object
+    :param      indexer:   The indexer that will be set
+    :type       indexer:   vCardIndexer or None
+    :param      stream:    Parse lazily, use iter_vcards() to get vCard objects one by one
+    :type       stream:    boolean
+    :param      encoding:  Charset of properties without CHARSET parameter (only for bytes sources)
+    :type       encoding:  str
+    :param      properties:  Names of properties to parse, other properties are skipped
+    :type       properties:  collection of str or None
+    :param      exclude:     Names of properties to skip
+    :type       exclude:     collection of str or None
+    :param      on_error:    "raise" - stop parsing at first error, "skip" - skip damaged vCards,
+                             "collect" - skip damaged vCards and collect errors (see parser's errors())
+    :type       on_error:    str
+    :param      progress:    Function called after every vCard with byte offset after it
+                             (None for text sources) and count of parsed vCards
+    :type       progress:    callable or None
+    :param      start_offset:  Byte offset to start parsing from, e.g. parser's checkpoint()
+                               (only for bytes sources)
+    :type       start_offset:  int
+    :param      keep_raw:  Keep original folded text of properties, it's written
+                           instead of serialization while property isn't changed
+    :type       keep_raw:  boolean
     """
-    return vCard_Parser(source, indexer=indexer)
+    return vCard_Parser(source, indexer=indexer, stream=stream, encoding=encoding,
+                        properties=properties, exclude=exclude, on_error=on_error,
+                        progress=progress, start_offset=start_offset, keep_raw=keep_raw)
 
 
-def convert(source: str) -> vCard_Converter:
+def convert(source: str, cache: "vCardOutputCache" = None) -> vCard_Converter:
     """
     Returns a vCard converter object
 
     :param      source:  Source to find .vcf file
-    :type       source: vCard or vCardSet
+    :type       source: vCard, vCardSet or vCardList
+    :param      cache:   The cache of serialized vCards (vcf, jCard, xCard and CSV)
+    :type       cache:   vCardOutputCache or None
     """
-    return vCard_Converter(source)
+    return vCard_Converter(source, cache)
 
 
-def parse_from(source: str, type: str, indexer: "vCardIndexer" = None) -> Union[AbstractParser, vCard_Parser]:
+def parse_from(source: str, type: str, indexer: "vCardIndexer" = None,
+               properties: Collection[str] = None,
+               exclude: Collection[str] = None) -> Union[AbstractParser, vCard_Parser]:
     """
     Parses vCard from various sources (see SOURCES enum)
 
@@ -46,22 +81,27 @@ def parse_from(source: str, type: str, indexer: "vCardIndexer" = None) -> Union[
     :type       type:     str or SOURCES enum
     :param      indexer:  The indexer
     :type       indexer:  instance of vCardIndexer or None
+    :param      properties:  Names of properties to parse, other properties are skipped
+    :type       properties:  collection of str or None
+    :param      exclude:     Names of properties to skip
+    :type       exclude:     collection of str or None
     """
     if type == SOURCES.XML or type == "xml":
-        return pyvcard.sources.xcard.xCard_Parser(source, indexer)
+        return pyvcard.sources.xcard.xCard_Parser(source, indexer, properties, exclude)
     elif type == SOURCES.JSON or type == "json":
-        return pyvcard.sources.jcard.jCard_Parser(source, indexer)
+        return pyvcard.sources.jcard.jCard_Parser(source, indexer, properties, exclude)
     elif type == SOURCES.CSV or type == "csv":
-        return pyvcard.sources.csv_source.csv_Parser(source, indexer)
+        return pyvcard.sources.csv_source.csv_Parser(source, indexer, properties, exclude)
     elif type == SOURCES.HTML or type == "html":
-        return pyvcard.sources.hcard.hCard_Parser(source, indexer)
+        return pyvcard.sources.hcard.hCard_Parser(source, indexer, properties, exclude)
     elif type == SOURCES.VCF:
-        return parse(source, indexer)
+        return parse(source, indexer, properties=properties, exclude=exclude)
     else:
         raise TypeError(f"Type {type} isn't found")
 
 
-def builder(indexer: "vCardIndexer" = None, version="4.0") -> _vCard_Builder:
+def builder(indexer: "vCardIndexer" = None, version="4.0",
+            properties: Collection[str] = None, exclude: Collection[str] = None) -> _vCard_Builder:
     """
     Returns a vCard object builder
 
@@ -69,5 +109,9 @@ def builder(indexer: "vCardIndexer" = None, version="4.0") -> _vCard_Builder:
     :type       indexer: instance of vCardIndexer or None
     :param      version:  The version
     :type       version:  string
+    :param      properties:  Names of properties to add, other properties are skipped
+    :type       properties:  collection of str or None
+    :param      exclude:     Names of properties to skip
+    :type       exclude:     collection of str or None
     """
-    return _vCard_Builder(indexer=indexer, version=version)
+    return _vCard_Builder(indexer=indexer, version=version, properties=properties, exclude=exclude)
@@ -0,0 +1,80 @@
+import asyncio
+import inspect
+from typing import AsyncIterator, Collection
+
+from pyvcard.utils import _iter_unfold_byte_lines
+from pyvcard.vobject.parsing import _vCard_ByteAssembler, _projection
+
+
+async def _aiter_chunks(source, chunk_size: int):
+    """
+    Utility method. Don't recommend for use in outer code
+    Reads chunks from asyncio.StreamReader (or object with coroutine read) or async byte iterator
+    """
+    read = getattr(source, "read", None)
+    if read is not None and inspect.iscoroutinefunction(read):
+        while True:
+            chunk = await read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        async for chunk in source:
+            yield chunk
+
+
+async def _aiter_unfold_byte_lines(source, chunk_size: int):
+    """
+    Utility method. Don't recommend for use in outer code
+    Unfolds the raw lines of async source, yields lists of unfolded lines for every chunk
+    """
+    tail = b""
+    pending = []
+    async for chunk in _aiter_chunks(source, chunk_size):
+        data = tail + bytes(chunk)
+        end = data.rfind(b"\n")
+        if end == -1:
+            tail = data
+            continue
+        tail = data[end + 1:]
+        # the last unfolded line can be continued by the next chunk
+        lines = list(_iter_unfold_byte_lines(pending + data[:end].split(b"\n")))
+        pending = lines[-1:]
+        yield lines[:-1]
+    if tail:
+        pending.append(tail)
+    yield list(_iter_unfold_byte_lines(pending))
+
+
+async def aparse(source, indexer: "vCardIndexer" = None, encoding: str = "utf-8",
+                 properties: Collection[str] = None, exclude: Collection[str] = None,
+                 chunk_size: int = 65536) -> AsyncIterator["vCard"]:
+    """
+    Parses vCards from asyncio.StreamReader or any async byte iterator incrementally.
+    Use it as 'async for vcard in aparse(reader)', control is returned to event loop
+    after every vCard
+
+    :param      source:      The source
+    :type       source:      asyncio.StreamReader or async iterator of bytes
+    :param      indexer:     The indexer that will be set
+    :type       indexer:     vCardIndexer or None
+    :param      encoding:    Charset of properties without CHARSET parameter
+    :type       encoding:    str
+    :param      properties:  Names of properties to parse, other properties are skipped
+    :type       properties:  collection of str or None
+    :param      exclude:     Names of properties to skip
+    :type       exclude:     collection of str or None
+    :param      chunk_size:  Size of chunk read from StreamReader
+    :type       chunk_size:  int
+
+    :returns:   async generator of parsing results
+    :rtype:     async generator of vCard
+    """
+    assembler = _vCard_ByteAssembler(indexer, encoding, _projection(properties, exclude))
+    async for lines in _aiter_unfold_byte_lines(source, chunk_size):
+        for line in lines:
+            vcard = assembler.feed(line)
+            if vcard is not None:
+                yield vcard
+                await asyncio.sleep(0)
+    assembler.close()
@@ -1,8 +1,8 @@
-from typing import Collection, Optional, Union, List
+from typing import Collection, Iterator, Optional, Union, List
 
 import pyvcard.vobject.structures
 from pyvcard.indexer import vCardIndexer
-from pyvcard.utils import base64_encode
+from pyvcard.utils import base64_encode, _write_lines
 
 
 class _vCardContainerMixin:
@@ -45,11 +45,32 @@ class _vCardContainerMixin:
         :param      encode:  encode property (like bytes, or quoted-printable)
         :type       encode:  boolean
         """
-        s = ""
+        return "".join(line + "\n" for line in self.iter_lines(encode))
+
+    def iter_lines(self, encode: bool = True) -> Iterator[str]:
+        """
+        Yields lines of all vCards (folded, without line endings)
+
+        :param      encode:  encode property (like bytes, or quoted-printable)
+        :type       encode:  boolean
+        """
         for vcard in self:
-            s += vcard.repr_vcard(encode)
-            s += "\n"
-        return s
+            yield from vcard.iter_lines(encode)
+
+    def write_to(self, fp, encoding: str = "utf-8", newline: str = "\r\n", encode: bool = True) -> None:
+        """
+        Writes vCards to file object one by one without building the whole string
+
+        :param      fp:        The file object
+        :type       fp:        text or binary file object
+        :param      encoding:  The encoding (only for binary files)
+        :type       encoding:  str
+        :param      newline:   The line ending
+        :type       newline:   str
+        :param      encode:    encode property (like bytes, or quoted-printable)
+        :type       encode:    boolean
+        """
+        _write_lines(fp, self.iter_lines(encode), encoding, newline)
 
     def difference_search(self, type: str, value: str,
                           diff_func, k: int = 85,
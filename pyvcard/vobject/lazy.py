@@ -0,0 +1,171 @@
+import mmap
+import os
+import re
+import weakref
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Collection
+
+from pyvcard.exceptions import vCardFormatError, vCardValidationError
+from pyvcard.utils import _iter_byte_lines, _iter_unfold_byte_lines
+from pyvcard.vobject.parsing import _vCard_ByteAssembler, _InternPool, _iter_parse_lines, _projection
+from pyvcard.vobject.parallel import _version_before
+from pyvcard.vobject.containers import vCardList, _vCardContainerMixin
+
+_CARD_BORDER = re.compile(rb"^(BEGIN|END):VCARD[ \t\r]*$", re.MULTILINE)
+
+
+class vCardLazyList(Sequence, _vCardContainerMixin):
+    """
+    Sequence of vCard objects backed by memory-mapped vcf file.
+    File is scanned once for vCard borders, vCard is parsed only when it is accessed,
+    parsed vCards are kept in bounded cache.
+    vCards indexed by indexer are kept alive by indexer, lazy list refers to them weakly,
+    so the same objects are returned after eviction from cache. With indexer every accessed
+    vCard stays in memory until it is removed from indexer
+    """
+
+    def __init__(self, file: os.PathLike, indexer: "vCardIndexer" = None,
+                 encoding: str = "utf-8", cache_size: int = 128,
+                 properties: Collection[str] = None, exclude: Collection[str] = None):
+        """
+        Constructs a new instance.
+
+        :param      file:        The file path
+        :type       file:        path-like object
+        :param      indexer:     The indexer, vCard is indexed when it is parsed at first time
+                                 and this object is returned at next accesses
+        :type       indexer:     vCardIndexer or None
+        :param      encoding:    Charset of properties without CHARSET parameter
+        :type       encoding:    str
+        :param      cache_size:  The maximum count of parsed vCards kept in memory
+        :type       cache_size:  int
+        :param      properties:  Names of properties to parse, other properties are skipped
+        :type       properties:  collection of str or None
+        :param      exclude:     Names of properties to skip
+        :type       exclude:     collection of str or None
+        """
+        self._indexer = indexer
+        self.encoding = encoding
+        self.projection = _projection(properties, exclude)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        # names and parameters are shared by all vCards of file
+        self._pool = _InternPool()
+        self._starts = array("q")
+        self._ends = array("q")
+        self._file = open(file, "rb")
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self._file.close()
+            raise vCardValidationError("Empty file")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._scan()
+        except vCardFormatError:
+            self.close()
+            raise
+        self._indexed = bytearray(len(self._starts))
+        # index -> vCard indexed by indexer, these objects are kept alive by indexer
+        self._indexed_cards = weakref.WeakValueDictionary()
+
+    def _scan(self):
+        """
+        Fills table of vCard offsets
+        """
+        start = None
+        for match in _CARD_BORDER.finditer(self._mm):
+            if match.group(1) == b"BEGIN":
+                if start is not None:
+                    raise vCardFormatError(f"vCard didn't closed at offset {match.start()}")
+                start = match.start()
+            else:
+                if start is None:
+                    raise vCardFormatError(f"Double closing or missing begin at offset {match.start()}")
+                self._starts.append(start)
+                self._ends.append(match.end())
+                start = None
+        if start is not None:
+            raise vCardFormatError(f"vCard didn't closed at offset {start}")
+
+    def offset(self, index: int):
+        """
+        Returns byte range of vCard in file
+
+        :param      index:  The index of vCard
+        :type       index:  int
+
+        :returns:   range (start, end), end is exclusive
+        :rtype:     tuple
+        """
+        return self._starts[index], self._ends[index]
+
+    def _parse_card(self, index: int) -> "vCard":
+        start, end = self._starts[index], self._ends[index]
+        vcard = self._indexed_cards.get(index)
+        if vcard is not None:
+            if vcard.indexer is self._indexer:
+                return vcard
+            # vCard was removed from indexer
+            del self._indexed_cards[index]
+        indexer = None
+        if self._indexer is not None and not self._indexed[index]:
+            indexer = self._indexer
+            self._indexed[index] = 1
+        assembler = _vCard_ByteAssembler(indexer, self.encoding, self.projection)
+        assembler.version = _version_before(self._mm, start)
+        assembler.pool = self._pool
+        lines = _iter_unfold_byte_lines(_iter_byte_lines(self._mm[start:end]))
+        vcard = next(_iter_parse_lines(lines, assembler=assembler))
+        if indexer is not None:
+            self._indexed_cards[index] = vcard
+        return vcard
+
+    def _get(self, index: int) -> "vCard":
+        vcard = self._cache.get(index)
+        if vcard is not None:
+            self._cache.move_to_end(index)
+            return vcard
+        if self._mm.closed:
+            raise IOError("File is closed")
+        vcard = self._parse_card(index)
+        if self.cache_size > 0:
+            self._cache[index] = vcard
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return vcard
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return vCardList([self._get(i) for i in range(*index.indices(len(self)))],
+                             indexer=self._indexer)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("vCard index out of range")
+        return self._get(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._get(i)
+
+    def __repr__(self):
+        return f"<vCardLazyList of {len(self)} vCards, {len(self._cache)} parsed>"
+
+    def close(self):
+        """
+        Closes mapped file, parsed vCards are dropped
+        """
+        self._cache.clear()
+        self._indexed_cards.clear()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,124 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Collection, List, Optional, Tuple
+
+from pyvcard.indexer import vCardIndexer
+from pyvcard.utils import _iter_byte_lines, _iter_unfold_byte_lines
+from pyvcard.vobject.parsing import _vCard_ByteAssembler, _iter_parse_lines, _projection
+
+import pyvcard.vobject.containers
+
+_CARD_BEGIN = b"\nBEGIN:VCARD"
+_VERSION = b"\nVERSION:"
+
+
+def vcf_splits(file: os.PathLike, count: int) -> List[Tuple[int, int]]:
+    """
+    Splits vcf file to byte ranges, every range begins at 'BEGIN:VCARD' line.
+    Ranges can be parsed independently (for example in map-reduce jobs)
+
+    :param      file:   The file path
+    :type       file:   path-like object
+    :param      count:  The maximum count of ranges
+    :type       count:  int
+
+    :returns:   list of ranges (start, end), end is exclusive
+    :rtype:     list of tuples
+    """
+    size = os.path.getsize(file)
+    if size == 0:
+        return []
+    bounds = [0]
+    with open(file, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for i in range(1, count):
+                pos = mm.find(_CARD_BEGIN, max(size * i // count - 1, bounds[-1]))
+                if pos == -1:
+                    break
+                bounds.append(pos + 1)
+    bounds.append(size)
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+
+def _version_before(mm: mmap.mmap, pos: int) -> str:
+    """
+    Utility method. Don't recommend for use in outer code
+    Returns the version parser will have at position
+    """
+    index = mm.rfind(_VERSION, 0, pos)
+    if index == -1:
+        return "4.0"
+    index += len(_VERSION)
+    end = mm.find(b"\n", index, pos)
+    if end == -1:
+        end = pos
+    return mm[index:end].strip().decode("ascii", "replace")
+
+
+def _parse_range(file, start: int, end: int, version: str,
+                 encoding: str, indexer: Optional[vCardIndexer], projection=None):
+    """
+    Utility method. Don't recommend for use in outer code
+    Parses byte range of file in worker process
+    """
+    with open(file, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    assembler = _vCard_ByteAssembler(indexer, encoding, projection)
+    assembler.version = version
+    vcards = list(_iter_parse_lines(_iter_unfold_byte_lines(_iter_byte_lines(data)), assembler=assembler))
+    return vcards, indexer
+
+
+def parse_parallel(file: os.PathLike, workers: Optional[int] = None,
+                   indexer: vCardIndexer = None, encoding: str = "utf-8",
+                   ordered: bool = True, properties: Collection[str] = None,
+                   exclude: Collection[str] = None):
+    """
+    Parses vcf file using multiple processes. File is split by vcf_splits,
+    ranges are parsed in process pool and merged in original order
+
+    :param      file:      The file path
+    :type       file:      path-like object
+    :param      workers:   The count of worker processes, default is count of CPUs
+    :type       workers:   int or None
+    :param      indexer:   The indexer, indexes of workers will be merged to it
+    :type       indexer:   instance of vCardIndexer or None
+    :param      encoding:  Charset of properties without CHARSET parameter
+    :type       encoding:  str
+    :param      ordered:   Return vCardList if True, else vCardSet
+    :type       ordered:   boolean
+    :param      properties:  Names of properties to parse, other properties are skipped
+    :type       properties:  collection of str or None
+    :param      exclude:     Names of properties to skip
+    :type       exclude:     collection of str or None
+    """
+    projection = _projection(properties, exclude)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    splits = vcf_splits(file, workers)
+    versions = []
+    if splits:
+        with open(file, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for start, _ in splits:
+                    versions.append(_version_before(mm, start))
+    tasks = []
+    for (start, end), version in zip(splits, versions):
+        if indexer is not None:
+            worker_indexer = type(indexer)(index_params=indexer._indexparams)
+        else:
+            worker_indexer = None
+        tasks.append((file, start, end, version, encoding, worker_indexer, projection))
+    vcards = []
+    if tasks:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result, worker_indexer in executor.map(_parse_range, *zip(*tasks)):
+                vcards.extend(result)
+                if indexer is not None:
+                    indexer.merge(worker_indexer)
+    if ordered:
+        return pyvcard.vobject.containers.vCardList(vcards, indexer=indexer)
+    else:
+        return pyvcard.vobject.containers.vCardSet(vcards, indexer=indexer)
@@ -1,8 +1,13 @@
+import io
+import quopri
 import re
-from typing import Optional
+from collections import namedtuple
+from typing import Callable, Collection, List, Optional
 
-from pyvcard.regex import VCARD_BORDERS, CONTENTLINE, PARAM, PARAM_21, CONTENTLINE_21
-from pyvcard.utils import split_noescape, unescape, _unfold_lines, remove_junk_symbols
+from pyvcard.regex import VCARD_BORDERS, CONTENTLINE, PARAM, PARAM_21, CONTENTLINE_21, \
+    NAME, VALUE, PARAM_VALUE_CHARS
+from pyvcard.utils import split_noescape, unescape, _iter_unfold_lines, remove_junk_symbols, \
+    _iter_byte_lines, _iter_unfold_byte_lines, _LinePosition
 from pyvcard.enums import _STATE
 from pyvcard.exceptions import vCardFormatError, vCardValidationError
 
@@ -14,8 +19,97 @@ def _parse_line(string, version):
     """
     Utility method. Don't recommend for use in outer code
     Parses an unfolded line and returns an array for parser
+
+    Single pass tokenizer: the line is cut by delimiters, only short parts are checked
+    by patterns. Results are identical to _parse_line_regex, ambiguous lines
+    (quoted parameters and a few malformed forms) are passed to it
     """
     string = remove_junk_symbols(string)
+    colon = string.find(":")
+    if colon == -1:
+        return _line_error(string)
+    head = string[:colon]
+    if '"' in head:
+        return _match_line(string, version)
+    value = string[colon + 1:]
+    segments = head.split(";")
+    name = segments[0]
+    if version == "4.0" and "=" in name:
+        return _match_line(string, version)
+    group = None
+    dot = name.find(".")
+    if dot != -1:
+        group = name[:dot + 1]
+        name = name[dot + 1:]
+        if not NAME.fullmatch(group, 0, dot):
+            return _line_error(string)
+    if not NAME.fullmatch(name) or not VALUE.fullmatch(value):
+        return _line_error(string)
+    if len(segments) == 1 and value == "VCARD":
+        if name == "BEGIN":
+            return _STATE.BEGIN
+        elif name == "END":
+            return _STATE.END
+    pairs = []
+    for i in range(1, len(segments)):
+        segment = segments[i]
+        eq = segment.find("=")
+        if eq == -1:
+            key = segment
+            param = ""
+        else:
+            key = segment[:eq]
+            param = segment[eq + 1:]
+            if not PARAM_VALUE_CHARS.fullmatch(param):
+                return _line_error(string)
+        if not NAME.fullmatch(key):
+            if version == "4.0" or key == "":
+                return _line_error(string)
+            return _match_line(string, version)
+        if eq == -1 and version == "4.0":
+            return _line_error(string)
+        pairs.append((key, param))
+    name = name.upper()
+    if name == "BEGIN" or name == "END":
+        return None
+    params = {}
+    for key, param in pairs:
+        if param == "":
+            params[key.upper()] = None
+        elif key in params:
+            params[key.upper()] += "," + param.lower()
+        else:
+            params[key.upper()] = param.lower()
+    if "\\" in value:
+        values = [unescape(i) for i in split_noescape(value, ";")]
+    else:
+        values = value.split(";")
+    return name, values, params, group
+
+
+def _line_error(string):
+    """
+    Utility method. Don't recommend for use in outer code
+    Raises an error for unparsed line if it isn't empty
+    """
+    if string.strip() != "":
+        raise vCardFormatError(f"An parsing error occurred with string '{string}'")
+    return None
+
+
+def _parse_line_regex(string, version):
+    """
+    Utility method. Don't recommend for use in outer code
+    Parses an unfolded line by regular expressions, reference implementation of _parse_line
+    """
+    return _match_line(remove_junk_symbols(string), version)
+
+
+def _match_line(string, version):
+    """
+    Utility method. Don't recommend for use in outer code
+    Parses an unfolded line without junk symbols by regular expressions
+    """
     m1 = re.match(VCARD_BORDERS, string)
     if m1:
         return _STATE.BEGIN if m1.group(3) == "BEGIN" else _STATE.END
@@ -56,9 +150,69 @@ def _parse_line(string, version):
         group = m2.group(1) if m2.group(1) != "" else None
         return name, values, params_dict, group
     else:
-        if string.strip() != "":
-            raise vCardFormatError(f"An parsing error occurred with string '{string}'")
-    return None
+        return _line_error(string)
+
+
+_BYTE_SEPARATOR = re.compile(rb"(?<!\\);")
+_NOT_SPACE = re.compile(rb"\S")
+
+
+def _find_value_separator(string, colon, quote):
+    """
+    Utility method. Don't recommend for use in outer code
+    Finds the colon between parameters and value, colons in quoted parameters are skipped
+    """
+    pos = 0
+    while True:
+        index = string.find(colon, pos)
+        if index == -1:
+            return index
+        start = string.find(quote, pos, index)
+        if start == -1:
+            return index
+        end = string.find(quote, start + 1)
+        if end == -1:
+            return index
+        pos = end + 1
+
+
+def _parse_byte_line(string: bytes, version: str, encoding: str = "utf-8"):
+    """
+    Utility method. Don't recommend for use in outer code
+    Parses an unfolded raw line. Values are decoded once using CHARSET parameter
+    Returns parsing result and a flag that values are still encoded
+    """
+    colon = _find_value_separator(string, b":", b'"')
+    if colon == -1:
+        return _parse_line(string.decode(encoding), version), True
+    head = string[:colon].upper()
+    if b"CHARSET" not in head and b"ENCODING" not in head:
+        return _parse_line(string.decode(encoding), version), True
+    parsed = _parse_line(string[:colon + 1].decode(encoding), version)
+    if not isinstance(parsed, tuple):
+        return parsed, True
+    name, _, params, group = parsed
+    charset = params.get("CHARSET") or encoding
+    encoding_param = (params.get("ENCODING") or "").upper()
+    raw = string[colon + 1:].rstrip()
+    try:
+        if encoding_param == "QUOTED-PRINTABLE":
+            values = [
+                unescape(quopri.decodestring(value).decode(charset)) if value else ""
+                for value in _BYTE_SEPARATOR.split(raw)
+            ]
+        elif encoding_param in ["B", "BASE64"]:
+            # base64 is decoded lazily by vCard_entry
+            values = [value.decode("ascii") for value in _BYTE_SEPARATOR.split(raw)]
+            return (name, values, params, group), True
+        else:
+            values = split_noescape(remove_junk_symbols(raw.decode(charset)), ";")
+            values = [unescape(value) for value in values]
+    except (ValueError, LookupError):
+        # decoding will be repeated by vCard_entry, which reports the error
+        values = split_noescape(raw.decode(encoding, "replace"), ";")
+        return (name, [unescape(value) for value in values], params, group), True
+    return (name, values, params, group), False
 
 
 def parse_property(string: str, version: str) -> Optional["pyvcard.vobject.structures.vCard_entry"]:
@@ -77,49 +231,267 @@ def parse_property(string: str, version: str) -> Optional["pyvcard.vobject.struc
         return pyvcard.vobject.structures.vCard_entry(*c)
 
 
-def _parse_lines(strings, indexer: "vCardIndexer" = None):
+_LINE_NAME = re.compile(r"\s*(?:[^.;:]*\.)?([^.;:]*)")
+_BYTE_LINE_NAME = re.compile(rb"\s*(?:[^.;:]*\.)?([^.;:]*)")
+
+
+class _vCard_Projection:
     """
-    Utility method. Don't recommend for use
-    Parses lines in list, indexer is supported
+    Utility class. Don't recommend for use in outer code
+    Selects properties that will be parsed. BEGIN, END and VERSION are always parsed
     """
-    version = "4.0"
-    vcard = pyvcard.vobject.structures.vCard()
-    args = []
-    card_opened = False
-    is_version = False
-    buf = []
-    i = 1
-    for string in strings:
-        parsed = _parse_line(string, version)
+    _REQUIRED = frozenset(["BEGIN", "END", "VERSION"])
+
+    def __init__(self, properties: Collection[str] = None, exclude: Collection[str] = None):
+        if properties is not None:
+            properties = frozenset(name.upper() for name in properties) | self._REQUIRED
+        self.properties = properties
+        self.exclude = frozenset(name.upper() for name in exclude or []) - self._REQUIRED
+
+    def __contains__(self, name: str) -> bool:
+        name = name.upper()
+        if self.properties is not None and name not in self.properties:
+            return False
+        return name not in self.exclude
+
+    def accepts_line(self, string) -> bool:
+        """
+        Checks property name of unfolded line (str or bytes) without parsing it
+        """
+        if isinstance(string, str):
+            name = _LINE_NAME.match(string).group(1)
+        else:
+            name = _BYTE_LINE_NAME.match(string).group(1).decode("ascii", "replace")
+        return name.strip() in self
+
+
+def _projection(properties: Collection[str] = None,
+                exclude: Collection[str] = None) -> Optional[_vCard_Projection]:
+    """
+    Utility method. Don't recommend for use in outer code
+    Returns projection or None if all properties are parsed
+    """
+    if properties is None and not exclude:
+        return None
+    return _vCard_Projection(properties, exclude)
+
+
+vCardErrorRecord = namedtuple("vCardErrorRecord", ["line", "offset", "card_index", "exception"])
+vCardErrorRecord.__doc__ = """
+Parsing error: number of line, byte offset of line (None for text sources),
+index of damaged vCard (None if error is outside of vCard) and the exception
+"""
+
+ON_ERROR_MODES = ("raise", "skip", "collect")
+
+
+class _InternPool:
+    """
+    Utility class. Don't recommend for use in outer code
+    Parse-scoped pool of names, groups and parameters. Equal strings are stored once,
+    properties with equal parameters share one immutable mapping.
+    Pool is bounded: when it's full, new strings and parameters aren't stored,
+    so unique values (for example LABEL or SORT-AS) don't grow memory of stream parsing
+    """
+    __slots__ = ("_strings", "_params", "_limit")
+
+    def __init__(self, limit: int = 4096):
+        self._strings = {}
+        self._params = {}
+        self._limit = limit
+
+    def string(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+        interned = self._strings.get(value)
+        if interned is not None:
+            return interned
+        if len(self._strings) < self._limit:
+            self._strings[value] = value
+        return value
+
+    def group(self, group: Optional[str]) -> Optional[str]:
+        if group is not None and group.endswith("."):
+            group = group[:-1]
+        return self.string(group)
+
+    def params(self, params: dict) -> "_FrozenParams":
+        key = tuple(params.items())
+        frozen = self._params.get(key)
+        if frozen is None:
+            string = self.string
+            frozen = pyvcard.vobject.structures._FrozenParams(
+                (string(name), string(value)) for name, value in key
+            )
+            if len(self._params) < self._limit:
+                self._params[key] = frozen
+        return frozen
+
+
+class _vCard_Assembler:
+    """
+    Utility class. Don't recommend for use in outer code
+    Collects unfolded lines to vCard objects one by one, indexer is supported
+    """
+    _BEGIN = "BEGIN:VCARD"
+
+    def __init__(self, indexer: "vCardIndexer" = None, projection: _vCard_Projection = None,
+                 on_error: str = "raise", position: _LinePosition = None):
+        if on_error not in ON_ERROR_MODES:
+            raise ValueError(f"on_error must be one of {ON_ERROR_MODES}, not {on_error!r}")
+        self.indexer = indexer
+        self.projection = projection
+        self.on_error = on_error
+        self.position = position
+        self.errors = []
+        self.version = "4.0"
+        self._vcard = pyvcard.vobject.structures.vCard()
+        self._buf = []
+        self._card_opened = False
+        self._is_version = False
+        self._skipping = False
+        self._cards = 0
+        self._line = 1
+        self.pool = _InternPool()
+
+    def _parse(self, string: str):
+        return _parse_line(string, self.version), True
+
+    def feed(self, string: str) -> Optional["pyvcard.vobject.structures.vCard"]:
+        """
+        Parses an unfolded line. Returns vCard object if it was closed by this line
+        """
+        if self.projection is not None and not self.projection.accepts_line(string):
+            self._line += 1
+            return None
+        if self._skipping:
+            # damaged vCard is skipped up to the next BEGIN:VCARD
+            if string.rstrip() != self._BEGIN:
+                self._line += 1
+                return None
+            self._skipping = False
+        try:
+            return self._assemble(*self._parse(string))
+        except Exception as e:
+            if self.on_error == "raise":
+                raise
+            self._error(e)
+            if string.rstrip() == self._BEGIN:
+                return self.feed(string)
+            self._skipping = True
+            self._line += 1
+            return None
+
+    def _error(self, exception: Exception):
+        if self.on_error == "collect":
+            if self.position is not None:
+                line, offset = self.position.line, self.position.offset
+            else:
+                line, offset = self._line, None
+            card_index = self._cards - 1 if self._card_opened else None
+            self.errors.append(vCardErrorRecord(line, offset, card_index, exception))
+        self._card_opened = False
+        self._is_version = False
+        self._buf = []
+
+    def _assemble(self, parsed, encoded: bool = True):
+        result = None
         if parsed == _STATE.BEGIN:
-            vcard = pyvcard.vobject.structures.vCard()
-            if card_opened:
-                raise vCardFormatError(f"vCard didn't closed at line {i}")
-            card_opened = True
-            buf = []
+            self._vcard = pyvcard.vobject.structures.vCard()
+            if self._card_opened:
+                raise vCardFormatError(f"vCard didn't closed at line {self._line}")
+            self._card_opened = True
+            self._cards += 1
+            self._buf = []
         elif parsed == _STATE.END:
-            vcard._attrs = buf
-            if not card_opened:
-                raise vCardFormatError(f"Double closing or missing begin at line {i}")
-            if not is_version:
+            self._vcard._attrs = self._vcard._own(self._buf)
+            if not self._card_opened:
+                raise vCardFormatError(f"Double closing or missing begin at line {self._line}")
+            if not self._is_version:
                 raise vCardFormatError("Missing VERSION property")
-            card_opened = False
-            is_version = False
-            args.append(vcard)
+            self._card_opened = False
+            self._is_version = False
+            if self.indexer is not None:
+                # vCard is indexed only when it was parsed completely
+                for entry in self._buf:
+                    self.indexer.setindex(self._vcard)
+                    self.indexer.index(entry, self._vcard)
+            result = self._vcard
         elif parsed:
             if parsed[0] == "VERSION":
-                is_version = True
-                version = "".join(parsed[1])
-                vcard._set_version(version)
-            entry = pyvcard.vobject.structures.vCard_entry(*parsed, version=version)
-            if indexer is not None:
-                indexer.setindex(vcard)
-                indexer.index(entry, vcard)
-            buf.append(entry)
-        i += 1
-    if card_opened:
-        raise vCardFormatError(f"vCard didn't closed at line {i}")
-    return args
+                self._is_version = True
+                self.version = "".join(parsed[1])
+                self._vcard._set_version(self.version)
+            pool = self.pool
+            name, values, params, group = parsed
+            entry = pyvcard.vobject.structures.vCard_entry(
+                pool.string(name), values, pool.params(params), pool.group(group),
+                version=self.version, encoded=encoded
+            )
+            if self.position is not None and self.position.keep_raw:
+                entry._raw = self._raw_text(self.position.raw, params)
+            self._buf.append(entry)
+        self._line += 1
+        return result
+
+    def _raw_text(self, raw: str, params: dict) -> Optional[str]:
+        return raw
+
+    def close(self) -> None:
+        """
+        Checks that the last vCard was closed
+        """
+        if self._card_opened:
+            error = vCardFormatError(f"vCard didn't closed at line {self._line}")
+            if self.on_error == "raise":
+                raise error
+            self._error(error)
+
+
+class _vCard_ByteAssembler(_vCard_Assembler):
+    """
+    Utility class. Don't recommend for use in outer code
+    Collects unfolded raw lines (bytes) to vCard objects one by one
+    """
+    _BEGIN = b"BEGIN:VCARD"
+
+    def __init__(self, indexer: "vCardIndexer" = None, encoding: str = "utf-8",
+                 projection: _vCard_Projection = None, on_error: str = "raise",
+                 position: _LinePosition = None):
+        super().__init__(indexer, projection, on_error, position)
+        self.encoding = encoding
+
+    def _parse(self, string: bytes):
+        return _parse_byte_line(string, self.version, self.encoding)
+
+    def _raw_text(self, raw: bytes, params: dict) -> Optional[str]:
+        try:
+            return raw.decode(params.get("CHARSET") or self.encoding)
+        except (UnicodeDecodeError, LookupError):
+            # property is serialized as usual
+            return None
+
+
+def _iter_parse_lines(strings, indexer: "vCardIndexer" = None, assembler: _vCard_Assembler = None):
+    """
+    Utility method. Don't recommend for use
+    Parses lines lazily and yields vCard objects one by one, indexer is supported
+    """
+    if assembler is None:
+        assembler = _vCard_Assembler(indexer)
+    for string in strings:
+        vcard = assembler.feed(string)
+        if vcard is not None:
+            yield vcard
+    assembler.close()
+
+
+def _parse_lines(strings, indexer: "vCardIndexer" = None):
+    """
+    Utility method. Don't recommend for use
+    Parses lines in list, indexer is supported
+    """
+    return list(_iter_parse_lines(strings, indexer))
 
 
 class vCard_Parser:
@@ -127,39 +499,173 @@ class vCard_Parser:
     Parses a vCard files (VCF) or any vCard string
     """
 
-    def __init__(self, source, indexer: "vCardIndexer" = None):
+    def __init__(self, source, indexer: "vCardIndexer" = None, stream: bool = False,
+                 encoding: str = "utf-8", properties: Collection[str] = None,
+                 exclude: Collection[str] = None, on_error: str = "raise",
+                 progress: Callable[[Optional[int], int], None] = None, start_offset: int = 0,
+                 keep_raw: bool = False):
+        """
+        Constructs a new instance.
+
+        :param      source:    Source to find .vcf file
+        :type       source:    File descriptor, str or bytes-like object
+        :param      indexer:   The indexer that will be set
+        :type       indexer:   vCardIndexer or None
+        :param      stream:    If True, source will be parsed lazily by iter_vcards
+        :type       stream:    boolean
+        :param      encoding:  Charset of properties without CHARSET parameter (only for bytes sources)
+        :type       encoding:  str
+        :param      properties:  Names of properties to parse, other properties are skipped
+        :type       properties:  collection of str or None
+        :param      exclude:     Names of properties to skip
+        :type       exclude:     collection of str or None
+        :param      on_error:    "raise" - stop parsing at first error, "skip" - skip damaged vCards,
+                                 "collect" - skip damaged vCards and collect errors (see errors())
+        :type       on_error:    str
+        :param      progress:    Function called after every vCard with byte offset after it
+                                 (None for text sources) and count of parsed vCards
+        :type       progress:    callable or None
+        :param      start_offset:  Byte offset to start parsing from, e.g. result of checkpoint()
+                                   (only for bytes sources)
+        :type       start_offset:  int
+        :param      keep_raw:  Keep original folded text of properties, it's written
+                               instead of serialization while property isn't changed
+        :type       keep_raw:  boolean
+        """
+        if on_error not in ON_ERROR_MODES:
+            raise ValueError(f"on_error must be one of {ON_ERROR_MODES}, not {on_error!r}")
         self.indexer = indexer
+        self.encoding = encoding
+        self.projection = _projection(properties, exclude)
+        self.on_error = on_error
+        self.progress = progress
+        self.start_offset = start_offset
+        self.keep_raw = keep_raw
+        self.__errors = []
+        self.__cards = 0
+        self.__checkpoint = None
+        self.__args = None
+        self.__source = None
+        self.__binary = False
         if isinstance(source, str):
             if source.strip() == "":
                 raise vCardValidationError("Empty file")
-            source = source.splitlines(False)
-            source = _unfold_lines(source)
-            self.__args = _parse_lines(source, self.indexer)
+            lines = source.splitlines(False)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            if _NOT_SPACE.search(source) is None:
+                raise vCardValidationError("Empty file")
+            self.__binary = True
+            lines = _iter_byte_lines(source)
         else:
             if hasattr(source, "fileno"):
                 if not source.closed:
-                    fsource = source.read().split("\n")
-                    source.close()
-                    fsource = _unfold_lines(fsource)
-                    self.__args = _parse_lines(fsource, self.indexer)
+                    self.__source = source
+                    self.__binary = isinstance(source, (io.RawIOBase, io.BufferedIOBase))
+                    lines = source
                 else:
                     raise IOError("File is closed")
             else:
                 raise IOError(f"Source is not file, type is {type(source)}")
+        if start_offset:
+            if not self.__binary:
+                if self.__source is not None:
+                    source.close()
+                raise IOError("start_offset is supported only for bytes sources")
+            if self.__source is not None:
+                source.seek(start_offset)
+            else:
+                lines = _iter_byte_lines(memoryview(source)[start_offset:])
+        if self.__binary:
+            self.__checkpoint = start_offset
+        if stream:
+            self.__lines = lines
+        else:
+            if self.__source is not None:
+                if self.__binary:
+                    lines = _iter_byte_lines(source.read())
+                else:
+                    lines = source.read().split("\n")
+                source.close()
+            self.__lines = None
+            self.__args = list(self._parse(lines))
+
+    def _parse(self, lines):
+        position = _LinePosition(self.keep_raw)
+        if self.__binary:
+            assembler = _vCard_ByteAssembler(self.indexer, self.encoding, self.projection,
+                                             self.on_error, position)
+            lines = _iter_unfold_byte_lines(lines, position)
+        else:
+            assembler = _vCard_Assembler(self.indexer, self.projection, self.on_error, position)
+            lines = _iter_unfold_lines(lines, position)
+        self.__errors = assembler.errors
+        return self._track(_iter_parse_lines(lines, assembler=assembler), position)
+
+    def _track(self, vcards, position: _LinePosition):
+        for vcard in vcards:
+            self.__cards += 1
+            if position.end is not None:
+                self.__checkpoint = self.start_offset + position.end
+            if self.progress is not None:
+                self.progress(self.__checkpoint, self.__cards)
+            yield vcard
+
+    def checkpoint(self) -> Optional[int]:
+        """
+        Returns byte offset after the last parsed vCard. Parsing can be resumed
+        from this offset with start_offset argument
+
+        :returns:   byte offset or None for text sources
+        :rtype:     int or None
+        """
+        return self.__checkpoint
+
+    def errors(self) -> List[vCardErrorRecord]:
+        """
+        Returns errors collected in "collect" mode. In streaming mode list is filled
+        while vCards are iterated
+
+        :returns:   errors of damaged vCards
+        :rtype:     list of vCardErrorRecord
+        """
+        return list(self.__errors)
+
+    def iter_vcards(self):
+        """
+        Yields vCard objects one by one. In streaming mode the source is read
+        and unfolded incrementally, so only the current vCard is kept in memory
+
+        :returns:   generator of parsing results
+        :rtype:     generator of vCard
+        """
+        if self.__args is not None:
+            yield from self.__args
+            return
+        if self.__lines is None:
+            raise IOError("Source was already consumed")
+        lines = self.__lines
+        self.__lines = None
+        try:
+            yield from self._parse(lines)
+        finally:
+            if self.__source is not None:
+                self.__source.close()
+
+    def _results(self):
+        if self.__args is None:
+            self.__args = list(self.iter_vcards())
+        return self.__args
 
     def vcards(self) -> "pyvcard.vobject.containers.vCardSet":
         """
         :returns:   result of parsing
         :rtype:     vCardSet
         """
-        return pyvcard.vobject.containers.vCardSet(self.__args, indexer=self.indexer)
+        return pyvcard.vobject.containers.vCardSet(self._results(), indexer=self.indexer)
 
     def vcard_list(self) -> "pyvcard.vobject.containers.vCardList":
         """
         :returns:   ordered result of parsing
         :rtype:     vCardList
         """
-        return pyvcard.vobject.containers.vCardList(self.__args, indexer=self.indexer)
-
-
-
+        return pyvcard.vobject.containers.vCardList(self._results(), indexer=self.indexer)
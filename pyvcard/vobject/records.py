@@ -0,0 +1,86 @@
+import io
+from collections import namedtuple
+from typing import Collection, Iterator
+
+from pyvcard.enums import _STATE
+from pyvcard.utils import _iter_unfold_lines, _iter_byte_lines, _iter_unfold_byte_lines
+from pyvcard.vobject.parsing import _parse_line, _parse_byte_line, _projection
+
+vCardRecord = namedtuple("vCardRecord", ["card_no", "group", "name", "params", "values", "encoded"])
+vCardRecord.__new__.__defaults__ = (False,)
+vCardRecord.__doc__ = """
+Raw property record: vCard number in source, group, name, parameters, values
+and flag that values are still encoded by ENCODING parameter (quoted-printable or base64).
+vCard borders are yielded as records with names BEGIN and END
+"""
+
+
+def _iter_parsed(source, encoding: str = "utf-8", properties: Collection[str] = None,
+                 exclude: Collection[str] = None):
+    """
+    Utility method. Don't recommend for use in outer code
+    Yields parsing results of unfolded lines of source and flags that values are still encoded
+    """
+    if isinstance(source, str):
+        binary = False
+        lines = source.splitlines(False)
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        binary = True
+        lines = _iter_byte_lines(source)
+    elif hasattr(source, "fileno"):
+        if source.closed:
+            raise IOError("File is closed")
+        binary = isinstance(source, (io.RawIOBase, io.BufferedIOBase))
+        lines = source
+    else:
+        raise IOError(f"Source is not file, type is {type(source)}")
+    projection = _projection(properties, exclude)
+    version = "4.0"
+    if binary:
+        lines = _iter_unfold_byte_lines(lines)
+    else:
+        lines = _iter_unfold_lines(lines)
+    for line in lines:
+        if projection is not None and not projection.accepts_line(line):
+            continue
+        if binary:
+            parsed, encoded = _parse_byte_line(line, version, encoding)
+        else:
+            parsed, encoded = _parse_line(line, version), True
+        if isinstance(parsed, tuple) and parsed[0] == "VERSION":
+            version = "".join(parsed[1])
+        yield parsed, encoded
+
+
+def iter_records(source, encoding: str = "utf-8", properties: Collection[str] = None,
+                 exclude: Collection[str] = None) -> Iterator[vCardRecord]:
+    """
+    Yields raw property records of vCard source without creating vCard objects.
+    Records aren't validated. Bytes sources are decoded by CHARSET parameter
+    and quoted-printable values are decoded too, like in vCard_Parser,
+    other encoded values are returned as is: check encoded flag of record
+
+    :param      source:      Source of vCards
+    :type       source:      File descriptor, str or bytes-like object
+    :param      encoding:    Charset of properties without CHARSET parameter (only for bytes sources)
+    :type       encoding:    str
+    :param      properties:  Names of properties to yield, other properties are skipped
+    :type       properties:  collection of str or None
+    :param      exclude:     Names of properties to skip
+    :type       exclude:     collection of str or None
+
+    :returns:   generator of records
+    :rtype:     generator of vCardRecord
+    """
+    card_no = -1
+    for parsed, encoded in _iter_parsed(source, encoding, properties, exclude):
+        if parsed == _STATE.BEGIN:
+            card_no += 1
+            yield vCardRecord(card_no, None, "BEGIN", {}, ["VCARD"])
+        elif parsed == _STATE.END:
+            yield vCardRecord(card_no, None, "END", {}, ["VCARD"])
+        elif parsed:
+            name, values, params, group = parsed
+            if group is not None and group.endswith("."):
+                group = group[:-1]
+            yield vCardRecord(card_no, group, name, params, values, encoded and "ENCODING" in params)
@@ -1,13 +1,24 @@
-from typing import Dict, Union, List, Collection
+import hashlib
+import weakref
+from collections import deque, namedtuple
+from typing import Callable, Dict, Union, List, Collection, Iterator, Tuple
 
 from pyvcard.enums import VERSION
 from pyvcard.validator import validate_property
 from pyvcard.datatypes import define_type
 from pyvcard.utils import quoted_to_str, base64_decode, strinteger, \
-    base64_encode, str_to_quoted, escape, _fold_line
+    base64_encode, str_to_quoted, escape, _fold_line, _write_lines
 
 validate_vcards = True
 
+vCardChange = namedtuple("vCardChange", ["action", "position", "old", "new"])
+vCardChange.__doc__ = """
+Change of vCard recorded in its journal: action (add, remove, replace, set_values,
+set_param or remove_param), position of property, old property (None for add)
+and new property (None for remove). Old property of set_values, set_param and remove_param
+is a copy of property before change
+"""
+
 
 def decode_property(property: "vCard_entry"):
     """
@@ -21,19 +32,40 @@ def decode_property(property: "vCard_entry"):
     if "CHARSET" in property._params:
         charset = property._params["CHARSET"].lower()
     if "ENCODING" in property._params:
-        for i in range(len(property._values)):
+        values = list(property._values)
+        for i in range(len(values)):
             if property._params["ENCODING"].upper() == "QUOTED-PRINTABLE":
-                if property._values[i] != '':
-                    property._values[i] = quoted_to_str(property._values[i], charset, property)
+                if values[i] != '':
+                    values[i] = quoted_to_str(values[i], charset, property)
             elif property._params["ENCODING"].upper() in ["B", "BASE64"]:
-                if property._values[i] != '':
-                    property._values[i] = base64_decode(property._values[i].encode(charset), property)
+                if values[i] != '':
+                    values[i] = base64_decode(values[i].encode(charset), property)
+        property._values = tuple(values)
+
+
+class _FrozenParams(dict):
+    """
+    Utility class. Don't recommend for use in outer code
+    Immutable parameters of property, one instance can be shared by many properties
+    """
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Parameters of property are immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
 
 
 class vCard_entry:
     """
     This class describes a vCard property
     """
+    __slots__ = ("_name", "_params", "_values", "_group", "_version", "_encoding_flag",
+                 "_escaping_flag", "_pending_decode", "_typedvalue", "_fingerprint", "_raw", "_owner")
 
     def __init__(self, name: str, values: List[str],
                  params: Dict[str, str] = {},
@@ -57,53 +89,83 @@ class vCard_entry:
         :type       encoded:  boolean
         """
         self._name = name
-        self._params = params
+        if type(params) is _FrozenParams:
+            self._params = params
+        else:
+            self._params = _FrozenParams(params)
         self._encoding_flag = True
         self._escaping_flag = True
+        self._pending_decode = False
+        # typed value is cached, validator sets it when value was parsed during validation
+        self._typedvalue = None
+        self._fingerprint = None
+        # original folded text, parser sets it if it keeps raw text
+        self._raw = None
+        # weak reference to vCard, that is notified about changes of property
+        self._owner = None
         if isinstance(values, str):
-            self._values = [values]
+            self._values = (values,)
         else:
-            self._values = list(values)
+            self._values = tuple(values)
         self._group = group
         if self._group is not None:
             if self._group.endswith("."):
                 self._group = group[:-1]
         if validate_vcards:
             validate_property(self, version)
-        if encoded is True:
-            decode_property(self)
+        if encoded is True and "ENCODING" in self._params:
+            # values are decoded at first access
+            self._pending_decode = True
         self._version = version
 
+    def _decode(self):
+        """
+        Utility method. Don't recommend for use in outer code
+        Decodes values if it wasn't done yet
+        """
+        if self._pending_decode:
+            self._pending_decode = False
+            decode_property(self)
+
     def __bool__(self):
         return True
 
     def __eq__(self, other: "vCard_entry"):
         if id(self) == id(other):
             return True
-        if type(self) != type(other):
+        if not isinstance(other, vCard_entry):
             return False
-        if self._name != other._name:
-            return False
-        if self._params != other._params:
-            return False
-        if self._group != other._group:
-            return False
-        if self._values != other._values:
-            return False
-        if self._version != other._version:
-            return False
-        return True
+        return self.fingerprint == other.fingerprint
 
     def __hash__(self):
-        hashcode = 0
-        hashcode += hash(self._name)
-        for key in self._params:
-            hashcode += hash(self._params[key])
-        for i in self._values:
-            hashcode += hash(i)
-        hashcode += hash(self._group)
-        hashcode += hash(self._version)
-        return hashcode
+        return hash(self.fingerprint)
+
+    def _canonical(self) -> str:
+        """
+        Utility method. Don't recommend for use in outer code
+        Returns canonical serialization of property content
+        """
+        if "ENCODING" in self._params and self._params["ENCODING"].upper() in ["B", "BASE64"]:
+            # base64 values are compared encoded, so never decoded value isn't decoded
+            if self._pending_decode:
+                values = self._values
+            else:
+                values = tuple(base64_encode(i) if isinstance(i, bytes) else i for i in self._values)
+        else:
+            self._decode()
+            values = self._values
+        return repr((self._version, self._group, self._name, tuple(self._params.items()), values))
+
+    @property
+    def fingerprint(self) -> bytes:
+        """
+        Returns digest of property content. It is computed once and used for hashing and equality
+        """
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.blake2b(
+                self._canonical().encode("utf-8", "surrogatepass"), digest_size=16
+            ).digest()
+        return self._fingerprint
 
     def repr_vcard(self, encode: bool = True):
         """
@@ -112,6 +174,9 @@ class vCard_entry:
         :param      encode:  encode property (like bytes, or quoted-printable)
         :type       encode:  boolean
         """
+        if self._raw is not None and encode:
+            # property wasn't changed after parsing
+            return self._raw
         if self.group is not None:
             string = f"{self.group}."
         else:
@@ -123,6 +188,10 @@ class vCard_entry:
                 string += f"{i}={self._params[i].upper()}"
             else:
                 string += i
+        if self._pending_decode and encode and self._params["ENCODING"].upper() in ["B", "BASE64"]:
+            # never decoded value is written as it was read
+            return _fold_line(string + ":" + ";".join(self._values))
+        self._decode()
         values = list(self._values)
         expect_quopri = False
         if not self._encoding_flag:
@@ -156,7 +225,8 @@ class vCard_entry:
 
     @property
     def params(self):
-        return dict(self._params)
+        # parameters are immutable, so they are returned without copying
+        return self._params
 
     @property
     def group(self):
@@ -164,31 +234,229 @@ class vCard_entry:
 
     @property
     def typedvalue(self):
-        return define_type(self)
+        if self._typedvalue is None:
+            self._typedvalue = define_type(self)
+        return self._typedvalue
 
     @property
     def values(self):
-        return tuple(self._values)
+        self._decode()
+        return self._values
 
     @property
     def value(self):
+        self._decode()
         return self._values[0]
 
+    def _changed(self):
+        """
+        Utility method. Don't recommend for use in outer code
+        Drops cached data of property after mutation
+        """
+        self._typedvalue = None
+        self._fingerprint = None
+        self._raw = None
+
+    def _update(self, values, params, action: str = "set_values"):
+        """
+        Utility method. Don't recommend for use in outer code
+        Sets values and parameters, old state is restored if new state isn't valid.
+        vCard, that owns property, is notified about change
+        """
+        self._decode()
+        owner = self._owner() if self._owner is not None else None
+        old = self._copy() if owner is not None else None
+        old_values, old_params = self._values, self._params
+        self._values, self._params = values, params
+        self._changed()
+        if validate_vcards:
+            try:
+                validate_property(self, self._version)
+            except Exception:
+                self._values, self._params = old_values, old_params
+                self._changed()
+                raise
+        if owner is not None:
+            owner._entry_changed(action, self, old)
+
+    def __getstate__(self):
+        # vCard, that owns property, restores the reference after unpickling
+        return None, {slot: getattr(self, slot) for slot in vCard_entry.__slots__ if slot != "_owner"}
+
+    def __setstate__(self, state):
+        for slot, value in state[1].items():
+            setattr(self, slot, value)
+        self._owner = None
+
+    def set_values(self, values: Union[str, Collection[str]]):
+        """
+        Replaces values of property. Values are set decoded, if property has ENCODING parameter
+        they will be encoded at serialization
+
+        :param      values:  The values
+        :type       values:  str or collection of str
+        """
+        if isinstance(values, (str, bytes)):
+            values = (values,)
+        self._update(tuple(values), self._params)
+
+    def set_param(self, name: str, value: str = None):
+        """
+        Sets parameter of property
+
+        :param      name:   The parameter name
+        :type       name:   str
+        :param      value:  The parameter value, None for parameters without value (vCard 2.1)
+        :type       value:  str or None
+        """
+        params = dict(self._params)
+        params[name] = value
+        self._update(self._values, _FrozenParams(params), "set_param")
+
+    def remove_param(self, name: str):
+        """
+        Removes parameter of property
+
+        :param      name:   The parameter name
+        :type       name:   str
+
+        :raises     KeyError: parameter doesn't exist
+        """
+        params = dict(self._params)
+        del params[name]
+        self._update(self._values, _FrozenParams(params), "remove_param")
+
+    def _copy(self, cls: type = None) -> "vCard_entry":
+        """
+        Utility method. Don't recommend for use in outer code
+        Returns shallow copy of property without validation and decoding,
+        copy can have other class (frozen or mutable property)
+        """
+        clone = object.__new__(cls or type(self))
+        for slot in vCard_entry.__slots__:
+            setattr(clone, slot, getattr(self, slot))
+        clone._owner = None
+        return clone
+
     def __repr__(self):
         reprval = ";".join(self.values)
         return f"<{self._name} property: {reprval}>"
 
 
+class _FrozenEntry(vCard_entry):
+    """
+    Utility class. Don't recommend for use in outer code
+    Immutable property of FrozenvCard, its values are decoded when it's created,
+    so it can be shared by many vCards and threads
+    """
+    __slots__ = ()
+
+    def _update(self, values, params, action: str = "set_values"):
+        raise TypeError("Property of frozen vCard is immutable")
+
+    def _replaced(self, values, params) -> "_FrozenEntry":
+        """
+        Utility method. Don't recommend for use in outer code
+        Returns new frozen property with other values and parameters, only it is validated
+        """
+        clone = self._copy()
+        vCard_entry._update(clone, values, params)
+        return clone
+
+
+def _freeze_entry(entry: vCard_entry) -> _FrozenEntry:
+    """
+    Utility method. Don't recommend for use in outer code
+    Returns frozen copy of property, frozen properties are returned as is
+    """
+    if type(entry) is _FrozenEntry:
+        return entry
+    entry._decode()
+    return entry._copy(_FrozenEntry)
+
+
+class _vCardJournal:
+    """
+    Utility class. Don't recommend for use in outer code
+    Changes and subscribers of vCard, changes are kept only if journaling is enabled
+    """
+    __slots__ = ("changes", "subscribers")
+
+    def __init__(self):
+        self.changes = None
+        self.subscribers = []
+
+
 class vCard:
     """
     This class describes a vCard object representation.
     """
+    __slots__ = ("_attrs", "_indexer", "_version", "_fingerprint", "_names", "_contact", "_journal",
+                 "__weakref__")
 
-    def __init__(self, args: Collection[vCard_entry] = [],
+    def __init__(self, args: Collection[vCard_entry] = (),
                  version: str = None):
-        self._attrs = args
         self._indexer = None
         self._version = version
+        # journal is created when journaling is enabled or callback is subscribed
+        self._journal = None
+        self._changed()
+        self._attrs = self._own(args)
+
+    def __setstate__(self, state):
+        for slot, value in state[1].items():
+            setattr(self, slot, value)
+        self._attrs = self._own(self._attrs)
+
+    def _own(self, entries: Collection[vCard_entry]) -> Tuple[vCard_entry]:
+        """
+        Utility method. Don't recommend for use in outer code
+        Sets vCard as owner of properties, changes of properties drop cached data of vCard.
+        Property can be owned by one vCard, so properties owned by other vCard are copied.
+        Frozen properties are immutable and shared without owner
+        """
+        ref = weakref.ref(self)
+        owned = []
+        for entry in entries:
+            if not isinstance(entry, _FrozenEntry):
+                owner = entry._owner() if entry._owner is not None else None
+                if owner is not None and owner is not self:
+                    entry = entry._copy()
+                entry._owner = ref
+            owned.append(entry)
+        return tuple(owned)
+
+    def _changed(self):
+        """
+        Utility method. Don't recommend for use in outer code
+        Drops cached data of vCard after its properties were changed
+        """
+        self._fingerprint = None
+        self._names = None
+        self._contact = None
+
+    def _positions(self, name: str) -> List[int]:
+        """
+        Utility method. Don't recommend for use in outer code
+        Returns positions of properties with name, map of names is built at first call
+        """
+        if self._names is None:
+            names = {}
+            for i, entry in enumerate(self._attrs):
+                if entry._name in names:
+                    names[entry._name].append(i)
+                else:
+                    names[entry._name] = [i]
+            self._names = names
+        return self._names.get(name, ())
+
+    def _by_name(self, name: str) -> List[vCard_entry]:
+        """
+        Utility method. Don't recommend for use in outer code
+        Returns properties with name in order of vCard
+        """
+        attrs = self._attrs
+        return [attrs[i] for i in self._positions(name)]
 
     def __bool__(self):
         return True
@@ -204,44 +472,27 @@ class vCard:
     def __eq__(self, other):
         if id(self) == id(other):
             return True
-        if type(self) != type(other):
-            return False
-        if self.contact_data() != other.contact_data():
-            return False
-        if len(self) != len(other):
-            return False
-        for i in range(len(self)):
-            if self[i] != other[i]:
-                return False
-        if self.indexer != other.indexer:
-            return False
-        if self.version != other.version:
+        if not isinstance(other, vCard):
             return False
-        return True
+        return self.fingerprint == other.fingerprint
 
     def __hash__(self):
-        hashcode = 0
-        if self._indexer is None:
-            hashcode += 0
-        else:
-            hashcode += hash(self._indexer)
-        if self._version is None:
-            hashcode += 0
-        else:
-            hashcode += hash(self._indexer)
-        for i in self:
-            hashcode += hash(i)
-        contact = self.contact_data()
-        for i in contact:
-            if isinstance(contact[i], list) or isinstance(contact[i], tuple):
-                for k in contact[i]:
-                    hashcode += hash(k)
-            elif isinstance(contact[i], dict):
-                for k in contact[i]:
-                    hashcode += hash(contact[i][k])
-            else:
-                hashcode += hash(contact[i])
-        return hashcode
+        return hash(self.fingerprint)
+
+    @property
+    def fingerprint(self) -> bytes:
+        """
+        Returns digest of vCard content (version and properties in order).
+        It is computed once from fingerprints of properties and used for hashing and equality,
+        it can be used as a key for deduplication and caching.
+        Digest is computed again after changes of vCard or its properties
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(repr(self._version).encode("utf-8"), digest_size=16)
+            for entry in self._attrs:
+                digest.update(entry.fingerprint)
+            self._fingerprint = digest.digest()
+        return self._fingerprint
 
     def contact_data(self):
         """
@@ -252,49 +503,277 @@ class vCard:
         If one of value is not defined - they equal None
         Returns a dict with keys "name", "number", "struct_name"
         """
-        obj = dict.fromkeys(["name", "number", "struct_name"], None)
-        obj["number"] = []
-        for i in self:
-            if i.name == "FN":
-                obj["name"] = i.values[0]
-            elif i.name == "TEL":
-                obj["number"].append(strinteger(i.values[0]))
-            elif i.name == "N":
-                obj["struct_name"] = parse_name_property(i.values)
+        if self._contact is None:
+            self._contact = {
+                "name": self.contact_name(),
+                "number": self.contact_number(),
+                "struct_name": self.contact_structname()
+            }
+        # result is copied, so memoized data can't be changed
+        obj = dict(self._contact)
+        obj["number"] = list(obj["number"])
+        if obj["struct_name"] is not None:
+            obj["struct_name"] = dict(obj["struct_name"])
         return obj
 
     def contact_name(self):
         """
         Returns full name in vCard or None
         """
-        name = None
-        for i in self:
-            if i.name == "FN":
-                name = i.values[0]
-        return name
+        positions = self._positions("FN")
+        if positions:
+            return self._attrs[positions[-1]].values[0]
+        return None
 
     def contact_structname(self):
         """
         Returns dict with structured name or None
         """
-        name = None
-        for i in self:
-            if i.name == "N":
-                name = parse_name_property(i.values)
-        return name
+        positions = self._positions("N")
+        if positions:
+            return parse_name_property(self._attrs[positions[-1]].values)
+        return None
 
     def contact_number(self):
         """
         Returns a list with phone numbers in vCard
         """
-        name = []
-        for i in self:
-            if i.name == "TEL":
-                name.append(strinteger(i.values[0]))
-        return name
+        return [strinteger(i.values[0]) for i in self._by_name("TEL")]
 
     def _set_version(self, version: str):
         self._version = version
+        self._changed()
+
+    def _matches(self, key: Union[str, vCard_entry]) -> List[int]:
+        """
+        Utility method. Don't recommend for use in outer code
+        Returns positions of properties with name or position of property object
+        """
+        if is_vcard_property(key):
+            return [i for i, entry in enumerate(self._attrs) if entry is key]
+        return list(self._positions(key))
+
+    def _record(self, action: str, position: int, old, new) -> None:
+        """
+        Utility method. Don't recommend for use in outer code
+        Drops cached data, writes change to journal and notifies indexer and subscribers
+        """
+        self._changed()
+        journal = self._journal
+        if self._indexer is None and journal is None:
+            return
+        change = vCardChange(action, position, old, new)
+        if self._indexer is not None:
+            self._indexer.apply_change(self, change)
+        if journal is not None:
+            if journal.changes is not None:
+                journal.changes.append(change)
+            for callback in journal.subscribers:
+                callback(self, change)
+
+    def _entry_changed(self, action: str, entry: vCard_entry, old: vCard_entry) -> None:
+        """
+        Utility method. Don't recommend for use in outer code
+        Records change of owned property made by its methods
+        """
+        for i, attr in enumerate(self._attrs):
+            if attr is entry:
+                self._record(action, i, old, entry)
+                return
+        # property was removed from vCard
+        entry._owner = None
+
+    def enable_journal(self, maxlen: int = 1024) -> None:
+        """
+        Starts recording of changes to journal. Journal is bounded, the oldest changes are dropped
+
+        :param      maxlen:  The maximum count of recorded changes
+        :type       maxlen:  int
+        """
+        if self._journal is None:
+            self._journal = _vCardJournal()
+        changes = self._journal.changes or ()
+        self._journal.changes = deque(changes, maxlen=maxlen)
+
+    def disable_journal(self) -> None:
+        """
+        Stops recording of changes and removes recorded changes, subscribers are kept
+        """
+        if self._journal is not None:
+            self._journal.changes = None
+
+    @property
+    def journal(self) -> Tuple[vCardChange]:
+        """
+        Returns recorded changes in order (journal is empty, if it isn't enabled)
+        """
+        if self._journal is None or self._journal.changes is None:
+            return ()
+        return tuple(self._journal.changes)
+
+    def drain_journal(self) -> Tuple[vCardChange]:
+        """
+        Returns recorded changes and removes them from journal
+        """
+        changes = self.journal
+        self.clear_journal()
+        return changes
+
+    def clear_journal(self) -> None:
+        """
+        Removes recorded changes, subscribers are kept
+        """
+        if self._journal is not None and self._journal.changes is not None:
+            self._journal.changes.clear()
+
+    def subscribe(self, callback: Callable[["vCard", vCardChange], None]) -> None:
+        """
+        Subscribes callback to changes of vCard, it's called after every change
+
+        :param      callback:  The callback, takes vCard and change
+        :type       callback:  callable
+        """
+        if self._journal is None:
+            self._journal = _vCardJournal()
+        self._journal.subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[["vCard", vCardChange], None]) -> None:
+        """
+        Unsubscribes callback from changes of vCard
+
+        :param      callback:  The callback
+        :type       callback:  callable
+
+        :raises     ValueError: callback isn't subscribed
+        """
+        if self._journal is None:
+            raise ValueError("Callback isn't subscribed")
+        self._journal.subscribers.remove(callback)
+
+    def add(self, name: Union[str, vCard_entry], values: Union[str, Collection[str]] = None,
+            params: Dict[str, str] = {}, group: str = None) -> vCard_entry:
+        """
+        Adds property to the end of vCard.
+        Mutation methods change fingerprint (and hash) of vCard,
+        don't change vCards stored in vCardSet
+
+        :param      name:    The property name or property object
+        :type       name:    str or vCard_entry
+        :param      values:  The decoded values (if name is str)
+        :type       values:  str or collection of str
+        :param      params:  The parameters (if name is str)
+        :type       params:  dict
+        :param      group:   The group (if name is str)
+        :type       group:   str or None
+
+        :returns:   added property, property object is copied if it's owned by vCard
+        :rtype:     vCard_entry
+        """
+        if is_vcard_property(name):
+            if type(name) is vCard_entry and name._owner is None:
+                entry = name
+            else:
+                entry = name._copy(vCard_entry)
+        else:
+            if values is None:
+                raise ValueError("Values of property are required")
+            entry = vCard_entry(name.upper(), values, params, group,
+                                version=self._version or "4.0", encoded=False)
+        entry, = self._own((entry,))
+        self._attrs = self._attrs + (entry,)
+        self._record("add", len(self._attrs) - 1, None, entry)
+        return entry
+
+    def remove(self, key: Union[str, vCard_entry]) -> Tuple[vCard_entry]:
+        """
+        Removes properties from vCard, changes are recorded from the last position
+
+        :param      key:  The property name (all properties with name are removed) or property object
+        :type       key:  str or vCard_entry
+
+        :returns:   removed properties
+        :rtype:     tuple
+
+        :raises     KeyError: property doesn't exist
+        """
+        positions = self._matches(key)
+        if not positions:
+            raise KeyError(key)
+        removed = []
+        for i in reversed(positions):
+            entry = self._attrs[i]
+            self._attrs = self._attrs[:i] + self._attrs[i + 1:]
+            entry._owner = None
+            self._record("remove", i, entry, None)
+            removed.append(entry)
+        return tuple(reversed(removed))
+
+    def replace(self, key: Union[str, vCard_entry], values: Union[str, Collection[str]] = None,
+                params: Dict[str, str] = None) -> Tuple[vCard_entry]:
+        """
+        Replaces properties with new property objects, that have other values or parameters
+
+        :param      key:     The property name (all properties with name are replaced) or property object
+        :type       key:     str or vCard_entry
+        :param      values:  The decoded values, None keeps old values
+        :type       values:  str or collection of str or None
+        :param      params:  The parameters, None keeps old parameters
+        :type       params:  dict or None
+
+        :returns:   new properties
+        :rtype:     tuple
+
+        :raises     KeyError: property doesn't exist
+        """
+        positions = self._matches(key)
+        if not positions:
+            raise KeyError(key)
+        if isinstance(values, (str, bytes)):
+            values = (values,)
+        elif values is not None:
+            values = tuple(values)
+        if params is not None and type(params) is not _FrozenParams:
+            params = _FrozenParams(params)
+        attrs = list(self._attrs)
+        replaced = []
+        for i in positions:
+            old = attrs[i]
+            new = old._copy(vCard_entry)
+            new._update(old.values if values is None else values,
+                        old._params if params is None else params)
+            attrs[i] = new
+            self._attrs = tuple(attrs)
+            old._owner = None
+            self._own((new,))
+            self._record("replace", i, old, new)
+            replaced.append(new)
+        return tuple(replaced)
+
+    def set_values(self, key: Union[str, vCard_entry], values: Union[str, Collection[str]]) -> None:
+        """
+        Sets values of properties in place (property objects are kept)
+
+        :param      key:     The property name (all properties with name are changed) or property object
+        :type       key:     str or vCard_entry
+        :param      values:  The decoded values
+        :type       values:  str or collection of str
+
+        :raises     KeyError: property doesn't exist
+        """
+        positions = self._matches(key)
+        if not positions:
+            raise KeyError(key)
+        for i in positions:
+            # change is recorded by vCard, that owns property
+            self._attrs[i].set_values(values)
+
+    def freeze(self) -> "FrozenvCard":
+        """
+        Returns immutable copy of vCard, properties are copied once without validation
+        """
+        vcard = FrozenvCard(self._attrs, self._version)
+        vcard._indexer = self._indexer
+        return vcard
 
     def __repr__(self):
         if self._version is not None:
@@ -312,12 +791,34 @@ class vCard:
         :param      encode:  encode property (like bytes, or quoted-printable)
         :type       encode:  boolean
         """
-        string = "BEGIN:VCARD"
-        for i in self:
-            string += "\n"
-            string += i.repr_vcard(encode)
-        string += "\nEND:VCARD"
-        return string
+        return "\n".join(self.iter_lines(encode))
+
+    def iter_lines(self, encode: bool = True) -> Iterator[str]:
+        """
+        Yields lines of vCard representation (folded, without line endings)
+
+        :param      encode:  encode property (like bytes, or quoted-printable)
+        :type       encode:  boolean
+        """
+        yield "BEGIN:VCARD"
+        for entry in self._attrs:
+            yield from entry.repr_vcard(encode).split("\n")
+        yield "END:VCARD"
+
+    def write_to(self, fp, encoding: str = "utf-8", newline: str = "\r\n", encode: bool = True) -> None:
+        """
+        Writes vCard to file object without building the whole string
+
+        :param      fp:        The file object
+        :type       fp:        text or binary file object
+        :param      encoding:  The encoding (only for binary files)
+        :type       encoding:  str
+        :param      newline:   The line ending
+        :type       newline:   str
+        :param      encode:    encode property (like bytes, or quoted-printable)
+        :type       encode:    boolean
+        """
+        _write_lines(fp, self.iter_lines(encode), encoding, newline)
 
     def __len__(self):
         return len(self._attrs)
@@ -348,10 +849,7 @@ class vCard:
 
         :returns:   vCard entry object (array or single element (if not prefer_array))
         """
-        arr = []
-        for i in self._attrs:
-            if i.name == key:
-                arr.append(i)
+        arr = self._by_name(key)
         if len(arr) == 1 and not prefer_array:
             return arr[0]
         else:
@@ -359,10 +857,7 @@ class vCard:
 
     def __contains__(self, key: str):
         if not is_vcard_property(key):
-            for i in self._attrs:
-                if i.name == key:
-                    return True
-            return False
+            return len(self._positions(key)) > 0
         else:
             return key in self._attrs
 
@@ -371,7 +866,7 @@ class vCard:
 
     @property
     def properties(self):
-        return tuple(self._attrs)
+        return self._attrs
 
     def find_by_group(self, group: str,
                       case: bool = False,
@@ -430,16 +925,15 @@ class vCard:
         else:
             if not case:
                 fn = fn.lower()
-            for i in self._attrs:
-                if i.name == "FN":
-                    if not case:
-                        value = i.values[0].lower()
-                    else:
-                        value = i.values[0]
-                    if value == fn and fullmatch:
-                        return [self]
-                    elif fn in value and not fullmatch:
-                        return [self]
+            for i in self._by_name("FN"):
+                if not case:
+                    value = i.values[0].lower()
+                else:
+                    value = i.values[0]
+                if value == fn and fullmatch:
+                    return [self]
+                elif fn in value and not fullmatch:
+                    return [self]
             return []
 
     def find_by_phone(self, number: Union[str, int],
@@ -461,16 +955,15 @@ class vCard:
             return self._indexer.find_by_phone(number, fullmatch, parsestr)
         else:
             r = []
-            for i in self._attrs:
-                if i.name == "TEL":
-                    if parsestr:
-                        value = strinteger(i.values[0])
-                    else:
-                        value = i.values[0]
-                    if str(value) == str(number) and fullmatch:
-                        r.append(self)
-                    elif str(number) in str(value) and not fullmatch:
-                        r.append(self)
+            for i in self._by_name("TEL"):
+                if parsestr:
+                    value = strinteger(i.values[0])
+                else:
+                    value = i.values[0]
+                if str(value) == str(number) and fullmatch:
+                    r.append(self)
+                elif str(number) in str(value) and not fullmatch:
+                    r.append(self)
             return r
 
     def find_by_phone_endswith(self, number: Union[str, int],
@@ -490,14 +983,13 @@ class vCard:
             return self._indexer.find_by_phone_endswith(number, parsestr)
         else:
             r = []
-            for i in self._attrs:
-                if i.name == "TEL":
-                    if parsestr:
-                        value = strinteger(i.values[0])
-                    else:
-                        value = i.values[0]
-                    if str(value).endswith(str(number)):
-                        r.append(self)
+            for i in self._by_name("TEL"):
+                if parsestr:
+                    value = strinteger(i.values[0])
+                else:
+                    value = i.values[0]
+                if str(value).endswith(str(number)):
+                    r.append(self)
             return r
 
     def repr(self):
@@ -523,14 +1015,13 @@ class vCard:
             return self._indexer.find_by_phone_startswith(number, parsestr)
         else:
             r = []
-            for i in self._attrs:
-                if i.name == "TEL":
-                    if parsestr:
-                        value = strinteger(i.values[0])
-                    else:
-                        value = i.values[0]
-                    if str(value).startswith(str(number)):
-                        r.append(self)
+            for i in self._by_name("TEL"):
+                if parsestr:
+                    value = strinteger(i.values[0])
+                else:
+                    value = i.values[0]
+                if str(value).startswith(str(number)):
+                    r.append(self)
             return r
 
     def find_by_property(self, paramname: str, value: Union[str, List[str]],
@@ -553,19 +1044,18 @@ class vCard:
         else:
             if hasattr(value, "__iter__") and not isinstance(value, str):
                 value = ";".join(value)
-            for i in self._attrs:
-                if i.name == paramname:
-
-                    def type_convert(x):
-                        if isinstance(x, bytes):
-                            return base64_encode(x)
-                        else:
-                            return str(x)
-                    ivalues = list(map(type_convert, i.values))
-                    if ";".join(ivalues) == value and fullmatch:
-                        return [self]
-                    elif value in ";".join(ivalues) and not fullmatch:
-                        return [self]
+            for i in self._by_name(paramname):
+
+                def type_convert(x):
+                    if isinstance(x, bytes):
+                        return base64_encode(x)
+                    else:
+                        return str(x)
+                ivalues = list(map(type_convert, i.values))
+                if ";".join(ivalues) == value and fullmatch:
+                    return [self]
+                elif value in ";".join(ivalues) and not fullmatch:
+                    return [self]
             return []
 
     def find_by_value(self, value: str,
@@ -592,6 +1082,119 @@ class vCard:
             return result
 
 
+class FrozenvCard(vCard):
+    """
+    This class describes an immutable vCard.
+    Methods with_property, without and replace return new vCards, that share
+    all untouched property objects with this vCard, so changes cost O(changes) allocations.
+    Frozen vCards and their properties can be shared across threads
+    """
+    __slots__ = ()
+
+    def __init__(self, args: Collection[vCard_entry] = (),
+                 version: str = None):
+        super().__init__([_freeze_entry(entry) for entry in args], version)
+
+    @classmethod
+    def _shared(cls, attrs: tuple, version: str, indexer=None) -> "FrozenvCard":
+        """
+        Utility method. Don't recommend for use in outer code
+        Creates vCard from tuple of frozen properties without copying them
+        """
+        vcard = object.__new__(cls)
+        vcard._attrs = attrs
+        vcard._indexer = indexer
+        vcard._version = version
+        vcard._journal = None
+        vcard._changed()
+        return vcard
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Frozen vCard is immutable")
+
+    add = remove = set_values = subscribe = enable_journal = _immutable
+
+    def freeze(self) -> "FrozenvCard":
+        return self
+
+    def thaw(self) -> vCard:
+        """
+        Returns mutable copy of vCard, properties are copied too
+        """
+        vcard = vCard([entry._copy(vCard_entry) for entry in self._attrs], self._version)
+        vcard._indexer = self._indexer
+        return vcard
+
+    def with_property(self, name: Union[str, vCard_entry], values: Union[str, Collection[str]] = None,
+                      params: Dict[str, str] = {}, group: str = None) -> "FrozenvCard":
+        """
+        Returns new vCard with added property, other properties are shared
+
+        :param      name:    The property name or property object
+        :type       name:    str or vCard_entry
+        :param      values:  The decoded values (if name is str)
+        :type       values:  str or collection of str
+        :param      params:  The parameters (if name is str)
+        :type       params:  dict
+        :param      group:   The group (if name is str)
+        :type       group:   str or None
+        """
+        if is_vcard_property(name):
+            entry = _freeze_entry(name)
+        else:
+            if values is None:
+                raise ValueError("Values of property are required")
+            entry = _FrozenEntry(name.upper(), values, params, group,
+                                 version=self._version or "4.0", encoded=False)
+        return self._shared(self._attrs + (entry,), self._version, self._indexer)
+
+    def without(self, key: Union[str, vCard_entry]) -> "FrozenvCard":
+        """
+        Returns new vCard without properties, other properties are shared.
+        If nothing was removed, this vCard is returned
+
+        :param      key:  The property name (all properties with name are removed) or property object
+        :type       key:  str or vCard_entry
+        """
+        positions = self._matches(key)
+        if not positions:
+            return self
+        removed = set(positions)
+        attrs = tuple(entry for i, entry in enumerate(self._attrs) if i not in removed)
+        return self._shared(attrs, self._version, self._indexer)
+
+    def replace(self, key: Union[str, vCard_entry], values: Union[str, Collection[str]] = None,
+                params: Dict[str, str] = None) -> "FrozenvCard":
+        """
+        Returns new vCard where matched properties have other values or parameters,
+        only new properties are created and validated, other properties are shared
+
+        :param      key:     The property name (all properties with name are replaced) or property object
+        :type       key:     str or vCard_entry
+        :param      values:  The decoded values, None keeps old values
+        :type       values:  str or collection of str or None
+        :param      params:  The parameters, None keeps old parameters
+        :type       params:  dict or None
+
+        :raises     KeyError: property doesn't exist
+        """
+        positions = self._matches(key)
+        if not positions:
+            raise KeyError(key)
+        if isinstance(values, (str, bytes)):
+            values = (values,)
+        elif values is not None:
+            values = tuple(values)
+        if params is not None and type(params) is not _FrozenParams:
+            params = _FrozenParams(params)
+        attrs = list(self._attrs)
+        for i in positions:
+            entry = attrs[i]
+            attrs[i] = entry._replaced(entry.values if values is None else values,
+                                       entry._params if params is None else params)
+        return self._shared(tuple(attrs), self._version, self._indexer)
+
+
 def is_vcard(object) -> bool:
     """
     Determines whether the specified object is vCard object.
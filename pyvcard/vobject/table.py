@@ -0,0 +1,316 @@
+from array import array
+from typing import Callable, Collection, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pyvcard.enums import _STATE
+from pyvcard.exceptions import LibraryNotFoundError, vCardFormatError
+from pyvcard.utils import base64_encode
+from pyvcard.vobject.records import _iter_parsed
+
+import pyvcard.vobject.structures as structures
+import pyvcard.vobject.containers as containers
+
+try:
+    import numpy
+    _lib_imported = True
+except Exception:
+    _lib_imported = False
+
+
+def _check_lib():
+    if not _lib_imported:
+        raise LibraryNotFoundError("numpy")
+
+
+class vCardTable:
+    """
+    This class describes a columnar storage of vCards.
+    Properties are stored as arrays (card number, name code, group code, parameters code,
+    value offsets), values are stored in shared UTF-8 buffer.
+    vCard objects are created only on demand, so table takes much less memory than vCardSet.
+    Data of table isn't validated until vCard objects are created
+    """
+
+    def __init__(self):
+        self._names = []
+        self._name_codes = {}
+        self._groups = []
+        self._group_codes = {}
+        self._params = []
+        self._param_codes = {}
+        self._frozen_params = []
+        self._versions = []
+        self._version_codes = {}
+        # columns of properties
+        self._card = array("I")
+        self._name = array("I")
+        self._group = array("i")
+        self._param = array("I")
+        self._encoded = array("B")
+        self._first_value = array("I", [0])
+        # columns of values
+        self._offsets = array("Q", [0])
+        self._buffer = bytearray()
+        # columns of vCards
+        self._card_start = array("I", [0])
+        self._version = array("H")
+
+    @classmethod
+    def from_source(cls, source, encoding: str = "utf-8", properties: Collection[str] = None,
+                    exclude: Collection[str] = None) -> "vCardTable":
+        """
+        Creates table from vCard source without creating vCard objects
+
+        :param      source:      Source of vCards
+        :type       source:      File descriptor, str or bytes-like object
+        :param      encoding:    Charset of properties without CHARSET parameter (only for bytes sources)
+        :type       encoding:    str
+        :param      properties:  Names of properties to store, other properties are skipped
+        :type       properties:  collection of str or None
+        :param      exclude:     Names of properties to skip
+        :type       exclude:     collection of str or None
+
+        :raises     vCardFormatError: vCard isn't closed
+        """
+        table = cls()
+        opened = False
+        version = None
+        for parsed, encoded in _iter_parsed(source, encoding, properties, exclude):
+            if parsed == _STATE.BEGIN:
+                if opened:
+                    raise vCardFormatError("vCard didn't closed")
+                opened = True
+                version = None
+            elif parsed == _STATE.END:
+                if not opened:
+                    raise vCardFormatError("Double closing or missing begin")
+                opened = False
+                table._end_card(version)
+            elif parsed:
+                name, values, params, group = parsed
+                if name == "VERSION":
+                    version = "".join(values)
+                if group is not None and group.endswith("."):
+                    group = group[:-1]
+                table._add_property(name, values, params, group, encoded and "ENCODING" in params)
+        if opened:
+            raise vCardFormatError("vCard didn't closed")
+        return table
+
+    def _code(self, codes: dict, items: list, key) -> int:
+        """
+        Utility method. Don't recommend for use in outer code
+        Returns code of key in dictionary of column
+        """
+        code = codes.get(key)
+        if code is None:
+            code = codes[key] = len(items)
+            items.append(key)
+        return code
+
+    def _add_property(self, name: str, values: Iterable, params: dict,
+                      group: Optional[str], encoded: bool) -> None:
+        """
+        Utility method. Don't recommend for use in outer code
+        Appends property to columns of the last vCard
+        """
+        self._card.append(len(self._version))
+        self._name.append(self._code(self._name_codes, self._names, name))
+        if group is None:
+            self._group.append(-1)
+        else:
+            self._group.append(self._code(self._group_codes, self._groups, group))
+        self._param.append(self._code(self._param_codes, self._params, tuple(params.items())))
+        self._encoded.append(encoded)
+        buffer = self._buffer
+        offsets = self._offsets
+        for value in values:
+            buffer += value.encode("utf-8", "surrogatepass")
+            offsets.append(len(buffer))
+        self._first_value.append(len(offsets) - 1)
+
+    def _end_card(self, version: Optional[str]) -> None:
+        """
+        Utility method. Don't recommend for use in outer code
+        Closes the last vCard
+        """
+        self._version.append(self._code(self._version_codes, self._versions, version))
+        self._card_start.append(len(self._name))
+
+    def append(self, vcard: "vCard") -> None:
+        """
+        Appends vCard to table
+
+        :param      vcard:  The vCard
+        :type       vcard:  vCard
+        """
+        for entry in vcard:
+            if entry._pending_decode:
+                values, encoded = entry._values, True
+            elif any(isinstance(value, bytes) for value in entry._values):
+                # decoded binary values are stored in base64
+                values, encoded = [base64_encode(value) if isinstance(value, bytes) else value
+                                   for value in entry._values], True
+            else:
+                values, encoded = entry._values, False
+            self._add_property(entry._name, values, entry._params, entry._group, encoded)
+        self._end_card(vcard._version)
+
+    def extend(self, vcards: Iterable["vCard"]) -> None:
+        """
+        Appends vCards to table
+
+        :param      vcards:  The vCards
+        :type       vcards:  iterable of vCard
+        """
+        for vcard in vcards:
+            self.append(vcard)
+
+    def __len__(self):
+        return len(self._version)
+
+    def __bool__(self):
+        return True
+
+    @property
+    def property_count(self) -> int:
+        return len(self._name)
+
+    @property
+    def names(self) -> Tuple[str]:
+        """
+        Returns names of properties stored in table
+        """
+        return tuple(self._names)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns size of columns and value buffer in bytes
+        """
+        columns = [self._card, self._name, self._group, self._param, self._encoded,
+                   self._first_value, self._offsets, self._card_start, self._version]
+        return sum(column.itemsize * len(column) for column in columns) + len(self._buffer)
+
+    def _values(self, row: int) -> Tuple[str]:
+        """
+        Utility method. Don't recommend for use in outer code
+        Returns values of property in row
+        """
+        offsets = self._offsets
+        buffer = self._buffer
+        return tuple(
+            buffer[offsets[i]:offsets[i + 1]].decode("utf-8", "surrogatepass")
+            for i in range(self._first_value[row], self._first_value[row + 1])
+        )
+
+    def _entry(self, row: int, version: Optional[str]) -> "vCard_entry":
+        """
+        Utility method. Don't recommend for use in outer code
+        Creates property object of row, parameters objects are shared by properties
+        """
+        code = self._param[row]
+        if code >= len(self._frozen_params):
+            self._frozen_params.extend([None] * (len(self._params) - len(self._frozen_params)))
+        params = self._frozen_params[code]
+        if params is None:
+            params = self._frozen_params[code] = structures._FrozenParams(self._params[code])
+        group = self._group[row]
+        return structures.vCard_entry(
+            self._names[self._name[row]], self._values(row), params,
+            self._groups[group] if group != -1 else None,
+            version=version or "4.0", encoded=bool(self._encoded[row])
+        )
+
+    def __getitem__(self, index: int) -> "vCard":
+        """
+        Creates vCard object of table row
+
+        :param      index:  The index of vCard
+        :type       index:  int
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("vCard index out of range")
+        version = self._versions[self._version[index]]
+        entries = [self._entry(row, version)
+                   for row in range(self._card_start[index], self._card_start[index + 1])]
+        return structures.vCard(entries, version)
+
+    def __iter__(self) -> Iterator["vCard"]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def vcards(self, indexes: Iterable[int] = None) -> "vCardList":
+        """
+        Creates vCard objects
+
+        :param      indexes:  Indexes of vCards, all vCards if None
+        :type       indexes:  iterable of int or None
+
+        :returns:   list of vCards
+        :rtype:     vCardList
+        """
+        if indexes is None:
+            indexes = range(len(self))
+        return containers.vCardList([self[i] for i in indexes])
+
+    def _rows(self, name: str) -> List[int]:
+        """
+        Utility method. Don't recommend for use in outer code
+        Returns rows of properties with name
+        """
+        code = self._name_codes.get(name)
+        if code is None:
+            return []
+        if _lib_imported:
+            names = numpy.frombuffer(self._name, dtype=self._name.typecode)
+            return numpy.flatnonzero(names == code).tolist()
+        return [row for row, value in enumerate(self._name) if value == code]
+
+    def column(self, name: str) -> List[Tuple[int, Tuple[str]]]:
+        """
+        Returns values of properties with name without creating vCard objects.
+        Encoded values (for example base64) are returned as is
+
+        :param      name:  The property name
+        :type       name:  str
+
+        :returns:   list of tuples (vCard index, values)
+        :rtype:     list
+        """
+        return [(self._card[row], self._values(row)) for row in self._rows(name)]
+
+    def select(self, name: str, predicate: Callable[[Tuple[str]], bool] = None) -> List[int]:
+        """
+        Returns indexes of vCards having property with name.
+        Properties are found by name code column, values are read only for predicate
+
+        :param      name:       The property name
+        :type       name:       str
+        :param      predicate:  The function, that takes values of property
+        :type       predicate:  callable or None
+
+        :returns:   sorted indexes of vCards
+        :rtype:     list of int
+        """
+        rows = self._rows(name)
+        if predicate is not None:
+            rows = [row for row in rows if predicate(self._values(row))]
+        cards = self._card
+        return sorted(set(cards[row] for row in rows))
+
+    def to_numpy(self) -> Dict[str, "numpy.ndarray"]:
+        """
+        Returns copies of columns as NumPy arrays:
+        card, name, group, param, encoded, first_value, offsets, card_start, version
+
+        :raises     LibraryNotFoundError: NumPy isn't installed
+        """
+        _check_lib()
+        columns = {
+            "card": self._card, "name": self._name, "group": self._group,
+            "param": self._param, "encoded": self._encoded, "first_value": self._first_value,
+            "offsets": self._offsets, "card_start": self._card_start, "version": self._version
+        }
+        return {key: numpy.frombuffer(column, dtype=column.typecode).copy() for key, column in columns.items()}
@@ -1,7 +1,8 @@
-from typing import Union, List, Dict, Optional
+from typing import Union, List, Dict, Iterator, Optional, Collection
 
 import pyvcard.vobject.structures as structures
 import pyvcard.vobject.containers as containers
+from pyvcard.vobject.parsing import _projection
 
 import pyvcard.sources.jcard
 import pyvcard.sources.xcard
@@ -14,22 +15,37 @@ class vCard_Converter:
     This class describes a vCard converter to various sources.
     """
 
-    def __init__(self, source: Union["vCardSet", "vCard"]):
+    def __init__(self, source: Union["vCardSet", "vCardList", "vCard"],
+                 cache: "vCardOutputCache" = None):
         """
         Constructs a new instance.
 
         :param      source:  The source
-        :type       source:  vCard or vCardSet
+        :type       source:  vCard, vCardSet or vCardList
+        :param      cache:   The cache of serialized vCards, it's passed to other converters too
+        :type       cache:   vCardOutputCache or None
         """
-        if isinstance(source, structures.vCard) or isinstance(source, containers.vCardSet):
+        if isinstance(source, (structures.vCard, containers._vCardContainerMixin)):
             self.source = source
-            self._value = source.repr_vcard()
         else:
             raise TypeError(f"Required vCard or vCardSet type, not {type(source)}")
+        self.cache = cache
+
+    def _fragments(self) -> Iterator[str]:
+        """
+        Utility method. Don't recommend for use in outer code
+        Yields string representations of vCards taken from output cache
+        """
+        if isinstance(self.source, structures.vCard):
+            vcards = [self.source]
+        else:
+            vcards = self.source
+        for vcard in vcards:
+            yield self.cache.get(vcard, "vcf", structures.vCard.repr_vcard)
 
     def file(self, filename: str, encoding: str = "utf-8") -> None:
         """
-        Creates a file using filename and encoding
+        Creates a file using filename and encoding, vCards are written one by one
 
         :param      filename:  The filename
         :type       filename:  str
@@ -37,19 +53,38 @@ class vCard_Converter:
         :type       encoding:  string
         """
         with open(filename, "w", encoding=encoding) as f:
-            f.write(self._value)
+            if isinstance(self.source, structures.vCard):
+                # single vCard is written without trailing line ending like repr_vcard()
+                f.write(self.string())
+            elif self.cache is not None:
+                for fragment in self._fragments():
+                    f.write(fragment)
+                    f.write("\n")
+            else:
+                self.source.write_to(f, newline="\n")
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Yields lines of vCard string representation (without line endings)
+        """
+        return self.source.iter_lines()
 
     def string(self):
         """
         Returns a vCard string representation
         """
-        return self._value
+        if self.cache is not None:
+            fragments = self._fragments()
+            if isinstance(self.source, structures.vCard):
+                return next(fragments)
+            return "".join(fragment + "\n" for fragment in fragments)
+        return self.source.repr_vcard()
 
     def bytes(self):
         """
         Returns a vCard string representation in bytes
         """
-        return bytes(self._value)
+        return self.string().encode("utf-8")
 
     def html(self) -> pyvcard.sources.hcard.hCard_Converter:
         """
@@ -61,19 +96,19 @@ class vCard_Converter:
         """
         Return a vCard converter object to CSV
         """
-        return pyvcard.sources.csv_source.csv_Converter(self.source)
+        return pyvcard.sources.csv_source.csv_Converter(self.source, self.cache)
 
     def json(self) -> pyvcard.sources.jcard.jCard_Converter:
         """
         Return a vCard converter object to JSON (jCard)
         """
-        return pyvcard.sources.jcard.jCard_Converter(self.source)
+        return pyvcard.sources.jcard.jCard_Converter(self.source, self.cache)
 
     def xml(self) -> pyvcard.sources.xcard.xCard_Converter:
         """
         Return a vCard converter object to XML (xCard)
         """
-        return pyvcard.sources.xcard.xCard_Converter(self.source)
+        return pyvcard.sources.xcard.xCard_Converter(self.source, self.cache)
 
 
 class _vCard_Builder:
@@ -81,8 +116,10 @@ class _vCard_Builder:
     Front-end to create vCard objects step by step.
     """
 
-    def __init__(self, version: str = "4.0", indexer: "vCardIndexer" = None):
+    def __init__(self, version: str = "4.0", indexer: "vCardIndexer" = None,
+                 properties: Collection[str] = None, exclude: Collection[str] = None):
         self.indexer = indexer
+        self.projection = _projection(properties, exclude)
         self._properties = []
         self._version = version
         self.set_version(version)
@@ -105,6 +142,8 @@ class _vCard_Builder:
         :param      encoding_raw:  If property is encoded
         :type       encoding_raw:  boolean
         """
+        if self.projection is not None and name not in self.projection:
+            return
         if isinstance(value, str):
             value = [value]
         elif isinstance(value, bytes):
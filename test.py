@@ -1,5 +1,8 @@
+import asyncio
+import datetime
 import unittest
 import pyvcard
+from pyvcard.vobject.parsing import _parse_line, _parse_line_regex
 from traceback import print_exc
 import os
 from fuzzywuzzy import fuzz
@@ -41,6 +44,582 @@ class vcardtest(unittest.TestCase):
                 pass
         self.assertEqual(c, 0)
 
+    def test_streaming(self):
+        for i in os.listdir(vcard_dir):
+            if i.endswith(".vcf"):
+                pth = os.path.join(vcard_dir, i)
+                expected = pyvcard.openfile(pth, encoding="utf-8").vcard_list()
+                streamed = list(pyvcard.openfile(pth, encoding="utf-8", stream=True).iter_vcards())
+                self.assertEqual(len(expected), len(streamed))
+                for vcard1, vcard2 in zip(expected, streamed):
+                    self.assertEqual(vcard1.repr_vcard(), vcard2.repr_vcard())
+
+    def test_bytes_parsing(self):
+        for i in os.listdir(vcard_dir):
+            if i.endswith(".vcf"):
+                pth = os.path.join(vcard_dir, i)
+                expected = pyvcard.openfile(pth, encoding="utf-8").vcard_list()
+                parsed = pyvcard.openfile(pth, "rb", encoding="utf-8").vcard_list()
+                self.assertEqual([v.repr_vcard() for v in expected], [v.repr_vcard() for v in parsed])
+        data = "BEGIN:VCARD\nVERSION:2.1\nN;CHARSET=WINDOWS-1251:Иванов;Иван;;;\nEND:VCARD".encode("cp1251")
+        vcard = list(pyvcard.parse(data).vcards())[0]
+        self.assertEqual(vcard["N"].values[0], "Иванов")
+
+    def test_parallel(self):
+        for i in os.listdir(vcard_dir):
+            if i.endswith(".vcf"):
+                pth = os.path.join(vcard_dir, i)
+                expected = pyvcard.openfile(pth, encoding="utf-8").vcard_list()
+                indexer = pyvcard.vCardIndexer()
+                parsed = pyvcard.parse_parallel(pth, workers=2, indexer=indexer)
+                self.assertEqual([v.repr_vcard() for v in expected], [v.repr_vcard() for v in parsed])
+                self.assertTrue(all(v.indexer is indexer for v in parsed))
+                splits = pyvcard.vcf_splits(pth, 4)
+                self.assertEqual(splits[0][0], 0)
+                self.assertEqual(splits[-1][1], os.path.getsize(pth))
+
+    def test_lazy(self):
+        import gc
+        for i in os.listdir(vcard_dir):
+            if i.endswith(".vcf"):
+                pth = os.path.join(vcard_dir, i)
+                expected = pyvcard.openfile(pth, encoding="utf-8").vcard_list()
+                with pyvcard.openfile(pth, encoding="utf-8", lazy=True) as lazy:
+                    lazy.cache_size = 2
+                    self.assertEqual(len(expected), len(lazy))
+                    self.assertEqual([v.repr_vcard() for v in expected], [v.repr_vcard() for v in lazy])
+                    self.assertLessEqual(len(lazy._cache), 2)
+                    self.assertIs(lazy[-1], lazy[len(lazy) - 1])
+                    self.assertEqual(expected[-1].repr_vcard(), lazy[-1].repr_vcard())
+                indexer = pyvcard.vCardIndexer()
+                with pyvcard.openfile(pth, encoding="utf-8", lazy=True, indexer=indexer) as lazy:
+                    lazy.cache_size = 1
+                    first = lazy[0]
+                    list(lazy)
+                    self.assertIs(lazy[0], first)
+                    self.assertIs(lazy[0].indexer, indexer)
+                    # lazy list refers to indexed vCards weakly, indexer keeps them alive
+                    indexer.unindex(first)
+                    del first
+                    lazy._cache.clear()
+                    gc.collect()
+                    self.assertNotIn(0, lazy._indexed_cards)
+                    self.assertIsNone(lazy[0].indexer)
+
+    def test_deferred_decoding(self):
+        photo = "BEGIN:VCARD\nVERSION:3.0\nFN:Test\nPHOTO;ENCODING=b;TYPE=JPEG:dGVzdCBwaG90bw==\nEND:VCARD"
+        for source in [photo, photo.encode("utf-8")]:
+            vcard = list(pyvcard.parse(source).vcards())[0]
+            entry = vcard["PHOTO"]
+            self.assertTrue(entry._pending_decode)
+            self.assertIn("PHOTO;ENCODING=B;TYPE=JPEG:dGVzdCBwaG90bw==", vcard.repr_vcard())
+            self.assertTrue(entry._pending_decode)
+            self.assertEqual(entry.value, b"test photo")
+            self.assertFalse(entry._pending_decode)
+            self.assertIs(entry.value, entry.values[0])
+            self.assertIn("PHOTO;ENCODING=B;TYPE=JPEG:dGVzdCBwaG90bw==", vcard.repr_vcard())
+            index = pyvcard.vCardIndexer(index_params=True)
+            vcard = list(pyvcard.parse(source, indexer=index).vcards())[0]
+            self.assertTrue(vcard["PHOTO"]._pending_decode)
+            self.assertEqual(index.find_by_property("PHOTO", "dGVzdCBwaG90bw=="), [vcard])
+            self.assertEqual(vcard["PHOTO"].value, b"test photo")
+            vcard["PHOTO"].set_values(b"other photo")
+            self.assertEqual(index.find_by_property("PHOTO", "dGVzdCBwaG90bw=="), [])
+
+    def test_projection(self):
+        for i in os.listdir(vcard_dir):
+            if i.endswith(".vcf"):
+                pth = os.path.join(vcard_dir, i)
+                full = pyvcard.openfile(pth, encoding="utf-8").vcard_list()
+                for mode in ["r", "rb"]:
+                    parsed = pyvcard.openfile(pth, mode, encoding="utf-8", properties={"fn", "TEL"}).vcard_list()
+                    for vcard1, vcard2 in zip(full, parsed):
+                        self.assertEqual([e for e in vcard1 if e.name in ["VERSION", "FN", "TEL"]], list(vcard2))
+                    parsed = pyvcard.openfile(pth, mode, encoding="utf-8", exclude=["PHOTO"]).vcard_list()
+                    for vcard1, vcard2 in zip(full, parsed):
+                        self.assertEqual([e for e in vcard1 if e.name != "PHOTO"], list(vcard2))
+        txt = pyvcard.convert(bundle).json().result()
+        for vcard in pyvcard.parse_from(txt, "json", properties=["FN"]).vcards():
+            self.assertTrue(all(e.name in ["VERSION", "FN"] for e in vcard))
+
+    def test_records(self):
+        for i in os.listdir(vcard_dir):
+            if i.endswith(".vcf"):
+                pth = os.path.join(vcard_dir, i)
+                expected = []
+                for n, vcard in enumerate(pyvcard.openfile(pth, encoding="utf-8").vcard_list()):
+                    expected.append((n, None, "BEGIN"))
+                    expected += [(n, entry.group, entry.name) for entry in vcard]
+                    expected.append((n, None, "END"))
+                for mode in ["r", "rb"]:
+                    with open(pth, mode) as f:
+                        records = list(pyvcard.iter_records(f))
+                    self.assertEqual(expected, [(r.card_no, r.group, r.name) for r in records])
+        records = list(pyvcard.iter_records("BEGIN:VCARD\nVERSION:3.0\nitem1.TEL;TYPE=cell:1\nEND:VCARD", properties=["TEL"]))
+        self.assertEqual(records[2], pyvcard.vCardRecord(0, "item1", "TEL", {"TYPE": "cell"}, ["1"]))
+        source = "BEGIN:VCARD\nVERSION:2.1\nN;CHARSET=UTF-8;ENCODING=QUOTED-PRINTABLE:=D0=98=D0=B2=D0=B0=D0=BD;;;;\nEND:VCARD"
+        text_record = list(pyvcard.iter_records(source))[2]
+        byte_record = list(pyvcard.iter_records(source.encode("utf-8")))[2]
+        self.assertTrue(text_record.encoded)
+        self.assertEqual(text_record.values[0], "=D0=98=D0=B2=D0=B0=D0=BD")
+        self.assertFalse(byte_record.encoded)
+        self.assertEqual(byte_record.values[0], "Иван")
+
+    def test_aparse(self):
+        async def chunks(data, size):
+            for i in range(0, len(data), size):
+                yield data[i:i + size]
+
+        async def collect(source):
+            return [vcard async for vcard in pyvcard.aparse(source)]
+
+        async def from_reader(data):
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            reader.feed_eof()
+            return await collect(reader)
+
+        for i in os.listdir(vcard_dir):
+            if i.endswith(".vcf"):
+                pth = os.path.join(vcard_dir, i)
+                expected = [v.repr_vcard() for v in pyvcard.openfile(pth, "rb").vcard_list()]
+                with open(pth, "rb") as f:
+                    data = f.read()
+                self.assertEqual(expected, [v.repr_vcard() for v in asyncio.run(from_reader(data))])
+                for size in [1, 7, 100]:
+                    self.assertEqual(expected, [v.repr_vcard() for v in asyncio.run(collect(chunks(data, size)))])
+
+    def test_on_error(self):
+        good = "BEGIN:VCARD\nVERSION:3.0\nFN:Good {}\nEND:VCARD\n"
+        data = good.format(0) + "BEGIN:VCARD\nVERSION:3.0\nFN:Bad\nTEL;=x:1\nEND:VCARD\n" + good.format(2) + \
+            "BEGIN:VCARD\nVERSION:3.0\n" + good.format(4) + "BEGIN:VCARD\nFN:No version\nEND:VCARD\n"
+        with self.assertRaises(pyvcard.vCardFormatError):
+            pyvcard.parse(data).vcards()
+        for source in [data, data.encode("utf-8")]:
+            parser = pyvcard.parse(source, on_error="collect")
+            self.assertEqual([vcard.contact_name() for vcard in parser.vcard_list()], ["Good 0", "Good 2", "Good 4"])
+            errors = parser.errors()
+            self.assertEqual([(e.line, e.card_index) for e in errors], [(8, 1), (16, 3), (22, 5)])
+            if isinstance(source, bytes):
+                self.assertEqual(source[errors[0].offset:].split(b"\n")[0], b"TEL;=x:1")
+            parser = pyvcard.parse(source, on_error="skip", stream=True)
+            self.assertEqual(len(list(parser.iter_vcards())), 3)
+            self.assertEqual(parser.errors(), [])
+
+    def test_checkpoint(self):
+        for i in os.listdir(vcard_dir):
+            if i.endswith(".vcf"):
+                pth = os.path.join(vcard_dir, i)
+                expected = [v.repr_vcard() for v in pyvcard.openfile(pth, "rb").vcard_list()]
+                calls = []
+                parser = pyvcard.openfile(pth, "rb", stream=True, progress=lambda *args: calls.append(args))
+                vcards = parser.iter_vcards()
+                first = next(vcards).repr_vcard()
+                checkpoint = parser.checkpoint()
+                self.assertEqual(calls, [(checkpoint, 1)])
+                vcards.close()
+                resumed = pyvcard.openfile(pth, "rb", stream=True, start_offset=checkpoint)
+                self.assertEqual(expected, [first] + [v.repr_vcard() for v in resumed.iter_vcards()])
+                self.assertEqual(resumed.checkpoint(), os.path.getsize(pth))
+        with self.assertRaises(IOError):
+            pyvcard.parse("BEGIN:VCARD\nVERSION:4.0\nEND:VCARD", start_offset=10)
+
+    def test_validation_rules(self):
+        from pyvcard.validator import ValidationRule, register_rule, unregister_rule, get_rule, validate_uri
+
+        def check(property, version):
+            validate_uri(property.values[0], property)
+
+        card = "BEGIN:VCARD\nVERSION:4.0\nFN:Test\nX-PROFILE-URL;TYPE=work:{}\nEND:VCARD"
+        pyvcard.parse(card.format("not uri")).vcards()
+        register_rule("x-profile-url", ValidationRule(count=(1, 1), types={"work", "home"}, checks=[check]), ["4.0"])
+        try:
+            self.assertIsNotNone(get_rule("X-PROFILE-URL", "4.0"))
+            self.assertIsNone(get_rule("X-PROFILE-URL", "3.0"))
+            pyvcard.parse(card.format("https://example.com")).vcards()
+            with self.assertRaises(pyvcard.vCardValidationError):
+                pyvcard.parse(card.format("not uri")).vcards()
+            with self.assertRaises(pyvcard.vCardValidationError):
+                pyvcard.parse(card.format("https://example.com").replace("work", "cell")).vcards()
+        finally:
+            unregister_rule("x-profile-url")
+        pyvcard.parse(card.format("not uri")).vcards()
+
+    def test_typedvalue_cache(self):
+        card = "BEGIN:VCARD\nVERSION:4.0\nFN:Test\nREV:20200102T030405+0300\n" \
+               "TZ;VALUE=utc-offset:-0530\nBDAY:19900102\nEND:VCARD"
+        vcard = list(pyvcard.parse(card).vcards())[0]
+        rev = vcard["REV"]
+        tz = vcard["TZ"]
+        bday = vcard["BDAY"]
+        # values parsed during validation are kept
+        self.assertIsInstance(rev._typedvalue, pyvcard.datatypes.DateTime)
+        self.assertIsInstance(tz._typedvalue, pyvcard.datatypes.UTCOffset)
+        self.assertIs(rev.typedvalue, rev.typedvalue)
+        self.assertEqual(rev.typedvalue.array, [2020, 1, 2, 3, 4, 5])
+        self.assertEqual(rev.typedvalue.utc_offset, "+0300")
+        self.assertEqual((tz.typedvalue.sign, tz.typedvalue.hour, tz.typedvalue.minutes), (-1, 5, 30))
+        self.assertEqual(bday.typedvalue.datetime.date(), datetime.date(1990, 1, 2))
+        self.assertIs(bday.typedvalue, bday.typedvalue)
+        self.assertEqual(pyvcard.converters.determine_type(bday), "date-and-or-time")
+
+    def test_slots(self):
+        for vcard in bundle:
+            self.assertFalse(hasattr(vcard, "__dict__"))
+            self.assertIsInstance(vcard.properties, tuple)
+            for entry in vcard:
+                self.assertFalse(hasattr(entry, "__dict__"))
+                self.assertIsInstance(entry._values, tuple)
+
+    def test_intern_pool(self):
+        card = "BEGIN:VCARD\nVERSION:3.0\nFN:{0}\nitem1.TEL;TYPE=cell:{0}\nitem1.X-ABLABEL:Phone\nEND:VCARD"
+        source = "\n".join(card.format(i) for i in range(3))
+        for data in [source, source.encode("utf-8")]:
+            vcards = pyvcard.parse(data).vcard_list()
+            phones = [vcard["TEL"] for vcard in vcards]
+            self.assertIs(phones[0]._params, phones[2]._params)
+            self.assertIs(phones[0].name, phones[1].name)
+            self.assertIs(phones[0].group, vcards[2]["X-ABLABEL"].group)
+            self.assertEqual(phones[0].group, "item1")
+            self.assertEqual(phones[0].params, {"TYPE": "cell"})
+            with self.assertRaises(TypeError):
+                phones[0]._params["TYPE"] = "home"
+            self.assertEqual(phones[1]._params, {"TYPE": "cell"})
+        pool = pyvcard.vobject.parsing._InternPool(limit=2)
+        for i in range(10):
+            pool.params({"SORT-AS": str(i)})
+        self.assertEqual(len(pool._params), 2)
+        self.assertLessEqual(len(pool._strings), 2)
+        self.assertEqual(pool.params({"SORT-AS": "9"}), {"SORT-AS": "9"})
+
+    def test_entry_views(self):
+        card = "BEGIN:VCARD\nVERSION:4.0\nFN:Test\nTEL;TYPE=cell:+1 555 0100\nREV:20200102T030405Z\nEND:VCARD"
+        vcard = list(pyvcard.parse(card).vcards())[0]
+        tel = vcard["TEL"]
+        self.assertIs(tel.params, tel.params)
+        self.assertIs(tel.values, tel.values)
+        with self.assertRaises(TypeError):
+            tel.params["TYPE"] = "home"
+        tel.set_values("+1 555 0199")
+        tel.set_param("PREF", "1")
+        self.assertEqual(tel.values, ("+1 555 0199",))
+        self.assertEqual(tel.params, {"TYPE": "cell", "PREF": "1"})
+        self.assertEqual(tel.repr_vcard(), "TEL;TYPE=CELL;PREF=1:+1 555 0199")
+        tel.remove_param("PREF")
+        self.assertEqual(tel.params, {"TYPE": "cell"})
+        rev = vcard["REV"]
+        self.assertEqual(rev.typedvalue.year, 2020)
+        rev.set_values(["20210102T030405Z"])
+        self.assertEqual(rev.typedvalue.year, 2021)
+        with self.assertRaises(pyvcard.vCardValidationError):
+            rev.set_values("not a timestamp")
+        self.assertEqual(rev.value, "20210102T030405Z")
+
+    def test_fingerprint(self):
+        card = "BEGIN:VCARD\nVERSION:3.0\nFN:Test\nPHOTO;ENCODING=b;TYPE=JPEG:dGVzdCBwaG90bw==\nEND:VCARD"
+        vcard1 = list(pyvcard.parse(card).vcards())[0]
+        vcard2 = list(pyvcard.parse(card.encode("utf-8")).vcards())[0]
+        self.assertIsInstance(vcard1.fingerprint, bytes)
+        self.assertEqual(vcard1.fingerprint, vcard2.fingerprint)
+        # decoding doesn't change fingerprint
+        self.assertEqual(vcard2["PHOTO"].value, b"test photo")
+        self.assertEqual(vcard1["PHOTO"]._canonical(), vcard2["PHOTO"]._canonical())
+        self.assertEqual(len(pyvcard.vCardSet([vcard1, vcard2])), 1)
+        fn = vcard1["FN"]
+        fingerprint = fn.fingerprint
+        card_fingerprint = vcard1.fingerprint
+        fn.set_values("Other")
+        self.assertNotEqual(fn.fingerprint, fingerprint)
+        self.assertNotEqual(vcard1.fingerprint, card_fingerprint)
+        self.assertNotEqual(vcard1, vcard2)
+        cache = pyvcard.vCardOutputCache()
+        pyvcard.convert(vcard2, cache).string()
+        vcard2["FN"].set_param("TYPE", "work")
+        self.assertIn("FN;TYPE=WORK:Test", pyvcard.convert(vcard2, cache).string())
+        self.assertNotEqual(fn, vcard2["FN"])
+        other = list(pyvcard.parse(card.replace("FN:Test", "FN:Other")).vcards())[0]
+        self.assertNotEqual(other.fingerprint, vcard2.fingerprint)
+        self.assertEqual(len(pyvcard.vCardSet(list(bundle) + list(bundle))), len(bundle))
+        # vCard made of properties of other vCard copies them, so changes of one vCard don't affect other
+        original = list(pyvcard.parse(card).vcards())[0]
+        shared = pyvcard.vobject.vCard(original.properties, "3.0")
+        self.assertEqual(shared, original)
+        self.assertIsNot(shared["FN"], original["FN"])
+        cards = pyvcard.vCardSet([original])
+        original["FN"].set_values("Other")
+        self.assertNotEqual(original.fingerprint, shared.fingerprint)
+        self.assertNotEqual(hash(original), hash(shared))
+        self.assertNotIn(shared, [original])
+        shared["FN"].set_values("Other")
+        self.assertEqual(original, shared)
+        self.assertEqual(len(cards), 1)
+
+    def test_name_index(self):
+        card = "BEGIN:VCARD\nVERSION:4.0\nN:Doe;John;;;\nFN:John Doe\nTEL:+1 555 0100\n" \
+               "EMAIL:john@example.com\nTEL:+1 555 0101\nEND:VCARD"
+        vcard = list(pyvcard.parse(card).vcards())[0]
+        self.assertIsNone(vcard._names)
+        self.assertEqual([e.value for e in vcard.get("TEL")], ["+1 555 0100", "+1 555 0101"])
+        self.assertEqual(vcard._positions("TEL"), [3, 5])
+        self.assertIs(vcard["EMAIL"], vcard[4])
+        self.assertEqual(vcard.get("X-NONE"), ())
+        self.assertIn("EMAIL", vcard)
+        self.assertNotIn("PHOTO", vcard)
+        data = vcard.contact_data()
+        self.assertEqual(data["name"], "John Doe")
+        self.assertEqual(data["number"], [15550100, 15550101])
+        self.assertEqual(data["struct_name"]["surname"], "Doe")
+        data["number"].append(0)
+        self.assertEqual(vcard.contact_data()["number"], [15550100, 15550101])
+        self.assertEqual(vcard.contact_name(), "John Doe")
+        vcard["FN"].set_values("Jane Doe")
+        self.assertEqual(vcard.contact_data()["name"], "Jane Doe")
+        vcard.get("TEL")[0].set_values("+1 555 0102")
+        self.assertEqual(vcard.contact_data()["number"], [15550102, 15550101])
+        vcard._set_version("4.0")
+        self.assertIsNone(vcard._names)
+        self.assertIsNone(vcard._contact)
+        factory = pyvcard.builder()
+        factory.set_name("Ivan Ivanov")
+        first, second = factory.build(), factory.build()
+        self.assertEqual(second.contact_data()["name"], "Ivan Ivanov")
+        first["FN"].set_values("Other")
+        self.assertEqual(first.contact_data()["name"], "Other")
+        self.assertEqual(second.contact_data()["name"], "Ivan Ivanov")
+        second["FN"].set_values("Ivan Petrov")
+        self.assertEqual(first.contact_name(), "Other")
+        self.assertEqual(second.contact_name(), "Ivan Petrov")
+
+    def test_memory_budget(self):
+        import tracemalloc
+        from benchmark import MEMORY_BUDGET, generate_corpus
+        for version, budget in MEMORY_BUDGET.items():
+            corpus = generate_corpus(version, 500)
+            tracemalloc.start()
+            try:
+                vcards = pyvcard.parse(corpus).vcard_list()
+                size = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            self.assertEqual(len(vcards), 500)
+            self.assertLess(size / len(vcards), budget, f"vCard {version} takes more memory than budget")
+
+    def test_write_to(self):
+        import io
+        import tempfile
+        cards = pyvcard.vobject.vCardList(bundle)
+        expected = cards.repr_vcard()
+        self.assertEqual(list(cards.iter_lines()), expected.splitlines())
+        buf = io.BytesIO()
+        cards.write_to(buf)
+        self.assertEqual(buf.getvalue(), expected.replace("\n", "\r\n").encode("utf-8"))
+        text = io.StringIO()
+        cards[0].write_to(text, newline="\n")
+        self.assertEqual(text.getvalue(), cards[0].repr_vcard() + "\n")
+        with tempfile.TemporaryDirectory() as tmp:
+            pth = os.path.join(tmp, "out.vcf")
+            pyvcard.convert(cards).file(pth)
+            with open(pth, encoding="utf-8") as f:
+                self.assertEqual(f.read(), expected)
+            self.assertEqual(len(pyvcard.openfile(pth).vcard_list()), len(cards))
+            pyvcard.convert(cards[0]).file(pth)
+            with open(pth, encoding="utf-8") as f:
+                self.assertEqual(f.read(), cards[0].repr_vcard())
+
+    def test_keep_raw(self):
+        source = "BEGIN:VCARD\nVERSION:2.1\nN;CHARSET=UTF-8;ENCODING=QUOTED-PRINTABLE:=D0=98=D0=B2=D0=B0=D0=BD;;;;\n" \
+                 "tel;cell;pref:+7-937-123-4567\nNOTE:Long note that is\n  folded by writer\nEND:VCARD"
+        for data in [source, source.encode("utf-8")]:
+            vcard = list(pyvcard.parse(data, keep_raw=True).vcards())[0]
+            self.assertEqual(vcard.repr_vcard(), source)
+            vcard["NOTE"].set_values("Short note")
+            self.assertEqual(vcard.repr_vcard(), source.replace("Long note that is\n  folded by writer", "Short note"))
+        vcard = list(pyvcard.parse(source).vcards())[0]
+        self.assertNotEqual(vcard.repr_vcard(), source)
+        for i in os.listdir(vcard_dir):
+            if i.endswith(".vcf"):
+                pth = os.path.join(vcard_dir, i)
+                with open(pth, encoding="utf-8") as f:
+                    lines = [line.rstrip("\r\n") for line in f if line.strip()]
+                self.assertEqual(list(pyvcard.openfile(pth, "rb", keep_raw=True).vcard_list().iter_lines()), lines)
+
+    def test_output_cache(self):
+        cards = pyvcard.vCardSet(list(bundle)[:3])
+        cache = pyvcard.vCardOutputCache()
+        for func in [lambda c: c.string(), lambda c: c.json().result(),
+                     lambda c: c.csv().result(), lambda c: c.csv().permanent_result()]:
+            expected = func(pyvcard.convert(cards))
+            self.assertEqual(func(pyvcard.convert(cards, cache)), expected)
+            self.assertEqual(func(pyvcard.convert(cards, cache)), expected)
+        stats = cache.stats()
+        self.assertEqual(stats["misses"], 4 * len(cards))
+        self.assertEqual(stats["hits"], 4 * len(cards))
+        card = list(cards)[0]
+        self.assertEqual(pyvcard.convert(card, cache).string(), card.repr_vcard())
+        small = pyvcard.vCardOutputCache(max_bytes=cache.size // 2)
+        pyvcard.convert(cards, small).json().result()
+        pyvcard.convert(cards, small).string()
+        self.assertLessEqual(small.size, small.max_bytes)
+        self.assertGreater(small.evictions, 0)
+
+    def test_container_converting(self):
+        cards = pyvcard.vobject.vCardList(list(bundle)[:3])
+        for cache in [None, pyvcard.vCardOutputCache()]:
+            conv = pyvcard.convert(cards, cache)
+            self.assertEqual(conv.string(), cards.repr_vcard())
+            self.assertEqual(len(pyvcard.parse_from(conv.csv().result(), "csv").vcards()), len(cards))
+            self.assertEqual(len(conv.csv().permanent_result().splitlines()), len(cards) + 1)
+            self.assertEqual(len(pyvcard.parse_from(conv.json().result(), "json").vcards()), len(cards))
+            self.assertEqual(len(pyvcard.parse_from(conv.xml().result(), "xml").vcards()), len(cards))
+            self.assertEqual(len(pyvcard.parse_from(conv.html().strresult(), "html").vcards()), len(cards))
+
+    def test_frozen_vcard(self):
+        source = "BEGIN:VCARD\nVERSION:3.0\nFN:Ivan\nN:;Ivan;;;\nTEL;TYPE=cell:123\nTEL;TYPE=home:456\nEND:VCARD"
+        vcard = list(pyvcard.parse(source).vcards())[0]
+        frozen = vcard.freeze()
+        self.assertEqual(frozen, vcard)
+        self.assertIs(frozen.freeze(), frozen)
+        added = frozen.with_property("EMAIL", "ivan@example.com", {"TYPE": "work"})
+        self.assertEqual(len(added), len(frozen) + 1)
+        self.assertTrue(all(a is b for a, b in zip(frozen, added)))
+        self.assertEqual(added["EMAIL"].value, "ivan@example.com")
+        removed = added.without("TEL")
+        self.assertEqual(removed.contact_number(), [])
+        self.assertEqual(added.contact_number(), [123, 456])
+        self.assertIs(removed.without("TEL"), removed)
+        replaced = added.replace("FN", "Ivan Petrov")
+        self.assertEqual(replaced.contact_name(), "Ivan Petrov")
+        self.assertEqual(added.contact_name(), "Ivan")
+        self.assertIs(replaced["N"], added["N"])
+        self.assertRaises(TypeError, replaced["FN"].set_values, "Other")
+        self.assertRaises(KeyError, frozen.replace, "EMAIL", "ivan@example.com")
+        mutable = replaced.thaw()
+        mutable["FN"].set_values("Other")
+        self.assertEqual(replaced.contact_name(), "Ivan Petrov")
+        self.assertEqual(vcard["FN"].value, "Ivan")
+
+    def test_table(self):
+        source = "BEGIN:VCARD\nVERSION:2.1\nN;CHARSET=UTF-8;ENCODING=QUOTED-PRINTABLE:=D0=98=D0=B2=D0=B0=D0=BD;;;;\n" \
+                 "item1.TEL;CELL:123\nEND:VCARD\nBEGIN:VCARD\nVERSION:4.0\nFN:Ivan\nEMAIL:ivan@example.com\nEND:VCARD"
+        expected = pyvcard.parse(source).vcard_list()
+        for data in [source, source.encode("utf-8")]:
+            table = pyvcard.vCardTable.from_source(data)
+            self.assertEqual(len(table), 2)
+            self.assertEqual(table.property_count, 6)
+            self.assertEqual([vcard.repr_vcard() for vcard in table], [vcard.repr_vcard() for vcard in expected])
+            self.assertEqual(table[0]["N"].value, "Иван")
+            self.assertEqual(table[0]["TEL"].group, "item1")
+            self.assertEqual(table.select("EMAIL"), [1])
+            self.assertEqual(table.select("VERSION", lambda values: values[0] == "2.1"), [0])
+            self.assertEqual(table.select("NOTE"), [])
+            self.assertEqual(table.column("FN"), [(1, ("Ivan",))])
+            self.assertEqual(len(table.vcards([1])), 1)
+        table = pyvcard.vCardTable.from_source("BEGIN:VCARD\nVERSION:5.0\nFN:Ivan\nEND:VCARD")
+        self.assertEqual(table.column("VERSION"), [(0, ("5.0",))])
+        self.assertEqual(table[0]._version, "5.0")
+        table = pyvcard.vCardTable()
+        table.extend(bundle)
+        self.assertEqual(list(table), list(bundle))
+
+    def test_mutation_journal(self):
+        source = "BEGIN:VCARD\nVERSION:3.0\nFN:Ivan\nN:;Ivan;;;\nTEL;TYPE=cell:123\nTEL;TYPE=home:456\nEND:VCARD"
+        index = pyvcard.vCardIndexer()
+        vcard = list(pyvcard.parse(source, indexer=index).vcards())[0]
+        vcard["FN"].set_values("Ivan")
+        self.assertIsNone(vcard._journal)
+        changes = []
+        vcard.subscribe(lambda card, change: changes.append(change))
+        vcard.enable_journal()
+        tel = vcard.get("TEL")[0]
+        vcard.set_values(tel, "789")
+        self.assertIs(vcard.get("TEL")[0], tel)
+        self.assertEqual(index.find_by_phone(789, fullmatch=True), (vcard,))
+        self.assertEqual(index.find_by_phone(123, fullmatch=True), ())
+        self.assertEqual(changes[0].old.value, "123")
+        email = vcard.add("EMAIL", "ivan@example.com")
+        self.assertIs(vcard["EMAIL"], email)
+        vcard.replace("FN", "Ivan Petrov")
+        self.assertEqual(vcard.contact_name(), "Ivan Petrov")
+        self.assertEqual(index.find_by_name("Ivan Petrov"), (vcard,))
+        self.assertEqual(index.find_by_name("Ivan"), ())
+        self.assertEqual(len(vcard.remove("TEL")), 2)
+        self.assertEqual(vcard.contact_number(), [])
+        self.assertRaises(KeyError, vcard.remove, "TEL")
+        self.assertEqual([change.action for change in vcard.journal],
+                         ["set_values", "add", "replace", "remove", "remove"])
+        self.assertEqual(list(vcard.journal), changes)
+        self.assertEqual(len(vcard.drain_journal()), 5)
+        self.assertEqual(vcard.journal, ())
+        vcard.enable_journal(maxlen=2)
+        for i in range(5):
+            vcard.set_values("FN", str(i))
+        self.assertEqual([change.old.value for change in vcard.journal], ["2", "3"])
+        self.assertEqual(len(changes), 10)
+        vcard.disable_journal()
+        vcard.set_values("FN", "Ivan")
+        self.assertEqual(vcard.journal, ())
+        self.assertRaises(TypeError, vcard.freeze().add, "NOTE", "text")
+        other = pyvcard.vobject.vCard([], "3.0")
+        fn = other.add(vcard["FN"])
+        self.assertIsNot(fn, vcard["FN"])
+        vcard["FN"].set_values("Ivan Ivanov")
+        self.assertEqual(vcard.contact_name(), "Ivan Ivanov")
+        self.assertEqual(other.contact_name(), "Ivan")
+        self.assertEqual(index.find_by_name("Ivan Ivanov"), (vcard,))
+        self.assertEqual(changes[-1].new.value, "Ivan Ivanov")
+        note = vcard.add("NOTE", "first")
+        again = vcard.add(note)
+        self.assertIsNot(again, note)
+        note.set_values("second")
+        self.assertEqual(again.value, "first")
+
+    def test_unindex(self):
+        source = "BEGIN:VCARD\nVERSION:3.0\nFN:Ivan\nTEL:123\nEND:VCARD\n" \
+                 "BEGIN:VCARD\nVERSION:3.0\nFN:Ivan\nTEL:456\nEND:VCARD"
+        index = pyvcard.vCardIndexer(index_params=True)
+        first, second = pyvcard.parse(source, indexer=index).vcard_list()
+        self.assertEqual(index.vcards, (first, second))
+        index.unindex(first)
+        self.assertIsNone(first.indexer)
+        self.assertEqual(index.vcards, (second,))
+        self.assertEqual(index.find_by_name("Ivan"), (second,))
+        self.assertEqual(index.find_by_phone(123, fullmatch=True), ())
+        self.assertEqual(index.compact(), 2)
+        self.assertNotIn(123, index.phones)
+        second["FN"].set_values("Ivan Petrov")
+        index.reindex(second)
+        self.assertEqual(index.find_by_name("Ivan Petrov"), (second,))
+        self.assertEqual(index.find_by_name("Ivan"), ())
+        self.assertEqual(index.compact(), 1)
+        self.assertEqual(sorted(index.names), ["Ivan Petrov"])
+        second.set_values("TEL", "789")
+        self.assertEqual(index.find_by_phone(789, fullmatch=True), (second,))
+        self.assertEqual(index.compact(), 2)
+
+    def test_tokenizer(self):
+        def parse(func, line, version):
+            try:
+                return func(line, version)
+            except pyvcard.vCardFormatError as e:
+                return str(e)
+
+        lines = [
+            "BEGIN:VCARD", "item1.END:VCARD", "begin:vcard", "BEGIN;X=1:VCARD",
+            "FN:John Doe", "item1.TEL;TYPE=cell,voice;PREF=1:+7 (937) 123-45-67",
+            "TEL;CELL;VOICE:123", "N:Doe;John;;;", "NOTE:a\\;b\\,c\\nd;e",
+            "X-CUSTOM;X-PARAM=\"a:b\":value: with colon", "TYPE;type=Home;TYPE=Work:x",
+            "TEL;X=:1", "TEL;X=a=b:1", "TELTYPE=cell:1", "a.b.TEL:1", ".TEL:1", "TEL;:1",
+            "TEL;=x:1", "TEL;A B=c:1", "TEL;A B:1", "FN:€", "FN:Jane\u200b", "FN",
+            "ADR;TYPE=home:;;Street 1\\, apt 2;City;;12345;Country", "   ", "",
+        ]
+        for i in os.listdir(vcard_dir):
+            if i.endswith(".vcf"):
+                with open(os.path.join(vcard_dir, i), encoding="utf-8") as f:
+                    lines += f.read().splitlines()
+        for line in lines:
+            for version in ["2.1", "3.0", "4.0"]:
+                self.assertEqual(parse(_parse_line, line, version), parse(_parse_line_regex, line, version), line)
+
     def test_building_vcf(self):
         factory = pyvcard.builder()
         factory.set_version("4.0")